@@ -0,0 +1,47 @@
+"""add query indexes
+
+Revision ID: 9d4e7b2a6c18
+Revises: 5c1f3a9e2b7d
+Create Date: 2026-10-17 09:41:07.582911
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4e7b2a6c18'
+down_revision = '5c1f3a9e2b7d'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_fuel_vehicle_id_mileage', 'fuel', ['vehicle_id', 'mileage']),
+    ('ix_service_vehicle_id_mileage', 'service', ['vehicle_id', 'mileage']),
+    ('ix_reminder_vehicle_id', 'reminder', ['vehicle_id']),
+    ('ix_comment_post_id', 'comment', ['post_id']),
+    ('ix_comment_event_id', 'comment', ['event_id']),
+    ('ix_event_confirmation_event_id_user_id', 'event_confirmation', ['event_id', 'user_id']),
+    (
+        'ix_verification_code_phone_verification_code_is_verified',
+        'verification_code',
+        ['phone', 'verification_code', 'is_verified'],
+    ),
+    ('ix_event_event_state_started_at_id', 'event', ['event_state', 'started_at', 'id']),
+    ('ix_post_created_at_id', 'post', ['created_at', 'id']),
+    ('ix_vehicle_owner_id', 'vehicle', ['owner_id']),
+    ('ix_profile_user_id', 'profile', ['user_id']),
+)
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""expire sms outbox messages in flight
+
+Revision ID: d4e9a2b7c615
+Revises: a7c3e5f1d924
+Create Date: 2026-10-17 23:12:48.204517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e9a2b7c615'
+down_revision = 'a7c3e5f1d924'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ALTER TYPE ... ADD VALUE and CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE smsoutboxstate ADD VALUE IF NOT EXISTS 'EXPIRED'")
+        op.create_index(
+            'ix_sms_outbox_state_sent_at',
+            'sms_outbox',
+            ['state', 'sent_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    # Postgres cannot drop a single enum value, so EXPIRED stays in the type.
+    op.execute("UPDATE sms_outbox SET state = 'SENT' WHERE state = 'EXPIRED'")
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_sms_outbox_state_sent_at',
+            table_name='sms_outbox',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,37 @@
+"""add verification code created_at index
+
+Revision ID: e7a91c5d3f20
+Revises: b3f8c2d17a4e
+Create Date: 2026-10-17 15:22:48.106734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a91c5d3f20'
+down_revision = 'b3f8c2d17a4e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_verification_code_created_at',
+            'verification_code',
+            ['created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_verification_code_created_at',
+            table_name='verification_code',
+            postgresql_concurrently=True,
+        )
@@ -29,11 +29,13 @@ from fastapi.security import APIKeyHeader
 from fastapi.exceptions import HTTPException as FastApiHTTPException
 
 from app.api.dependencies.database import get_repository
+from app.core.cache import TTLCache, get_tokens_cache, get_users_cache
 from app.core.config import get_app_settings
 from app.core.settings.app import AppSettings
 from app.database.errors import EntityDoesNotExists
 from app.database.repositories import UsersRepository
-from app.models.domain.user import UserInDB
+from app.models.domain.user import User, UserInDB
+from app.models.schemas.jwt import AuthMode, JWTUser
 from app.resources import strings
 from app.services import jwt
 
@@ -49,8 +51,8 @@ class RWAPIKeyHeader(APIKeyHeader):
             raise HTTPException(status_code=exception.status_code, detail=strings.AUTHENTICATION_REQUIRED)
 
 
-def get_current_user_authorizer() -> Callable:
-    return _get_current_user
+def get_current_user_authorizer(verify_in_database: bool = False) -> Callable:
+    return _get_current_user_from_database if verify_in_database else _get_current_user_by_auth_mode
 
 
 def get_current_user_id_authorizer() -> Callable:
@@ -78,25 +80,30 @@ def _get_authorization_header(
     return token
 
 
-async def _get_current_user_id(
+async def _get_current_jwt_user(
         token: str = Depends(_get_authorization_header),
+        tokens_cache: TTLCache[str, JWTUser] = Depends(get_tokens_cache),
         settings: AppSettings = Depends(get_app_settings),
-) -> int:
+) -> JWTUser:
     malformed_payload = HTTPException(
         status_code=status.HTTP_403_FORBIDDEN,
         detail=strings.MALFORMED_PAYLOAD
     )
 
     try:
-        user_id = jwt.get_user_id_from_token(token, settings.secret_key.get_secret_value())
+        jwt_user = jwt.get_jwt_user_from_token(token, settings.secret_key.get_secret_value(), tokens_cache)
     except ValueError as exception:
         logger.error(exception)
         raise malformed_payload from exception
 
-    return user_id
+    return jwt_user
 
 
-async def _get_current_user(
+async def _get_current_user_id(jwt_user: JWTUser = Depends(_get_current_jwt_user)) -> int:
+    return jwt_user.user_id
+
+
+async def _get_current_user_from_database(
         user_id: int = Depends(_get_current_user_id),
         users_repo: UsersRepository = Depends(get_repository(UsersRepository)),
 ) -> UserInDB:
@@ -112,3 +119,36 @@ async def _get_current_user(
         raise malformed_payload from exception
 
     return user
+
+
+async def _get_current_user(
+        user_id: int = Depends(_get_current_user_id),
+        users_repo: UsersRepository = Depends(get_repository(UsersRepository)),
+        users_cache: TTLCache[int, UserInDB] = Depends(get_users_cache),
+) -> UserInDB:
+    user = users_cache.get(user_id)
+    if user is not None:
+        return user
+
+    user = await _get_current_user_from_database(user_id, users_repo)
+    users_cache.set(user_id, user)
+
+    return user
+
+
+async def _get_current_user_by_auth_mode(
+        jwt_user: JWTUser = Depends(_get_current_jwt_user),
+        users_repo: UsersRepository = Depends(get_repository(UsersRepository)),
+        users_cache: TTLCache[int, UserInDB] = Depends(get_users_cache),
+        settings: AppSettings = Depends(get_app_settings),
+) -> User:
+    if settings.auth_mode == AuthMode.DATABASE:
+        return await _get_current_user(jwt_user.user_id, users_repo, users_cache)
+
+    return User(
+        id=jwt_user.user_id,
+        username=jwt_user.username,
+        phone=jwt_user.phone,
+        is_admin=jwt_user.is_admin,
+        is_blocked=jwt_user.is_blocked,
+    )
@@ -12,21 +12,64 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Callable, Type
+from typing import AsyncGenerator, Callable, Optional, Type
 
 from fastapi import Depends
 from fastapi.requests import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.middlewares.unit_of_work import UNIT_OF_WORK_SESSION
 from app.database.repositories.base import BaseRepository
+from app.database.unit_of_work import begin_unit_of_work, end_unit_of_work
 
 
-def _get_db_session(request: Request) -> AsyncSession:
-    return request.app.state.session
+async def _get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with request.app.state.session_maker() as session:
+        begin_unit_of_work(session)
+        setattr(request.state, UNIT_OF_WORK_SESSION, session)
 
+        yield session
 
-def get_repository(repo_type: Type[BaseRepository]) -> Callable[[AsyncSession], BaseRepository]:
+
+async def _get_db_session_without_unit_of_work(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with request.app.state.session_maker() as session:
+        yield session
+
+
+def without_unit_of_work(session: AsyncSession = Depends(_get_db_session)) -> None:
+    end_unit_of_work(session)
+
+
+async def _get_db_replica_session(request: Request) -> AsyncGenerator[Optional[AsyncSession], None]:
+    replica_session = request.app.state.replicas.create_session()
+    if replica_session is None:
+        yield None
+        return
+
+    async with replica_session:
+        yield replica_session
+
+
+def get_repository(
+        repo_type: Type[BaseRepository],
+        read_only: bool = False,
+        unit_of_work: bool = True,
+) -> Callable[[AsyncSession], BaseRepository]:
     def _get_repo(session: AsyncSession = Depends(_get_db_session)) -> BaseRepository:
         return repo_type(session)
 
-    return _get_repo
+    def _get_repo_without_unit_of_work(
+            session: AsyncSession = Depends(_get_db_session_without_unit_of_work),
+    ) -> BaseRepository:
+        return repo_type(session)
+
+    def _get_read_only_repo(
+            session: AsyncSession = Depends(_get_db_session),
+            replica_session: Optional[AsyncSession] = Depends(_get_db_replica_session),
+    ) -> BaseRepository:
+        return repo_type(session, replica_session)
+
+    if not unit_of_work:
+        return _get_repo_without_unit_of_work
+
+    return _get_read_only_repo if read_only else _get_repo
@@ -53,8 +53,9 @@ def get_events_filters(
         state: EventState = EventState.PLANNED,
         limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
         offset: int = Query(DEFAULT_ARTICLES_OFFSET, ge=0),
+        cursor: Optional[str] = Query(None),
 ) -> EventsFilter:
-    return EventsFilter(state=state, limit=limit, offset=offset)
+    return EventsFilter(state=state, limit=limit, offset=offset, cursor=cursor)
 
 
 async def get_event_by_id_from_path(
@@ -37,10 +37,12 @@ from app.services.posts import check_user_can_modify_post
 def get_posts_filter(
         limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
         offset: int = Query(DEFAULT_ARTICLES_OFFSET, ge=0),
+        cursor: Optional[str] = Query(None),
 ) -> PostsFilter:
     return PostsFilter(
         limit=limit,
         offset=offset,
+        cursor=cursor,
     )
 
 
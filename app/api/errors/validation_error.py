@@ -14,6 +14,7 @@
 
 from typing import Union
 
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.constants import REF_PREFIX
 from fastapi.openapi.utils import validation_error_response_definition
@@ -28,7 +29,7 @@ async def http422_error_handler(
     exc: Union[RequestValidationError, ValidationError],
 ) -> JSONResponse:
     return JSONResponse(
-        {"errors": exc.errors()},
+        {"errors": jsonable_encoder(exc.errors())},
         status_code=HTTP_422_UNPROCESSABLE_ENTITY,
     )
 
@@ -0,0 +1,89 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Dict
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from loguru import logger
+from starlette.types import ASGIApp, Message, Scope, Receive, Send
+
+from app.database.query_counter import QueryBudgetMode, QueryStats, count_queries
+from app.resources import strings
+
+
+class QueryBudgetMiddleware:
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            mode: QueryBudgetMode,
+            max_queries: int,
+            max_duration: float,
+            routes_max_queries: Dict[str, int],
+    ) -> None:
+        self.app = app
+        self.mode = mode
+        self.max_queries = max_queries
+        self.max_duration = max_duration
+        self.routes_max_queries = routes_max_queries
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.mode == QueryBudgetMode.OFF:
+            await self.app(scope, receive, send)
+            return
+
+        budget_exceeded = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal budget_exceeded
+
+            if budget_exceeded:
+                return
+
+            if message["type"] == "http.response.start" and self._is_exceeded(scope, stats):
+                if self.mode == QueryBudgetMode.FAIL:
+                    budget_exceeded = True
+
+                    response = JSONResponse(
+                        {"errors": [strings.QUERY_BUDGET_EXCEEDED]},
+                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    )
+                    await response(scope, receive, send)
+                    return
+
+            await send(message)
+
+        with count_queries() as stats:
+            await self.app(scope, receive, send_wrapper)
+
+    def _is_exceeded(self, scope: Scope, stats: QueryStats) -> bool:
+        route_name = getattr(scope.get("route"), "name", None)
+        max_queries = self.routes_max_queries.get(route_name, self.max_queries)
+
+        if stats.count <= max_queries and stats.duration <= self.max_duration:
+            return False
+
+        logger.warning(
+            "Query budget exceeded by {0} {1} ({2}): {3} queries (budget {4}), {5:.3f} ms (budget {6:.3f} ms)",
+            scope["method"],
+            scope["path"],
+            route_name,
+            stats.count,
+            max_queries,
+            stats.duration * 1000,
+            self.max_duration * 1000,
+        )
+
+        return True
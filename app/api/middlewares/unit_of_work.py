@@ -0,0 +1,67 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from loguru import logger
+from starlette.types import ASGIApp, Message, Scope, Receive, Send
+
+from app.database.unit_of_work import in_unit_of_work
+from app.resources import strings
+
+UNIT_OF_WORK_SESSION = "unit_of_work_session"
+
+
+class UnitOfWorkMiddleware:
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        commit_failed = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal commit_failed
+
+            if commit_failed:
+                return
+
+            session = state.get(UNIT_OF_WORK_SESSION)
+
+            if message["type"] == "http.response.start" and session is not None and in_unit_of_work(session):
+                if message["status"] >= status.HTTP_400_BAD_REQUEST:
+                    await session.rollback()
+                else:
+                    try:
+                        await session.commit()
+                    except Exception as exception:
+                        logger.error(exception)
+                        commit_failed = True
+
+                        response = JSONResponse(
+                            {"errors": [strings.TRANSACTION_COMMIT_ERROR]},
+                            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                        )
+                        await response(scope, receive, send)
+                        return
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
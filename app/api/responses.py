@@ -0,0 +1,23 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def render_response_model(model: BaseModel) -> ORJSONResponse:
+    # A returned response skips FastAPI's response_model validation and the recursive
+    # jsonable_encoder pass. Nothing filters the content again, so the model must be
+    # the route's response_model built from domain models, never from *InDB ones.
+    return ORJSONResponse(model.dict(by_alias=True))
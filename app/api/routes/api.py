@@ -22,7 +22,8 @@ from . import (
     vehicles,
     locations,
     posts,
-    events
+    events,
+    metrics,
 )
 
 router = APIRouter()
@@ -35,3 +36,4 @@ router.include_router(vehicles.router, tags=["vehicles"])
 router.include_router(locations.router, tags=["locations"], prefix="/locations")
 router.include_router(posts.router, tags=["posts"])
 router.include_router(events.router, tags=["events"])
+router.include_router(metrics.router, tags=["metrics"], prefix="/metrics")
@@ -12,22 +12,28 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from secrets import token_urlsafe
+
 from fastapi import (
     APIRouter,
     Body,
     Depends,
     HTTPException,
+    Query,
     status,
-    Response,
 )
+from loguru import logger
 
-from app.api.dependencies.database import get_repository
+from app.api.dependencies.database import get_repository, without_unit_of_work
 from app.core.config import get_app_settings
 from app.core.settings.app import AppSettings
 from app.database.errors import (
+    EntityAlreadyExists,
     EntityDoesNotExists,
     EntityCreateError,
+    EntityUpdateError,
 )
+from app.database.repositories.sms_outbox import SmsOutboxRepository
 from app.database.repositories.users import UsersRepository
 from app.database.repositories.verification_codes import VerificationRepository
 from app.models.domain.user import UserInDB
@@ -37,6 +43,8 @@ from app.models.schemas.user import (
     UserWithToken,
     UserInResponseWithToken,
     PhoneInVerification,
+    VerificationInResponse,
+    VerificationStatusInResponse,
 )
 from app.resources import strings
 from app.services import jwt
@@ -44,11 +52,9 @@ from app.services.authentication import (
     check_username_is_taken,
     check_phone_is_valid,
     check_phone_is_taken,
+    check_verification_code_is_valid,
 )
-from app.services.sms import (
-    is_hilink,
-    send_verify_code_to_phone,
-)
+from app.services.sms import get_verification_message
 
 router = APIRouter()
 
@@ -56,44 +62,69 @@ router = APIRouter()
 @router.post(
     "/get_verification_code",
     status_code=status.HTTP_200_OK,
+    response_model=VerificationInResponse,
     name="auth:verification",
-    response_class=Response
 )
 async def get_verification_code(
         verification: PhoneInVerification = Body(..., embed=True, alias="verification"),
         verification_repo: VerificationRepository = Depends(get_repository(VerificationRepository)),
+        sms_outbox_repo: SmsOutboxRepository = Depends(get_repository(SmsOutboxRepository)),
         settings: AppSettings = Depends(get_app_settings),
-) -> None:
+) -> VerificationInResponse:
     phone_number_invalid = HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail=strings.PHONE_NUMBER_INVALID_ERROR
     )
-    verification_service_unavailable = HTTPException(
-        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        detail=strings.VERIFICATION_SERVICE_TEMPORARY_UNAVAILABLE
-    )
     create_verification_code_error = HTTPException(
         status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         detail=strings.VERIFICATION_CODE_CREATE_ERROR
     )
-    phone_sms_send_error = HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail=strings.VERIFICATION_SERVICE_SEND_SMS_ERROR
+    verification_codes_limit_exceeded = HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=strings.VERIFICATION_CODES_LIMIT_EXCEEDED
     )
 
     if not check_phone_is_valid(verification.phone):
         raise phone_number_invalid
 
-    if not await is_hilink(settings.sms_api_host):
-        raise verification_service_unavailable
+    # The status of the SMS is only handed out against this id, never against the phone number.
+    request_id = token_urlsafe(16)
 
     try:
-        code = await verification_repo.create_verification_code_by_phone(verification.phone)
+        code = await verification_repo.create_verification_code_by_phone(
+            verification.phone,
+            settings.verification_code_ttl,
+            settings.verification_codes_per_phone,
+        )
+        await sms_outbox_repo.create_message(verification.phone, get_verification_message(code), request_id=request_id)
+    except EntityAlreadyExists as exception:
+        raise verification_codes_limit_exceeded from exception
     except EntityCreateError as exception:
         raise create_verification_code_error from exception
 
-    if not await send_verify_code_to_phone(settings.sms_api_host, verification.phone, code):
-        raise phone_sms_send_error
+    return VerificationInResponse(request_id=request_id)
+
+
+@router.get(
+    "/get_verification_status",
+    response_model=VerificationStatusInResponse,
+    name="auth:verification-status",
+)
+async def get_verification_status(
+        request_id: str = Query(...),
+        sms_outbox_repo: SmsOutboxRepository = Depends(get_repository(SmsOutboxRepository)),
+) -> VerificationStatusInResponse:
+    verification_code_not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=strings.VERIFICATION_CODE_DOES_NOT_EXISTS
+    )
+
+    try:
+        message = await sms_outbox_repo.get_message_by_request_id(request_id)
+    except EntityDoesNotExists as exception:
+        raise verification_code_not_found from exception
+
+    return VerificationStatusInResponse(phone=message.phone, state=message.state, sent_at=message.sent_at)
 
 
 @router.post(
@@ -106,6 +137,9 @@ async def register(
         user_create: UserInCreate = Body(..., embed=True, alias="user"),
         users_repo: UsersRepository = Depends(get_repository(UsersRepository)),
         verification_repo: VerificationRepository = Depends(get_repository(VerificationRepository)),
+        verification_attempts_repo: VerificationRepository = Depends(
+            get_repository(VerificationRepository, unit_of_work=False)
+        ),
         settings: AppSettings = Depends(get_app_settings),
 ) -> UserInResponseWithToken:
     phone_invalid = HTTPException(
@@ -138,13 +172,15 @@ async def register(
     if await check_username_is_taken(users_repo, user_create.username):
         raise username_taken
 
-    try:
-        await verification_repo.get_verification_code_by_phone_and_code(
+    if not await check_verification_code_is_valid(
+            verification_repo,
+            verification_attempts_repo,
             user_create.phone,
-            user_create.verification_code
-        )
-    except EntityDoesNotExists as exception:
-        raise verification_code_wrong from exception
+            user_create.verification_code,
+            settings.verification_code_ttl,
+            settings.verification_code_max_attempts,
+    ):
+        raise verification_code_wrong
 
     try:
         user = await users_repo.create_user(
@@ -157,7 +193,10 @@ async def register(
 
     try:
         await verification_repo.mark_as_verified_by_phone_and_verification_code(
-            user_create.phone, user_create.verification_code
+            user_create.phone,
+            user_create.verification_code,
+            settings.verification_code_ttl,
+            settings.verification_code_max_attempts,
         )
     except EntityDoesNotExists as exception:
         raise verification_code_wrong from exception
@@ -166,7 +205,9 @@ async def register(
         user_id=user.id,
         username=user.username,
         phone=user.phone,
-        secret_key=settings.secret_key.get_secret_value()
+        secret_key=settings.secret_key.get_secret_value(),
+        is_admin=user.is_admin,
+        is_blocked=user.is_blocked,
     )
 
     return UserInResponseWithToken(user=UserWithToken(token=token, **user.__dict__))
@@ -176,6 +217,10 @@ async def register(
     "/login",
     response_model=UserInResponseWithToken,
     name="auth:login",
+    dependencies=[
+        # The opportunistic rehash commits on its own, so a failed write cannot fail the login.
+        Depends(without_unit_of_work),
+    ],
 )
 async def login(
         user_login: UserInLogin = Body(..., embed=True, alias="user"),
@@ -192,14 +237,22 @@ async def login(
     except EntityDoesNotExists as exception:
         raise incorrect_credentials from exception
 
-    if not user.check_password(user_login.password):
+    if not await user.check_password_async(user_login.password):
         raise incorrect_credentials
 
+    if user.password_needs_update():
+        try:
+            await users_repo.update_user_by_user(user.id, password=user_login.password)
+        except EntityUpdateError as exception:
+            logger.error("Unable to rehash password for user {}: {}", user.id, exception)
+
     token = jwt.create_access_token_for_user(
         user_id=user.id,
         username=user.username,
         phone=user.phone,
-        secret_key=settings.secret_key.get_secret_value()
+        secret_key=settings.secret_key.get_secret_value(),
+        is_admin=user.is_admin,
+        is_blocked=user.is_blocked,
     )
 
     return UserInResponseWithToken(user=UserWithToken(token=token, **user.__dict__))
@@ -78,7 +78,7 @@ async def create_comment(
 )
 async def get_comments(
         event_id: int = Depends(get_event_id_from_path),
-        comments_repo: CommentsRepository = Depends(get_repository(CommentsRepository)),
+        comments_repo: CommentsRepository = Depends(get_repository(CommentsRepository, read_only=True)),
 ) -> ListOfCommentsInResponse:
     comments = await comments_repo.get_comments_by_event_id(event_id)
     return ListOfCommentsInResponse(comments=comments)
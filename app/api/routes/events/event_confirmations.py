@@ -52,14 +52,13 @@ async def create_confirmation(
     confirm: EventConfirmation
 
     try:
-        await confirmation_repo.get_confirmation_by_event_id_and_user_id(event.id, user.id)
         confirm = await confirmation_repo.update_confirmation_by_event_id_and_user_id(
             event.id, user.id, event_confirmation
         )
 
     except EntityDoesNotExists:
         confirm = await confirmation_repo.create_confirmation_by_event_id_for_user(
-            event.id, user.id, event_confirmation
+            event.id, user, event_confirmation
         )
 
     return EventConfirmationInResponse(
@@ -82,14 +81,13 @@ async def get_confirmations(
     confirm: EventConfirmation
 
     try:
-        await confirmation_repo.get_confirmation_by_event_id_and_user_id(event.id, user.id)
         confirm = await confirmation_repo.update_confirmation_by_event_id_and_user_id(
             event.id, user.id, event_confirmation
         )
 
     except EntityDoesNotExists:
         confirm = await confirmation_repo.create_confirmation_by_event_id_for_user(
-            event.id, user.id, event_confirmation
+            event.id, user, event_confirmation
         )
 
     return EventConfirmationInResponse(
@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from datetime import datetime
+
 from fastapi import (
     APIRouter,
     status,
@@ -19,20 +21,23 @@ from fastapi import (
     Body,
     HTTPException,
 )
+from fastapi.responses import ORJSONResponse
 
-from app.api.dependencies.authentication import get_current_user_id_authorizer
+from app.api.dependencies.authentication import get_current_user_authorizer, get_current_user_id_authorizer
 from app.api.dependencies.database import get_repository
 from app.api.dependencies.events import (
     get_events_filters,
     get_event_id_from_path,
     check_event_permissions,
 )
+from app.api.responses import render_response_model
 from app.database.errors import (
     EntityDoesNotExists,
     EntityAlreadyExists,
     EntityCreateError,
 )
 from app.database.repositories.events import EventsRepository
+from app.models.domain.user import User
 from app.models.schemas.events import (
     EventsFilter,
     ListOfEventsInResponse,
@@ -42,6 +47,7 @@ from app.models.schemas.events import (
 )
 from app.resources import strings
 from app.services.events import check_event_exist_by_title
+from app.services.pagination import decode_cursor, get_next_cursor
 
 router = APIRouter()
 
@@ -54,7 +60,7 @@ router = APIRouter()
 )
 async def create_event(
         event_create: EventInCreate = Body(..., embed=True, alias="event"),
-        user_id: int = Depends(get_current_user_id_authorizer()),
+        user: User = Depends(get_current_user_authorizer()),
         events_repo: EventsRepository = Depends(get_repository(EventsRepository)),
 ) -> EventInResponse:
     event_already_exists = HTTPException(
@@ -70,7 +76,7 @@ async def create_event(
         raise event_already_exists
 
     try:
-        event = await events_repo.create_event_by_user_id(user_id, **event_create.__dict__)
+        event = await events_repo.create_event_by_user(user, **event_create.__dict__)
     except EntityCreateError as exception:
         raise event_create_error from exception
 
@@ -84,20 +90,36 @@ async def create_event(
 )
 async def get_events(
         events_filter: EventsFilter = Depends(get_events_filters),
-        events_repo: EventsRepository = Depends(get_repository(EventsRepository)),
-) -> ListOfEventsInResponse:
+        events_repo: EventsRepository = Depends(get_repository(EventsRepository, read_only=True)),
+) -> ORJSONResponse:
     event_not_found = HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=strings.EVENT_DOES_NOT_EXIST_ERROR)
+    invalid_cursor = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=strings.PAGINATION_CURSOR_INVALID
+    )
+
+    after = None
+    if events_filter.cursor:
+        try:
+            after = decode_cursor(events_filter.cursor, datetime, int)
+        except ValueError as exception:
+            raise invalid_cursor from exception
 
     try:
         events = await events_repo.get_events_with_filter(
             state=events_filter.state,
             limit=events_filter.limit,
-            offset=events_filter.offset
+            offset=events_filter.offset,
+            after=after,
         )
     except EntityDoesNotExists as exception:
         raise event_not_found from exception
 
-    return ListOfEventsInResponse(events=events, events_count=len(events))
+    next_cursor = get_next_cursor(events, events_filter.limit, "started_at", "id")
+
+    return render_response_model(
+        ListOfEventsInResponse(events=events, events_count=len(events), next_cursor=next_cursor)
+    )
 
 
 @router.get(
@@ -64,7 +64,7 @@ async def create_comment(
 )
 async def get_comments(
         post_id: int = Depends(get_post_id_from_path),
-        comments_repo: CommentsRepository = Depends(get_repository(CommentsRepository)),
+        comments_repo: CommentsRepository = Depends(get_repository(CommentsRepository, read_only=True)),
 ) -> ListOfCommentsInResponse:
     comments = await comments_repo.get_comments_by_post_id(post_id)
     return ListOfCommentsInResponse(comments=comments)
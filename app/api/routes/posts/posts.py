@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from datetime import datetime
+
 from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
 
 from app.api.dependencies.posts import (
@@ -35,6 +37,7 @@ from app.models.schemas.post import (
     ListOfPostsInResponse,
 )
 from app.resources import strings
+from app.services.pagination import decode_cursor, get_next_cursor
 from app.services.posts import check_post_exist_by_title
 
 router = APIRouter()
@@ -48,7 +51,7 @@ router = APIRouter()
 )
 async def create_post(
         post_create: PostInCreate = Body(..., embed=True, alias="post"),
-        user_id: int = Depends(get_current_user_id_authorizer()),
+        user: User = Depends(get_current_user_authorizer()),
         posts_repo: PostsRepository = Depends(get_repository(PostsRepository)),
 ) -> PostInResponse:
     post_already_exists = HTTPException(
@@ -64,7 +67,7 @@ async def create_post(
         raise post_already_exists
 
     try:
-        post = await posts_repo.create_post_by_user_id(user_id, **post_create.__dict__)
+        post = await posts_repo.create_post_by_user(user, **post_create.__dict__)
     except EntityCreateError as exception:
         raise post_create_error from exception
 
@@ -78,14 +81,28 @@ async def create_post(
 )
 async def get_posts_with_filter(
         posts_filter: PostsFilter = Depends(get_posts_filter),
-        posts_repo: PostsRepository = Depends(get_repository(PostsRepository)),
+        posts_repo: PostsRepository = Depends(get_repository(PostsRepository, read_only=True)),
 ) -> ListOfPostsInResponse:
+    invalid_cursor = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=strings.PAGINATION_CURSOR_INVALID
+    )
+
+    after = None
+    if posts_filter.cursor:
+        try:
+            after = decode_cursor(posts_filter.cursor, datetime, int)
+        except ValueError as exception:
+            raise invalid_cursor from exception
+
     posts = await posts_repo.get_posts_with_filter(
         limit=posts_filter.limit,
         offset=posts_filter.offset,
+        after=after,
     )
+    next_cursor = get_next_cursor(posts, posts_filter.limit, "created_at", "id")
 
-    return ListOfPostsInResponse(posts=posts, count=len(posts))
+    return ListOfPostsInResponse(posts=posts, count=len(posts), next_cursor=next_cursor)
 
 
 @router.get(
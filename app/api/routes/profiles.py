@@ -33,6 +33,7 @@ from app.models.schemas.profile import (
     ListOfProfileInResponse, ProfilesFilter,
 )
 from app.resources import strings
+from app.services.pagination import decode_cursor, get_next_cursor
 
 router = APIRouter()
 
@@ -47,11 +48,24 @@ router = APIRouter()
 )
 async def get_profiles(
         profiles_filter: ProfilesFilter = Depends(get_profiles_filter),
-        profiles_repo: ProfilesRepository = Depends(get_repository(ProfilesRepository)),
+        profiles_repo: ProfilesRepository = Depends(get_repository(ProfilesRepository, read_only=True)),
 ) -> ListOfProfileInResponse:
-    profiles = await profiles_repo.get_profiles_with_filter(profiles_filter.limit, profiles_filter.offset)
-
-    return ListOfProfileInResponse(profiles=profiles, count=len(profiles))
+    invalid_cursor = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=strings.PAGINATION_CURSOR_INVALID
+    )
+
+    after = None
+    if profiles_filter.cursor:
+        try:
+            after, = decode_cursor(profiles_filter.cursor, int)
+        except ValueError as exception:
+            raise invalid_cursor from exception
+
+    profiles = await profiles_repo.get_profiles_with_filter(profiles_filter.limit, profiles_filter.offset, after)
+    next_cursor = get_next_cursor(profiles, profiles_filter.limit, "id")
+
+    return ListOfProfileInResponse(profiles=profiles, count=len(profiles), next_cursor=next_cursor)
 
 
 @router.get(
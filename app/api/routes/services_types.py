@@ -38,7 +38,7 @@ router = APIRouter()
     name="services-types:get-all-vehicles"
 )
 async def get_service_types(
-        services_types_repo: ServicesTypesRepository = Depends(get_repository(ServicesTypesRepository)),
+        services_types_repo: ServicesTypesRepository = Depends(get_repository(ServicesTypesRepository, read_only=True)),
 ) -> ListOfServicesTypesInResponse:
     services_types = await services_types_repo.get_services_types()
     return ListOfServicesTypesInResponse(services_types=services_types, count=len(services_types))
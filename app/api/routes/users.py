@@ -22,10 +22,11 @@ from fastapi import (
 
 from app.api.dependencies.authentication import get_current_user_authorizer
 from app.api.dependencies.database import get_repository
-from app.database.errors import EntityDoesNotExists
+from app.core.config import get_app_settings
+from app.core.settings.app import AppSettings
 from app.database.repositories.users import UsersRepository
 from app.database.repositories.verification_codes import VerificationRepository
-from app.models.domain.user import UserInDB
+from app.models.domain.user import User, UserInDB
 from app.models.schemas.user import (
     UserInResponse,
     UserInUpdate,
@@ -35,6 +36,7 @@ from app.services.authentication import (
     check_phone_is_valid,
     check_phone_is_taken,
     check_username_is_taken,
+    check_verification_code_is_valid,
 )
 
 router = APIRouter()
@@ -42,7 +44,7 @@ router = APIRouter()
 
 @router.get("", response_model=UserInResponse, name="users:get-current-user")
 async def get_current_user(
-        user: UserInDB = Depends(get_current_user_authorizer()),
+        user: User = Depends(get_current_user_authorizer()),
 ) -> UserInResponse:
     return UserInResponse(user=user)
 
@@ -50,9 +52,13 @@ async def get_current_user(
 @router.put("", response_model=UserInResponse, name="users:update-current-user")
 async def update_current_user(
         user_update: UserInUpdate = Body(..., embed=True, alias="user"),
-        user: UserInDB = Depends(get_current_user_authorizer()),
+        user: UserInDB = Depends(get_current_user_authorizer(verify_in_database=True)),
         users_repo: UsersRepository = Depends(get_repository(UsersRepository)),
         verification_repo: VerificationRepository = Depends(get_repository(VerificationRepository)),
+        verification_attempts_repo: VerificationRepository = Depends(
+            get_repository(VerificationRepository, unit_of_work=False)
+        ),
+        settings: AppSettings = Depends(get_app_settings),
 ) -> UserInResponse:
     phone_invalid = HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -78,13 +84,15 @@ async def update_current_user(
         if await check_phone_is_taken(users_repo, user_update.phone):
             raise phone_taken
 
-        try:
-            await verification_repo.get_verification_code_by_phone_and_code(
+        if not await check_verification_code_is_valid(
+                verification_repo,
+                verification_attempts_repo,
                 user_update.phone,
-                user_update.verification_code
-            )
-        except EntityDoesNotExists as exception:
-            raise verification_code_wrong from exception
+                user_update.verification_code,
+                settings.verification_code_ttl,
+                settings.verification_code_max_attempts,
+        ):
+            raise verification_code_wrong
 
     if user_update.username and user_update.username != user.username:
         if await check_username_is_taken(users_repo, user_update.username):
@@ -17,14 +17,22 @@ from fastapi import (
     Depends,
     Body,
     status,
-    HTTPException
+    HTTPException,
+    Query,
+    Request,
 )
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-from app.api.dependencies.database import get_repository
+from app.api.dependencies.database import get_repository, without_unit_of_work
 from app.api.dependencies.authentication import get_current_user_authorizer
-from app.api.dependencies.fuels import get_fuel_by_id_from_path
+from app.api.dependencies.fuels import (
+    get_fuel_id_from_path,
+    get_fuel_by_id_from_path,
+)
 from app.api.dependencies.vehicle import get_vehicle_by_id_from_path
+from app.api.responses import render_response_model
 from app.database.errors import (
+    EntityDoesNotExists,
     EntityCreateError,
     EntityUpdateError,
     EntityDeleteError,
@@ -40,7 +48,16 @@ from app.models.schemas.fuel import (
     FuelInCreate,
     FuelInUpdate,
 )
+from app.models.schemas.exports import ExportFormat
+from app.models.schemas.imports import ImportReportInResponse
 from app.resources import strings
+from app.services.exports import (
+    EXPORT_CHUNK_SIZE,
+    EXPORT_MEDIA_TYPES,
+    FUEL_EXPORT_FIELDS,
+    export_rows,
+)
+from app.services.imports import import_fuels, read_import_rows
 from app.services.vehicles import update_vehicle_mileage
 
 router = APIRouter()
@@ -80,6 +97,44 @@ async def create_fuel(
     return FuelInResponse(fuel=fuel)
 
 
+@router.post(
+    "/import",
+    response_model=ImportReportInResponse,
+    name="fuels:import-fuels",
+)
+async def import_fuels_from_body(
+        request: Request,
+        user: User = Depends(get_current_user_authorizer()),
+        vehicle: Vehicle = Depends(get_vehicle_by_id_from_path),
+        vehicles_repo: VehiclesRepository = Depends(get_repository(VehiclesRepository)),
+        fuels_repo: FuelsRepository = Depends(get_repository(FuelsRepository)),
+) -> ImportReportInResponse:
+    import_content_type_unsupported = HTTPException(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail=strings.IMPORT_CONTENT_TYPE_UNSUPPORTED
+    )
+    import_body_malformed = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=strings.IMPORT_BODY_MALFORMED
+    )
+    fuel_create_error = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=strings.FUEL_CREATE_ERROR
+    )
+
+    try:
+        rows = read_import_rows(request.headers.get("content-type", ""), request.stream())
+    except ValueError as exception:
+        raise import_content_type_unsupported from exception
+
+    try:
+        return await import_fuels(fuels_repo, vehicles_repo, vehicle, user.id, rows)
+    except ValueError as exception:
+        raise import_body_malformed from exception
+    except EntityCreateError as exception:
+        raise fuel_create_error from exception
+
+
 @router.get(
     "",
     response_model=ListOfFuelsInResponse,
@@ -87,10 +142,31 @@ async def create_fuel(
 )
 async def get_fuels(
         vehicle: Vehicle = Depends(get_vehicle_by_id_from_path),
-        fuels_repo: FuelsRepository = Depends(get_repository(FuelsRepository)),
-) -> ListOfFuelsInResponse:
+        fuels_repo: FuelsRepository = Depends(get_repository(FuelsRepository, read_only=True)),
+) -> ORJSONResponse:
     fuels = await fuels_repo.get_fuels_by_vehicle_id(vehicle.id)
-    return ListOfFuelsInResponse(fuels=fuels, count=len(fuels))
+    return render_response_model(ListOfFuelsInResponse(fuels=fuels, count=len(fuels)))
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    name="fuels:export-fuels",
+    dependencies=[
+        Depends(without_unit_of_work),
+    ],
+)
+async def export_fuels(
+        export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+        vehicle: Vehicle = Depends(get_vehicle_by_id_from_path),
+        fuels_repo: FuelsRepository = Depends(get_repository(FuelsRepository, read_only=True)),
+) -> StreamingResponse:
+    fuels = fuels_repo.stream_fuels_by_vehicle_id(vehicle.id, EXPORT_CHUNK_SIZE)
+
+    return StreamingResponse(
+        export_rows(fuels, export_format, FUEL_EXPORT_FIELDS),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+    )
 
 
 @router.get(
@@ -111,7 +187,7 @@ async def get_fuel_by_id(
 )
 async def update_reminder_by_id(
         vehicle: Vehicle = Depends(get_vehicle_by_id_from_path),
-        fuel: Fuel = Depends(get_fuel_by_id_from_path),
+        fuel_id: int = Depends(get_fuel_id_from_path),
         fuel_update: FuelInUpdate = Body(..., embed=True, alias="fuel"),
         user: User = Depends(get_current_user_authorizer()),
         vehicles_repo: VehiclesRepository = Depends(get_repository(VehiclesRepository)),
@@ -121,6 +197,10 @@ async def update_reminder_by_id(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail=strings.VEHICLE_MILEAGE_REDUCE
     )
+    fuel_not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=strings.FUEL_DOES_NOT_EXIST_ERROR
+    )
     fuel_update_error = HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail=strings.FUEL_UPDATE_ERROR
@@ -130,7 +210,9 @@ async def update_reminder_by_id(
         raise vehicle_mileage_reduce
 
     try:
-        fuel = await fuels_repo.update_fuel_by_id_and_vehicle_id(fuel.id, vehicle.id, **fuel_update.__dict__)
+        fuel = await fuels_repo.update_fuel_by_id_and_vehicle_id(fuel_id, vehicle.id, **fuel_update.__dict__)
+    except EntityDoesNotExists as exception:
+        raise fuel_not_found from exception
     except EntityUpdateError as exception:
         raise fuel_update_error from exception
 
@@ -147,15 +229,21 @@ async def update_reminder_by_id(
 )
 async def delete_fuel_by_id(
         vehicle: Vehicle = Depends(get_vehicle_by_id_from_path),
-        fuel: Fuel = Depends(get_fuel_by_id_from_path),
+        fuel_id: int = Depends(get_fuel_id_from_path),
         fuels_repo: FuelsRepository = Depends(get_repository(FuelsRepository)),
 ) -> None:
+    fuel_not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=strings.FUEL_DOES_NOT_EXIST_ERROR
+    )
     fuel_delete_error = HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
         detail=strings.FUEL_DELETE_ERROR
     )
 
     try:
-        await fuels_repo.delete_fuel_by_id_and_vehicle_id(fuel.id, vehicle.id)
+        await fuels_repo.delete_fuel_by_id_and_vehicle_id(fuel_id, vehicle.id)
+    except EntityDoesNotExists as exception:
+        raise fuel_not_found from exception
     except EntityDeleteError as exception:
         raise fuel_delete_error from exception
@@ -74,7 +74,7 @@ async def create_reminder(
 )
 async def get_reminder(
         vehicle: Vehicle = Depends(get_vehicle_by_id_from_path),
-        reminders_repo: RemindersRepository = Depends(get_repository(RemindersRepository)),
+        reminders_repo: RemindersRepository = Depends(get_repository(RemindersRepository, read_only=True)),
 ) -> ListOfRemindersInResponse:
     reminders = await reminders_repo.get_reminders_by_vehicle_id(vehicle.id)
     return ListOfRemindersInResponse(reminders=reminders, count=len(reminders))
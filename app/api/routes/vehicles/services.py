@@ -17,10 +17,13 @@ from fastapi import (
     Depends,
     Body,
     status,
-    HTTPException
+    HTTPException,
+    Query,
+    Request,
 )
+from fastapi.responses import StreamingResponse
 
-from app.api.dependencies.database import get_repository
+from app.api.dependencies.database import get_repository, without_unit_of_work
 from app.api.dependencies.authentication import get_current_user_authorizer
 from app.api.dependencies.get_id_from_path import (
     get_service_id_from_path,
@@ -33,6 +36,7 @@ from app.database.errors import (
     EntityDeleteError,
 )
 from app.database.repositories.services import ServicesRepository
+from app.database.repositories.services_types import ServicesTypesRepository
 from app.database.repositories.vehicles import VehiclesRepository
 from app.models.domain.user import User
 from app.models.domain.vehicle import Vehicle
@@ -41,7 +45,16 @@ from app.models.schemas.service import (
     ListOfServicesInResponse,
     ServiceInCreate, ServiceInUpdate,
 )
+from app.models.schemas.exports import ExportFormat
+from app.models.schemas.imports import ImportReportInResponse
 from app.resources import strings
+from app.services.exports import (
+    EXPORT_CHUNK_SIZE,
+    EXPORT_MEDIA_TYPES,
+    SERVICE_EXPORT_FIELDS,
+    export_rows,
+)
+from app.services.imports import import_services, read_import_rows
 from app.services.vehicles import (
     update_vehicle_mileage,
 )
@@ -83,6 +96,48 @@ async def create_service(
     return ServiceInResponse(service=service)
 
 
+@router.post(
+    "/import",
+    response_model=ImportReportInResponse,
+    name="services:import-services",
+)
+async def import_services_from_body(
+        request: Request,
+        vehicle: Vehicle = Depends(get_vehicle_by_id_from_path),
+        user: User = Depends(get_current_user_authorizer()),
+        vehicles_repo: VehiclesRepository = Depends(get_repository(VehiclesRepository)),
+        services_repo: ServicesRepository = Depends(get_repository(ServicesRepository)),
+        services_types_repo: ServicesTypesRepository = Depends(get_repository(ServicesTypesRepository)),
+) -> ImportReportInResponse:
+    import_content_type_unsupported = HTTPException(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail=strings.IMPORT_CONTENT_TYPE_UNSUPPORTED
+    )
+    import_body_malformed = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=strings.IMPORT_BODY_MALFORMED
+    )
+    service_create_error = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=strings.SERVICE_CREATE_ERROR
+    )
+
+    try:
+        rows = read_import_rows(request.headers.get("content-type", ""), request.stream())
+    except ValueError as exception:
+        raise import_content_type_unsupported from exception
+
+    services_types = await services_types_repo.get_services_types()
+    service_type_ids = {service_type.id for service_type in services_types}
+
+    try:
+        return await import_services(services_repo, vehicles_repo, vehicle, user.id, service_type_ids, rows)
+    except ValueError as exception:
+        raise import_body_malformed from exception
+    except EntityCreateError as exception:
+        raise service_create_error from exception
+
+
 @router.get(
     "",
     response_model=ListOfServicesInResponse,
@@ -90,12 +145,33 @@ async def create_service(
 )
 async def get_services(
         vehicle: Vehicle = Depends(get_vehicle_by_id_from_path),
-        services_repo: ServicesRepository = Depends(get_repository(ServicesRepository)),
+        services_repo: ServicesRepository = Depends(get_repository(ServicesRepository, read_only=True)),
 ) -> ListOfServicesInResponse:
     services = await services_repo.get_services_by_vehicle_id(vehicle.id)
     return ListOfServicesInResponse(services=services, count=len(services))
 
 
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    name="services:export-services",
+    dependencies=[
+        Depends(without_unit_of_work),
+    ],
+)
+async def export_services(
+        export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+        vehicle: Vehicle = Depends(get_vehicle_by_id_from_path),
+        services_repo: ServicesRepository = Depends(get_repository(ServicesRepository, read_only=True)),
+) -> StreamingResponse:
+    services = services_repo.stream_services_by_vehicle_id(vehicle.id, EXPORT_CHUNK_SIZE)
+
+    return StreamingResponse(
+        export_rows(services, export_format, SERVICE_EXPORT_FIELDS),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+    )
+
+
 @router.get(
     "/{service_id}",
     response_model=ServiceInResponse,
@@ -90,7 +90,7 @@ async def create_vehicle(
 )
 async def get_vehicles(
         user: User = Depends(get_current_user_authorizer()),
-        vehicles_repo: VehiclesRepository = Depends(get_repository(VehiclesRepository)),
+        vehicles_repo: VehiclesRepository = Depends(get_repository(VehiclesRepository, read_only=True)),
 ) -> ListOfVehiclesInResponse:
     vehicles = await vehicles_repo.get_vehicles_by_user_id(user.id)
     return ListOfVehiclesInResponse(vehicles=vehicles, count=len(vehicles))
@@ -0,0 +1,86 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from collections import OrderedDict
+from functools import lru_cache
+from time import monotonic
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+from app.core.config import get_app_settings
+from app.core.metrics import metrics
+from app.models.domain.user import UserInDB
+from app.models.schemas.jwt import JWTUser
+
+USERS_CACHE_METRIC = "cache.users"
+TOKENS_CACHE_METRIC = "cache.tokens"
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+class TTLCache(Generic[KeyType, ValueType]):
+
+    def __init__(self, name: str, max_size: int, ttl: float) -> None:
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items: OrderedDict[KeyType, Tuple[float, ValueType]] = OrderedDict()
+
+        metrics.register_hit_rate(name)
+        metrics.register_gauge(f"{name}.size", lambda: len(self._items))
+
+    def get(self, key: KeyType) -> Optional[ValueType]:
+        item = self._items.get(key)
+        if item is None or item[0] <= monotonic():
+            self._items.pop(key, None)
+            metrics.increment(f"{self.name}.misses")
+            return None
+
+        self._items.move_to_end(key)
+        metrics.increment(f"{self.name}.hits")
+
+        return item[1]
+
+    def set(self, key: KeyType, value: ValueType, ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = self.ttl
+
+        if self.max_size <= 0 or ttl <= 0:
+            return
+
+        self._items[key] = (monotonic() + ttl, value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def invalidate(self, key: KeyType) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+@lru_cache
+def get_users_cache() -> TTLCache[int, UserInDB]:
+    settings = get_app_settings()
+
+    return TTLCache(USERS_CACHE_METRIC, settings.users_cache_max_size, settings.users_cache_ttl)
+
+
+@lru_cache
+def get_tokens_cache() -> TTLCache[str, JWTUser]:
+    settings = get_app_settings()
+
+    return TTLCache(TOKENS_CACHE_METRIC, settings.tokens_cache_max_size, 0)
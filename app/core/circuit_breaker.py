@@ -0,0 +1,90 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from enum import Enum
+from time import monotonic
+
+from app.core.metrics import metrics
+
+
+class CircuitState(Enum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+        metrics.register_gauge(f"{name}.state", lambda: self.state.value)
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and monotonic() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == CircuitState.OPEN
+
+    def allow_request(self) -> bool:
+        state = self.state
+
+        if state == CircuitState.CLOSED:
+            return True
+
+        if state == CircuitState.HALF_OPEN:
+            # Let one trial request through per reset timeout, its outcome
+            # closes the circuit or opens it again.
+            self._opened_at = monotonic()
+            return True
+
+        metrics.increment(f"{self.name}.rejected")
+
+        return False
+
+    def check(self) -> None:
+        if not self.allow_request():
+            raise CircuitOpenError("circuit {0} is open".format(self.name))
+
+    def record_success(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        metrics.increment(f"{self.name}.failures")
+
+        if self._state == CircuitState.OPEN or self._failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        metrics.increment(f"{self.name}.opened")
+
+        self._state = CircuitState.OPEN
+        self._opened_at = monotonic()
@@ -0,0 +1,28 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.types import Scope
+
+request_scope: ContextVar[Optional[Scope]] = ContextVar("request_scope", default=None)
+
+
+def get_route_name() -> Optional[str]:
+    scope = request_scope.get()
+    if scope is None:
+        return None
+
+    return getattr(scope.get("route"), "name", None)
@@ -5,6 +5,12 @@ from loguru import logger
 
 from app.core.settings.app import AppSettings
 from app.database.events import close_db_connection, connect_to_db
+from app.services.security import configure_password_hashing, password_hashing_pool
+from app.core.tasks import PeriodicTask
+from app.services.sms import HiLinkPool
+from app.services.sms_delivery import SmsDeliveryTracker
+from app.services.sms_outbox import SmsOutboxCleaner, SmsOutboxSender
+from app.services.verification_codes import VerificationCodesCleaner
 
 
 def create_start_app_handler(
@@ -12,14 +18,87 @@ def create_start_app_handler(
     settings: AppSettings,
 ) -> Callable:  # type: ignore
     async def start_app() -> None:
+        configure_password_hashing(settings.password_hash_rounds)
+        password_hashing_pool.start(settings.password_hashing_workers)
         await connect_to_db(app, settings)
 
+        app.state.sms_client = HiLinkPool.from_hosts(
+            settings.sms_gateway_hosts,
+            settings.sms_modem_send_interval,
+            **settings.sms_client_kwargs
+        )
+        app.state.sms_health_prober = PeriodicTask(
+            "sms-health-prober",
+            settings.sms_health_check_interval,
+            app.state.sms_client.check_health
+        )
+        app.state.sms_health_prober.start()
+
+        sms_outbox_sender = SmsOutboxSender(
+            app.state.session_maker,
+            app.state.sms_client,
+            **settings.sms_outbox_kwargs
+        )
+        app.state.sms_outbox_sender = PeriodicTask(
+            "sms-outbox-sender",
+            settings.sms_outbox_poll_interval,
+            sms_outbox_sender.send_due_messages
+        )
+        app.state.sms_outbox_sender.start()
+
+        app.state.sms_outbox_stats = PeriodicTask(
+            "sms-outbox-stats",
+            settings.sms_outbox_stats_interval,
+            sms_outbox_sender.refresh_state_counts
+        )
+        app.state.sms_outbox_stats.start()
+
+        sms_outbox_cleaner = SmsOutboxCleaner(
+            app.state.session_maker,
+            settings.sms_outbox_retention,
+            settings.sms_outbox_cleanup_batch_size
+        )
+        app.state.sms_outbox_cleaner = PeriodicTask(
+            "sms-outbox-cleaner",
+            settings.sms_outbox_cleanup_interval,
+            sms_outbox_cleaner.delete_finished_messages
+        )
+        app.state.sms_outbox_cleaner.start()
+
+        sms_delivery_tracker = SmsDeliveryTracker(sms_outbox_sender, **settings.sms_delivery_kwargs)
+        app.state.sms_delivery_tracker = PeriodicTask(
+            "sms-delivery-tracker",
+            settings.sms_delivery_poll_interval,
+            sms_delivery_tracker.track_deliveries
+        )
+        app.state.sms_delivery_tracker.start()
+
+        verification_codes_cleaner = VerificationCodesCleaner(
+            app.state.session_maker,
+            settings.verification_code_ttl,
+            settings.verification_codes_cleanup_batch_size
+        )
+        app.state.verification_codes_cleaner = PeriodicTask(
+            "verification-codes-cleaner",
+            settings.verification_codes_cleanup_interval,
+            verification_codes_cleaner.delete_stale_verification_codes
+        )
+        app.state.verification_codes_cleaner.start()
+
     return start_app
 
 
 def create_stop_app_handler(app: FastAPI) -> Callable:  # type: ignore
     @logger.catch
     async def stop_app() -> None:
+        await app.state.verification_codes_cleaner.stop()
+        await app.state.sms_delivery_tracker.stop()
+        await app.state.sms_outbox_cleaner.stop()
+        await app.state.sms_outbox_stats.stop()
+        await app.state.sms_outbox_sender.stop()
+        await app.state.sms_health_prober.stop()
         await close_db_connection(app)
+        await app.state.sms_client.close()
+        password_hashing_pool.stop()
 
     return stop_app
@@ -1,9 +1,18 @@
 import logging
+from enum import Enum
 from types import FrameType
 from typing import cast
 
 from loguru import logger
 
+QUERY_LOG = "query_log"
+
+
+class QueryLogMode(Enum):
+    OFF = "off"
+    SAMPLED = "sampled"
+    SLOW = "slow"
+
 
 class InterceptHandler(logging.Handler):
     def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover
@@ -23,3 +32,11 @@ class InterceptHandler(logging.Handler):
             level,
             record.getMessage(),
         )
+
+
+def is_query_log(record: dict) -> bool:
+    return QUERY_LOG in record["extra"]
+
+
+def is_not_query_log(record: dict) -> bool:
+    return QUERY_LOG not in record["extra"]
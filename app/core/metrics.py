@@ -0,0 +1,58 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from collections import defaultdict
+from typing import Callable, Dict
+
+
+class Metrics:
+    def __init__(self) -> None:
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._gauges: Dict[str, Callable[[], float]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        self._counters[name] += value
+
+    def get(self, name: str) -> float:
+        if name in self._gauges:
+            return self._gauges[name]()
+
+        return self._counters.get(name, 0)
+
+    def register_gauge(self, name: str, callback: Callable[[], float]) -> None:
+        self._gauges[name] = callback
+
+    def register_hit_rate(self, name: str) -> None:
+        self.register_gauge(f"{name}.hit_rate", lambda: self.get_hit_rate(name))
+
+    def get_hit_rate(self, name: str) -> float:
+        hits = self._counters.get(f"{name}.hits", 0)
+        misses = self._counters.get(f"{name}.misses", 0)
+
+        if not hits + misses:
+            return 0.0
+
+        return hits / (hits + misses)
+
+    def snapshot(self) -> Dict[str, float]:
+        values = dict(self._counters)
+
+        for name, callback in self._gauges.items():
+            values[name] = callback()
+
+        return values
+
+
+metrics = Metrics()
@@ -19,8 +19,15 @@ from typing import Any, Dict, List, Tuple
 from loguru import logger
 from pydantic import SecretStr, HttpUrl
 
-from app.core.logging import InterceptHandler
+from app.core.logging import (
+    InterceptHandler,
+    QueryLogMode,
+    is_not_query_log,
+    is_query_log,
+)
 from app.core.settings.base import BaseAppSettings
+from app.database.query_counter import QueryBudgetMode
+from app.models.schemas.jwt import AuthMode
 
 
 class AppSettings(BaseAppSettings):
@@ -39,17 +46,71 @@ class AppSettings(BaseAppSettings):
 
     max_connection_count: int = 10
     min_connection_count: int = 10
+    connection_pool_timeout: float = 30.0
+    connection_pool_recycle: int = 1800
+    connection_pool_pre_ping: bool = True
+
+    database_query_cache_size: int = 1200
+    database_prepared_statement_cache_size: int = 256
+
+    database_replica_urls: List[str] = []
+    database_replica_max_lag: float = 5.0
+    database_replica_check_interval: float = 10.0
+
+    database_query_log_mode: QueryLogMode = QueryLogMode.OFF
+    database_query_log_sample_rate: float = 0.01
+    database_query_log_slow_threshold: float = 0.2
+
+    database_query_budget_mode: QueryBudgetMode = QueryBudgetMode.OFF
+    database_query_budget: int = 10
+    database_query_budget_duration: float = 0.5
+    database_query_budget_routes: Dict[str, int] = {}
+
+    users_cache_ttl: float = 60.0
+    users_cache_max_size: int = 10000
+    tokens_cache_max_size: int = 10000
 
     sms_api_host: HttpUrl
+    sms_api_hosts: List[HttpUrl] = []
     sms_api_user: str
     sms_api_pass: str
     sms_max_chars: int = 160
+    sms_api_timeout: float = 5.0
+    sms_session_ttl: float = 300.0
+    sms_max_connections: int = 4
+    sms_circuit_failure_threshold: int = 3
+    sms_circuit_reset_timeout: float = 30.0
+    sms_health_check_interval: float = 10.0
+    sms_modem_send_interval: float = 3.0
+
+    verification_code_ttl: float = 600.0
+    verification_codes_per_phone: int = 3
+    verification_code_max_attempts: int = 5
+    verification_codes_cleanup_interval: float = 600.0
+    verification_codes_cleanup_batch_size: int = 1000
+
+    sms_outbox_poll_interval: float = 1.0
+    sms_outbox_batch_size: int = 10
+    sms_outbox_max_attempts: int = 5
+    sms_outbox_backoff: float = 5.0
+    sms_outbox_max_backoff: float = 300.0
+    sms_outbox_lease: float = 60.0
+    sms_outbox_stats_interval: float = 60.0
+    sms_outbox_retention: float = 604800.0
+    sms_outbox_cleanup_interval: float = 600.0
+    sms_outbox_cleanup_batch_size: int = 1000
+    sms_delivery_poll_interval: float = 1.0
+    sms_delivery_max_poll_interval: float = 30.0
+    sms_delivery_tracking_window: float = 600.0
 
     secret_key: SecretStr
 
     api_prefix: str = "/api/v1"
 
     jwt_token_prefix: str = "Token"
+    password_hashing_workers: int = 4
+    password_hash_rounds: int = 12
+    auth_mode: AuthMode = AuthMode.DATABASE
 
     allowed_hosts: List[str] = ["*"]
 
@@ -82,10 +143,69 @@ class AppSettings(BaseAppSettings):
 
         return url_string
 
+    @property
+    def database_engine_kwargs(self) -> Dict[str, Any]:
+        return {
+            "pool_size": self.min_connection_count,
+            "max_overflow": max(self.max_connection_count - self.min_connection_count, 0),
+            "pool_timeout": self.connection_pool_timeout,
+            "pool_recycle": self.connection_pool_recycle,
+            "pool_pre_ping": self.connection_pool_pre_ping,
+            "query_cache_size": self.database_query_cache_size,
+            "connect_args": {
+                "prepared_statement_cache_size": self.database_prepared_statement_cache_size,
+            },
+        }
+
+    @property
+    def query_budget_kwargs(self) -> Dict[str, Any]:
+        return {
+            "mode": self.database_query_budget_mode,
+            "max_queries": self.database_query_budget,
+            "max_duration": self.database_query_budget_duration,
+            "routes_max_queries": self.database_query_budget_routes,
+        }
+
+    @property
+    def sms_gateway_hosts(self) -> List[HttpUrl]:
+        return self.sms_api_hosts or [self.sms_api_host]
+
+    @property
+    def sms_client_kwargs(self) -> Dict[str, Any]:
+        return {
+            "timeout": self.sms_api_timeout,
+            "session_ttl": self.sms_session_ttl,
+            "max_connections": self.sms_max_connections,
+            "failure_threshold": self.sms_circuit_failure_threshold,
+            "reset_timeout": self.sms_circuit_reset_timeout,
+        }
+
+    @property
+    def sms_outbox_kwargs(self) -> Dict[str, Any]:
+        return {
+            "batch_size": self.sms_outbox_batch_size,
+            "max_attempts": self.sms_outbox_max_attempts,
+            "backoff": self.sms_outbox_backoff,
+            "max_backoff": self.sms_outbox_max_backoff,
+            "lease": self.sms_outbox_lease,
+        }
+
+    @property
+    def sms_delivery_kwargs(self) -> Dict[str, Any]:
+        return {
+            "poll_interval": self.sms_delivery_poll_interval,
+            "max_poll_interval": self.sms_delivery_max_poll_interval,
+            "window": self.sms_delivery_tracking_window,
+        }
+
     def configure_logging(self) -> None:
         logging.getLogger().handlers = [InterceptHandler()]
         for logger_name in self.loggers:
             logging_logger = logging.getLogger(logger_name)
             logging_logger.handlers = [InterceptHandler(level=self.logging_level)]
 
-        logger.configure(handlers=[{"sink": sys.stderr, "level": self.logging_level}])
+        handlers = [{"sink": sys.stderr, "level": self.logging_level, "filter": is_not_query_log}]
+        if self.database_query_log_mode != QueryLogMode.OFF:
+            handlers.append({"sink": sys.stderr, "level": self.logging_level, "filter": is_query_log, "enqueue": True})
+
+        logger.configure(handlers=handlers)
@@ -19,34 +19,64 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from app.core.settings.app import AppSettings
+from app.core.tasks import PeriodicTask
+from app.database.instrumentation import instrument_engine
+from app.database.query_log import QueryLogger
+from app.database.replicas import ReplicaPool
 
 
-async def connect_to_db(app: FastAPI, settings: AppSettings) -> AsyncSession:
+async def connect_to_db(app: FastAPI, settings: AppSettings) -> None:
     logger.info("Connecting to Postgres")
 
+    query_logger = QueryLogger(
+        settings.database_query_log_mode,
+        settings.database_query_log_sample_rate,
+        settings.database_query_log_slow_threshold
+    )
+
     engine = create_async_engine(
         settings.get_database_url,
-        echo=True
+        **settings.database_engine_kwargs
     )
+    instrument_engine(engine)
+    query_logger.attach(engine)
     app.state.engine = engine
 
-    async_session = sessionmaker(
+    app.state.session_maker = sessionmaker(
         bind=engine,
         expire_on_commit=False,
         class_=AsyncSession
     )
 
-    session = async_session()
+    replicas = ReplicaPool(
+        settings.database_replica_urls,
+        settings.database_replica_max_lag,
+        **settings.database_engine_kwargs
+    )
+    for replica_engine in replicas.engines:
+        instrument_engine(replica_engine)
+        query_logger.attach(replica_engine)
 
-    app.state.session = session
-    logger.info("Connection established")
+    app.state.replicas = replicas
+    app.state.replicas_lag_checker = PeriodicTask(
+        "replicas-lag-checker",
+        settings.database_replica_check_interval,
+        replicas.check_lag
+    )
+
+    if replicas.has_replicas:
+        logger.info("Connecting to read replicas")
+        await replicas.check_lag()
+        app.state.replicas_lag_checker.start()
 
-    return session
+    logger.info("Connection established")
 
 
 async def close_db_connection(app: FastAPI) -> None:
     logger.info("Closing connection to database")
 
+    await app.state.replicas_lag_checker.stop()
+    await app.state.replicas.dispose()
     await app.state.engine.dispose()
 
     logger.info("Connection closed")
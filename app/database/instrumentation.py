@@ -0,0 +1,90 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS, DefaultExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import metrics
+from app.database.query_counter import record_query
+
+COMPILED_CACHE_METRIC = "database.compiled_cache"
+PREPARED_STATEMENT_CACHE_METRIC = "database.prepared_statement_cache"
+QUERY_COUNTER_STARTED_AT = "_query_counter_started_at"
+
+metrics.register_hit_rate(COMPILED_CACHE_METRIC)
+metrics.register_hit_rate(PREPARED_STATEMENT_CACHE_METRIC)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_cache_usage)
+    event.listen(engine.sync_engine, "before_cursor_execute", _start_query_timer)
+    event.listen(engine.sync_engine, "after_cursor_execute", _count_query)
+
+
+def _count_cache_usage(
+        connection: Connection,
+        cursor,  # type: ignore
+        statement: str,
+        parameters,  # type: ignore
+        context: DefaultExecutionContext,
+        executemany: bool,
+) -> None:
+    if context.cache_hit is CACHE_HIT:
+        metrics.increment(f"{COMPILED_CACHE_METRIC}.hits")
+    elif context.cache_hit is CACHE_MISS:
+        metrics.increment(f"{COMPILED_CACHE_METRIC}.misses")
+
+    prepared_statement_cache = getattr(
+        connection.connection.dbapi_connection,
+        "_prepared_statement_cache",
+        None
+    )
+    if prepared_statement_cache is None or executemany:
+        return
+
+    # The asyncpg adapter caches statements after rewriting %s placeholders to $n.
+    if parameters is not None:
+        statement = statement % cursor._parameter_placeholders(parameters)
+
+    if statement in prepared_statement_cache:
+        metrics.increment(f"{PREPARED_STATEMENT_CACHE_METRIC}.hits")
+    else:
+        metrics.increment(f"{PREPARED_STATEMENT_CACHE_METRIC}.misses")
+
+
+def _start_query_timer(
+        connection: Connection,
+        cursor,  # type: ignore
+        statement: str,
+        parameters,  # type: ignore
+        context: DefaultExecutionContext,
+        executemany: bool,
+) -> None:
+    setattr(context, QUERY_COUNTER_STARTED_AT, perf_counter())
+
+
+def _count_query(
+        connection: Connection,
+        cursor,  # type: ignore
+        statement: str,
+        parameters,  # type: ignore
+        context: DefaultExecutionContext,
+        executemany: bool,
+) -> None:
+    record_query(perf_counter() - getattr(context, QUERY_COUNTER_STARTED_AT))
@@ -27,3 +27,4 @@ from .event_confirmation import EventConfirmationModel, EventConfirmationType
 from .profile import ProfileModel
 from .api_key import ApiKeyModel
 from .verification_code import VerificationCodeModel
+from .sms_outbox import SmsOutboxModel, SmsOutboxState
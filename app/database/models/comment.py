@@ -20,10 +20,11 @@ from app.database.base import Base
 
 class CommentModel(Base):
     __tablename__ = "comment"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
-    post_id = Column(Integer, ForeignKey("post.id"))
-    event_id = Column(Integer, ForeignKey("event.id"))
+    post_id = Column(Integer, ForeignKey("post.id"), index=True)
+    event_id = Column(Integer, ForeignKey("event.id"), index=True)
     author_id = Column(Integer, ForeignKey("user.id"), nullable=False)
 
     body = Column(String, nullable=False)
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum, func
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum, Index, func
 from sqlalchemy.orm import relationship
 
 from app.database.base import Base
@@ -21,6 +21,10 @@ from app.models.domain.event import EventState
 
 class EventModel(Base):
     __tablename__ = "event"
+    __table_args__ = (
+        Index("ix_event_event_state_started_at_id", "event_state", "started_at", "id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     author_id = Column(Integer, ForeignKey("user.id"), nullable=False)
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from sqlalchemy import Column, Integer, ForeignKey, Enum, func, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, Enum, Index, func, DateTime
 from sqlalchemy.orm import relationship
 
 from app.database.base import Base
@@ -21,6 +21,10 @@ from app.models.domain.event_confirmation import EventConfirmationType
 
 class EventConfirmationModel(Base):
     __tablename__ = "event_confirmation"
+    __table_args__ = (
+        Index("ix_event_confirmation_event_id_user_id", "event_id", "user_id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(Integer, ForeignKey("event.id"), nullable=False)
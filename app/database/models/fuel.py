@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from sqlalchemy import Boolean, Column, Integer, Enum, ForeignKey, Float, DateTime, func
+from sqlalchemy import Boolean, Column, Integer, Enum, ForeignKey, Float, DateTime, Index, func
 from sqlalchemy.orm import relationship
 
 from app.database.base import Base
@@ -21,6 +21,10 @@ from app.models.domain.fuel import FuelType
 
 class FuelModel(Base):
     __tablename__ = "fuel"
+    __table_args__ = (
+        Index("ix_fuel_vehicle_id_mileage", "vehicle_id", "mileage"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     vehicle_id = Column(Integer, ForeignKey("vehicle.id"), nullable=False)
@@ -19,6 +19,7 @@ from app.database.base import Base
 
 class LocationModel(Base):
     __tablename__ = "location"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     description = Column(String, nullable=False)
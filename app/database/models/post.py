@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
 
 from app.database.base import Base
@@ -20,6 +20,10 @@ from app.database.base import Base
 
 class PostModel(Base):
     __tablename__ = "post"
+    __table_args__ = (
+        Index("ix_post_created_at_id", "created_at", "id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     author_id = Column(Integer, ForeignKey("user.id"), nullable=False)
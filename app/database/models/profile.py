@@ -29,7 +29,7 @@ class ProfileModel(Base):
     __tablename__ = "profile"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
 
     email = Column(String)
     first_name = Column(String)
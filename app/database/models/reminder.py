@@ -20,9 +20,10 @@ from app.database.base import Base
 
 class ReminderModel(Base):
     __tablename__ = "reminder"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
-    vehicle_id = Column(Integer, ForeignKey("vehicle.id"), nullable=False)
+    vehicle_id = Column(Integer, ForeignKey("vehicle.id"), nullable=False, index=True)
     service_type_id = Column(Integer, ForeignKey("service_type.id"), nullable=False)
 
     next_mileage = Column(Integer, nullable=False)
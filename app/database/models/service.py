@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, func
+from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, Index, func
 from sqlalchemy.orm import relationship
 
 from app.database.base import Base
@@ -20,6 +20,10 @@ from app.database.base import Base
 
 class ServiceModel(Base):
     __tablename__ = "service"
+    __table_args__ = (
+        Index("ix_service_vehicle_id_mileage", "vehicle_id", "mileage"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     vehicle_id = Column(Integer, ForeignKey("vehicle.id"), nullable=False)
@@ -0,0 +1,43 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from sqlalchemy import Column, Integer, String, Enum, DateTime, Index, func
+
+from app.database.base import Base
+from app.models.domain.sms_outbox import SmsOutboxState
+
+
+class SmsOutboxModel(Base):
+    __tablename__ = "sms_outbox"
+    __table_args__ = (
+        Index("ix_sms_outbox_state_next_attempt_at", "state", "next_attempt_at"),
+        Index("ix_sms_outbox_state_sent_at", "state", "sent_at"),
+        Index("ix_sms_outbox_request_id", "request_id", unique=True),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    phone = Column(String, nullable=False)
+    message = Column(String, nullable=False)
+    state = Column(Enum(SmsOutboxState), nullable=False, default=SmsOutboxState.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_error = Column(String, nullable=True)
+    gateway = Column(String, nullable=True)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    request_id = Column(String, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -22,7 +22,7 @@ class VehicleModel(Base):
     __tablename__ = "vehicle"
 
     id = Column(Integer, primary_key=True, index=True)
-    owner_id = Column(Integer, ForeignKey("user.id"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
 
     brand = Column(String, nullable=False)
     model = Column(String, nullable=False)
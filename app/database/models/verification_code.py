@@ -12,13 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from sqlalchemy import Boolean, Column, Integer, String, DateTime, func
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, Index, func
 
 from app.database.base import Base
 
 
 class VerificationCodeModel(Base):
     __tablename__ = "verification_code"
+    __table_args__ = (
+        Index("ix_verification_code_phone_verification_code_is_verified", "phone", "verification_code", "is_verified"),
+        Index("ix_verification_code_created_at", "created_at"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -26,5 +31,6 @@ class VerificationCodeModel(Base):
     verification_code = Column(Integer, nullable=False)
 
     is_verified = Column(Boolean, default=False)
+    failed_attempts = Column(Integer, nullable=False, default=0)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,58 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Iterator, Optional
+
+
+class QueryBudgetMode(Enum):
+    OFF = "off"
+    WARN = "warn"
+    FAIL = "fail"
+
+
+class QueryStats:
+
+    def __init__(self, parent: Optional["QueryStats"] = None) -> None:
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+
+    def record(self, duration: float) -> None:
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats = stats.parent
+
+
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    stats = QueryStats(parent=query_stats.get())
+    token = query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
+
+
+def record_query(duration: float) -> None:
+    stats = query_stats.get()
+    if stats is not None:
+        stats.record(duration)
@@ -0,0 +1,130 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import sys
+from random import random
+from time import perf_counter
+from types import FrameType
+from typing import Iterator, Optional
+
+from greenlet import getcurrent
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.default import DefaultExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.context import get_route_name
+from app.core.logging import QUERY_LOG, QueryLogMode
+
+QUERY_STARTED_AT = "_query_started_at"
+REPOSITORIES_MODULE = "app.database.repositories."
+BASE_REPOSITORY_MODULE = "app.database.repositories.base"
+
+
+class QueryLogger:
+
+    def __init__(self, mode: QueryLogMode, sample_rate: float, slow_threshold: float) -> None:
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+
+    def attach(self, engine: AsyncEngine) -> None:
+        if self.mode == QueryLogMode.OFF:
+            return
+
+        event.listen(engine.sync_engine, "before_cursor_execute", self._start_timer)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._log_query)
+
+    def _start_timer(
+            self,
+            connection: Connection,
+            cursor,  # type: ignore
+            statement: str,
+            parameters,  # type: ignore
+            context: DefaultExecutionContext,
+            executemany: bool,
+    ) -> None:
+        setattr(context, QUERY_STARTED_AT, perf_counter())
+
+    def _log_query(
+            self,
+            connection: Connection,
+            cursor,  # type: ignore
+            statement: str,
+            parameters,  # type: ignore
+            context: DefaultExecutionContext,
+            executemany: bool,
+    ) -> None:
+        duration = perf_counter() - getattr(context, QUERY_STARTED_AT)
+
+        if self.mode == QueryLogMode.SLOW and duration < self.slow_threshold:
+            return
+        if self.mode == QueryLogMode.SAMPLED and random() >= self.sample_rate:
+            return
+
+        rows = cursor.rowcount if cursor.rowcount >= 0 else None
+        repository = _find_repository_method()
+        route = get_route_name()
+
+        logger.bind(
+            **{QUERY_LOG: True},
+            duration_ms=round(duration * 1000, 3),
+            rows=rows,
+            repository=repository,
+            route=route,
+        ).info(
+            "{0:.3f} ms, {1} rows, {2} ({3}): {4}",
+            duration * 1000,
+            rows,
+            repository,
+            route,
+            " ".join(statement.split()),
+        )
+
+
+def _find_repository_method() -> Optional[str]:
+    repository_method = None
+
+    for frame in _iter_frames():
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(REPOSITORIES_MODULE) or module == BASE_REPOSITORY_MODULE:
+            continue
+
+        repository = frame.f_locals.get("self")
+        owner = type(repository).__name__ if repository is not None else module
+        repository_method = "{0}.{1}".format(owner, frame.f_code.co_name)
+
+        if not frame.f_code.co_name.startswith("_"):
+            break
+
+    return repository_method
+
+
+def _iter_frames() -> Iterator[FrameType]:
+    # Async sessions run the sync engine inside a greenlet, the awaiting
+    # coroutines are on the stack of the parent greenlet.
+    frame: Optional[FrameType] = sys._getframe(1)  # noqa: WPS437
+    current = getcurrent()
+
+    while True:
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+
+        current = current.parent
+        if current is None:
+            return
+
+        frame = current.gr_frame
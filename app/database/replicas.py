@@ -0,0 +1,95 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from itertools import count
+from typing import List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+HAS_WRITES = "has_writes"
+
+REPLICATION_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+def mark_session_has_writes(session: AsyncSession) -> None:
+    session.info[HAS_WRITES] = True
+
+
+def session_has_writes(session: AsyncSession) -> bool:
+    return session.info.get(HAS_WRITES, False)
+
+
+class ReplicaPool:
+    def __init__(self, urls: List[str], max_lag: float, **engine_kwargs) -> None:
+        self._engines: List[AsyncEngine] = [create_async_engine(url, **engine_kwargs) for url in urls]
+        self._healthy_engines: List[AsyncEngine] = []
+        self._max_lag = max_lag
+        self._counter = count()
+
+        self._session_maker = sessionmaker(
+            expire_on_commit=False,
+            class_=AsyncSession
+        )
+
+    @property
+    def engines(self) -> List[AsyncEngine]:
+        return self._engines
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._engines)
+
+    def create_session(self) -> Optional[AsyncSession]:
+        engines = self._healthy_engines
+        if not engines:
+            return None
+
+        engine = engines[next(self._counter) % len(engines)]
+
+        return self._session_maker(bind=engine)
+
+    async def check_lag(self) -> None:
+        healthy_engines = []
+
+        for engine in self._engines:
+            try:
+                async with engine.connect() as connection:
+                    lag = (await connection.execute(REPLICATION_LAG_QUERY)).scalar()
+            except Exception as exception:
+                logger.warning("Replica {} is unavailable: {}", engine.url.host, exception)
+                continue
+
+            if lag > self._max_lag:
+                logger.warning("Replica {} is lagging by {} seconds", engine.url.host, lag)
+                continue
+
+            healthy_engines.append(engine)
+
+        self._healthy_engines = healthy_engines
+
+    async def dispose(self) -> None:
+        for engine in self._engines:
+            await engine.dispose()
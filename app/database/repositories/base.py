@@ -12,13 +12,92 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+
+from typing import Any, Dict, List, Optional, Type
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.selectable import CTE
+
+from app.database.base import Base
+from app.database.replicas import mark_session_has_writes, session_has_writes
+from app.database.unit_of_work import in_unit_of_work
 
 
 class BaseRepository:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, replica_session: Optional[AsyncSession] = None) -> None:
         self._session = session
+        self._replica_session = replica_session
 
     @property
     def session(self) -> AsyncSession:
-        return self._session
+        if self._replica_session is None or session_has_writes(self._session):
+            return self._session
+
+        return self._replica_session
+
+    async def _commit(self) -> None:
+        mark_session_has_writes(self._session)
+
+        if in_unit_of_work(self._session):
+            await self._session.flush()
+        else:
+            await self._session.commit()
+
+    async def _execute_write(self, query: ClauseElement) -> Result:
+        mark_session_has_writes(self._session)
+
+        result = await self._session.execute(query)
+        await self._commit()
+
+        return result
+
+    async def _execute_update(self, query: ClauseElement) -> Optional[Base]:
+        result = await self._execute_write(query.execution_options(populate_existing=True))
+
+        return result.scalars().first()
+
+    async def _execute_delete(self, model: Type[Base], whereclause: ClauseElement) -> Optional[int]:
+        table = model.__table__
+        result = await self._execute_write(delete(table).where(whereclause).returning(table.c.id))
+
+        return result.scalar()
+
+    async def _execute_insert(self, model: Type[Base], rows: List[Dict[str, Any]]) -> None:
+        if rows:
+            await self._execute_write(insert(model.__table__).values(rows))
+
+    async def _allocate_ids(self, model: Type[Base], count: int) -> List[int]:
+        table = model.__table__
+        sequence = func.pg_get_serial_sequence(table.name, table.c.id.name)
+        query = select(func.nextval(sequence)).select_from(func.generate_series(1, count))
+
+        mark_session_has_writes(self._session)
+
+        result = await self.session.execute(query)
+
+        return result.scalars().all()
+
+    @staticmethod
+    def _get_update_values(**values: Any) -> Dict[str, Any]:
+        return {name: value for name, value in values.items() if value is not None}
+
+    @staticmethod
+    def _insert_returning(model: Type[Base], values: Dict[str, Any]) -> CTE:
+        table = model.__table__
+        query = insert(table).values(**values).returning(*table.columns)
+
+        return query.cte(f"inserted_{table.name}")
+
+    @staticmethod
+    def _update_returning(model: Type[Base], whereclause: ClauseElement, values: Dict[str, Any]) -> CTE:
+        table = model.__table__
+
+        if not values:
+            query = select(table).where(whereclause)
+        else:
+            query = update(table).where(whereclause).values(**values).returning(*table.columns)
+
+        return query.cte(f"updated_{table.name}")
@@ -12,11 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List
+from typing import List, Optional
 
 from loguru import logger
 from sqlalchemy import select, and_
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
 
 from app.database.errors import (
     EntityDoesNotExists,
@@ -41,12 +41,12 @@ class CommentsRepository(BaseRepository):
         self.session.add(new_comment)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             logger.error(exception)
             raise EntityCreateError from exception
 
-        return await self.get_comment_by_id_and_post_id(new_comment.id, post_id)
+        return self._convert_comment_model_to_comment(new_comment, author=user)
 
     async def create_comment_by_event_id_and_user(self, event_id: int, user: User, *, body: str) -> Comment:
         new_comment = CommentModel()
@@ -57,12 +57,12 @@ class CommentsRepository(BaseRepository):
         self.session.add(new_comment)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             logger.error(exception)
             raise EntityCreateError from exception
 
-        return await self.get_comment_by_id_and_event_id(new_comment.id, event_id)
+        return self._convert_comment_model_to_comment(new_comment, author=user)
 
     async def get_comment_by_id(self, comment_id: int) -> Comment:
         query = select(CommentModel).where(
@@ -139,48 +139,53 @@ class CommentsRepository(BaseRepository):
         return [self._convert_comment_model_to_comment(comment_in_db) for comment_in_db in comments_in_db]
 
     async def update_comment_by_id_and_user(self, comment_id: int, user: User, *, body: str) -> Comment:
-        comment_in_db: CommentModel = await self._get_comment_model_by_id_and_user(comment_id, user)
-        comment_in_db.body = body
+        updated_comment_rows = self._update_returning(
+            CommentModel,
+            and_(
+                CommentModel.id == comment_id,
+                CommentModel.author_id == user.id
+            ),
+            self._get_update_values(body=body)
+        )
+        updated_comment = aliased(CommentModel, updated_comment_rows)
+        query = select(updated_comment).options(
+            joinedload(updated_comment.author)
+        )
 
         try:
-            await self.session.commit()
+            comment_in_db = await self._execute_update(query)
         except Exception as exception:
             logger.error(exception)
             raise EntityUpdateError from exception
 
+        if not comment_in_db:
+            raise EntityDoesNotExists
+
         return self._convert_comment_model_to_comment(comment_in_db)
 
     async def delete_comment_by_id_and_user(self, comment_id: int, user: User) -> None:
-        comment_in_db = await self._get_comment_model_by_id_and_user(comment_id, user)
-
         try:
-            await self.session.delete(comment_in_db)
-            await self.session.commit()
+            deleted_comment_id = await self._execute_delete(
+                CommentModel,
+                and_(
+                    CommentModel.id == comment_id,
+                    CommentModel.author_id == user.id
+                )
+            )
         except Exception as exception:
             logger.error(exception)
             raise EntityDeleteError from exception
 
-    async def _get_comment_model_by_id_and_user(self, comment_id: int, user: User) -> CommentModel:
-        query = select(CommentModel).where(
-            and_(
-                CommentModel.id == comment_id,
-                CommentModel.author_id == user.id
-            )
-        ).options(
-            joinedload(CommentModel.author)
-        )
-
-        result = await self.session.execute(query)
-
-        comment_in_db: CommentModel = result.scalars().first()
-        if not comment_in_db:
+        if deleted_comment_id is None:
             raise EntityDoesNotExists
 
-        return comment_in_db
-
     @staticmethod
-    def _convert_comment_model_to_comment(comment_model: CommentModel) -> Comment:
-        author = User(**comment_model.author.__dict__)
+    def _convert_comment_model_to_comment(comment_model: CommentModel, author: Optional[User] = None) -> Comment:
+        if author is None:
+            author = User(**comment_model.author.__dict__)
+        else:
+            author = User(**author.dict())
+
         comment = Comment(
             id=comment_model.id,
             author=author,
@@ -17,10 +17,11 @@ from datetime import datetime
 from typing import (
     List,
     Optional,
+    Tuple,
 )
 
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, and_, tuple_
+from sqlalchemy.orm import aliased, joinedload, contains_eager
 
 from app.database.errors import (
     EntityDoesNotExists,
@@ -43,9 +44,9 @@ from app.models.domain.user import User
 
 class EventsRepository(BaseRepository):
 
-    async def create_event_by_user_id(
+    async def create_event_by_user(
             self,
-            user_id: int,
+            user: User,
             *,
             title: str,
             body: str,
@@ -60,7 +61,7 @@ class EventsRepository(BaseRepository):
         new_location.longitude = location.longitude
 
         new_event = EventModel()
-        new_event.author_id = user_id
+        new_event.author_id = user.id
         new_event.title = title
         new_event.description = description
         new_event.thumbnail = thumbnail
@@ -72,12 +73,12 @@ class EventsRepository(BaseRepository):
         self.session.add(new_event)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             logger.error(exception)
             raise EntityCreateError from exception
 
-        return await self.get_event_by_id(new_event.id)
+        return self._convert_event_model_to_event(new_event, author=user)
 
     async def get_event_by_id(self, event_id: int) -> Event:
         event_in_db = await self._get_event_model_by_id(event_id)
@@ -106,12 +107,21 @@ class EventsRepository(BaseRepository):
             state: Optional[EventState] = EventState.PLANNED,
             limit: int = 20,
             offset: int = 0,
+            after: Optional[Tuple[datetime, int]] = None,
     ) -> List[Event]:
-        query = select(EventModel).where(EventModel.event_state == state).limit(limit).offset(offset).options(
+        query = select(EventModel).where(EventModel.event_state == state).order_by(
+            EventModel.started_at,
+            EventModel.id,
+        ).limit(limit).options(
             joinedload(EventModel.author),
             joinedload(EventModel.location)
         )
 
+        if after:
+            query = query.where(tuple_(EventModel.started_at, EventModel.id) > after)
+        else:
+            query = query.offset(offset)
+
         result = await self.session.execute(query)
         events_in_db = result.scalars().all()
 
@@ -130,53 +140,74 @@ class EventsRepository(BaseRepository):
             location: Optional[Location] = None,
             event_state: Optional[EventState] = None,
     ) -> Event:
-        event_in_db: EventModel = await self._get_event_model_by_id_and_user_id(event_id, user_id)
-        event_in_db.title = title or event_in_db.title
-        event_in_db.description = description or event_in_db.description
-        event_in_db.thumbnail = thumbnail or event_in_db.thumbnail
-        event_in_db.body = body or event_in_db.body
-        event_in_db.event_state = event_state or event_in_db.event_state
-        event_in_db.started_at = started_at or event_in_db.started_at
+        event_values = self._get_update_values(
+            title=title,
+            description=description,
+            thumbnail=thumbnail,
+            body=body,
+            event_state=event_state,
+            started_at=started_at,
+        )
+        updated_event_rows = self._update_returning(
+            EventModel,
+            and_(
+                EventModel.id == event_id,
+                EventModel.author_id == user_id
+            ),
+            event_values
+        )
+        updated_event = aliased(EventModel, updated_event_rows)
+        query = select(updated_event).options(
+            joinedload(updated_event.author)
+        )
 
         if location:
-            event_in_db.location.description = location.description or event_in_db.location.description
-            event_in_db.location.latitude = location.latitude or event_in_db.location.latitude
-            event_in_db.location.longitude = location.longitude or event_in_db.location.longitude
+            location_values = self._get_update_values(
+                description=location.description,
+                latitude=location.latitude,
+                longitude=location.longitude,
+            )
+            updated_location_rows = self._update_returning(
+                LocationModel,
+                LocationModel.id == updated_event_rows.c.location_id,
+                location_values
+            )
+            updated_location = aliased(LocationModel, updated_location_rows)
+            query = query.join(updated_location, updated_event.location).options(
+                contains_eager(updated_event.location.of_type(updated_location))
+            )
+        else:
+            query = query.options(
+                joinedload(updated_event.location)
+            )
 
         try:
-            await self.session.commit()
+            event_in_db = await self._execute_update(query)
         except Exception as exception:
             raise EntityUpdateError from exception
 
-        return await self.get_event_by_id(event_id)
+        if not event_in_db:
+            raise EntityDoesNotExists
 
-    async def delete_event_by_id_and_user_id(self, event_id: int, user_id: int) -> None:
-        event: EventModel = await self._get_event_model_by_id_and_user_id(event_id, user_id)
+        return self._convert_event_model_to_event(event_in_db)
 
+    async def delete_event_by_id_and_user_id(self, event_id: int, user_id: int) -> None:
         try:
-            await self.session.delete(event)
-            await self.session.commit()
+            deleted_event_id = await self._execute_delete(
+                EventModel,
+                and_(
+                    EventModel.id == event_id,
+                    EventModel.author_id == user_id
+                )
+            )
         except Exception as exception:
             raise EntityDeleteError from exception
 
-    async def _get_event_model_by_id(self, event_id: int) -> EventModel:
-        query = select(EventModel).where(EventModel.id == event_id).options(
-            joinedload(EventModel.author),
-            joinedload(EventModel.location)
-        )
-        result = await self.session.execute(query)
-
-        event_model_in_db: EventModel = result.scalars().first()
-        if not event_model_in_db:
+        if deleted_event_id is None:
             raise EntityDoesNotExists
 
-        return event_model_in_db
-
-    async def _get_event_model_by_id_and_user_id(self, event_id: int, user_id: int) -> EventModel:
-        query = select(EventModel).where(
-            EventModel.id == event_id,
-            EventModel.author_id == user_id
-        ).options(
+    async def _get_event_model_by_id(self, event_id: int) -> EventModel:
+        query = select(EventModel).where(EventModel.id == event_id).options(
             joinedload(EventModel.author),
             joinedload(EventModel.location)
         )
@@ -189,8 +220,12 @@ class EventsRepository(BaseRepository):
         return event_model_in_db
 
     @staticmethod
-    def _convert_event_model_to_event(event_model: EventModel) -> Event:
-        author = User(**event_model.author.__dict__)
+    def _convert_event_model_to_event(event_model: EventModel, author: Optional[User] = None) -> Event:
+        if author is None:
+            author = User(**event_model.author.__dict__)
+        else:
+            author = User(**author.dict())
+
         location = Location(**event_model.location.__dict__)
 
         event = Event(
@@ -15,7 +15,7 @@
 from typing import Optional
 
 from sqlalchemy import select, and_
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
 
 from app.database.errors import (
     EntityDoesNotExists,
@@ -36,22 +36,22 @@ class EventConfirmationsRepository(BaseRepository):
     async def create_confirmation_by_event_id_for_user(
             self,
             event_id: int,
-            user_id: int,
+            user: User,
             event_confirmation: EventConfirmationType
     ) -> EventConfirmation:
         new_event_confirmation = EventConfirmationModel()
         new_event_confirmation.event_id = event_id
-        new_event_confirmation.user_id = user_id
+        new_event_confirmation.user_id = user.id
         new_event_confirmation.confirmation_type = event_confirmation
 
         self.session.add(new_event_confirmation)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             raise EntityCreateError from exception
 
-        return await self.get_confirmation_by_event_id_and_user_id(event_id, user_id)
+        return self._convert_confirmation_model_to_conformation(new_event_confirmation, user=user)
 
     async def get_confirmation_by_event_id_and_user_id(self, event_id: int, user_id: int) -> EventConfirmation:
         event_confirmation_in_db = await self._get_confirmation_model_by_event_id_and_user_id(event_id, user_id)
@@ -64,15 +64,28 @@ class EventConfirmationsRepository(BaseRepository):
             user_id: int,
             event_confirmation: Optional[EventConfirmationType] = None
     ) -> EventConfirmation:
-        event_confirmation_in_db = await self._get_confirmation_model_by_event_id_and_user_id(event_id, user_id)
-        event_confirmation_in_db.event_confirmation = event_confirmation or event_confirmation_in_db.event_confirmation
+        updated_confirmation_rows = self._update_returning(
+            EventConfirmationModel,
+            and_(
+                EventConfirmationModel.event_id == event_id,
+                EventConfirmationModel.user_id == user_id,
+            ),
+            self._get_update_values(confirmation_type=event_confirmation)
+        )
+        updated_confirmation = aliased(EventConfirmationModel, updated_confirmation_rows)
+        query = select(updated_confirmation).options(
+            joinedload(updated_confirmation.user)
+        )
 
         try:
-            await self.session.commit()
+            event_confirmation_in_db = await self._execute_update(query)
         except Exception as exception:
             raise EntityUpdateError from exception
 
-        return await self.get_confirmation_by_event_id_and_user_id(event_id, user_id)
+        if not event_confirmation_in_db:
+            raise EntityDoesNotExists
+
+        return self._convert_confirmation_model_to_conformation(event_confirmation_in_db)
 
     async def _get_confirmation_model_by_event_id_and_user_id(
             self, event_id: int, user_id: int
@@ -94,8 +107,14 @@ class EventConfirmationsRepository(BaseRepository):
         return event_confirmation_in_db
 
     @staticmethod
-    def _convert_confirmation_model_to_conformation(confirmation: EventConfirmationModel) -> EventConfirmation:
-        user = User(**confirmation.user.__dict__)
+    def _convert_confirmation_model_to_conformation(
+            confirmation: EventConfirmationModel,
+            user: Optional[User] = None,
+    ) -> EventConfirmation:
+        if user is None:
+            user = User(**confirmation.user.__dict__)
+        else:
+            user = User(**user.dict())
 
         event_confirmation = EventConfirmation(
             user=user,
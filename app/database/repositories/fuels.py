@@ -12,16 +12,22 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
+from loguru import logger
 from sqlalchemy import (
     select,
     and_,
+    func,
+    lambda_stmt,
 )
 from sqlalchemy.orm import (
     Session,
+    aliased,
     selectinload,
+    joinedload,
+    contains_eager,
 )
 
 from app.database.errors import (
@@ -73,11 +79,66 @@ class FuelsRepository(BaseRepository):
         self.session.add(new_fuel)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             raise EntityCreateError from exception
 
-        return await self.get_fuel_by_id_and_vehicle_id(new_fuel.id, vehicle_id)
+        return self._convert_fuel_model_to_fuel(new_fuel)
+
+    async def create_fuels_by_vehicle_id(self, vehicle_id: int, fuels: List[Dict[str, Any]]) -> List[Optional[int]]:
+        fuels_keys = await self._get_fuels_keys_by_vehicle_id(vehicle_id, [fuel["mileage"] for fuel in fuels])
+
+        created_fuel_ids: List[Optional[int]] = [None] * len(fuels)
+        new_fuels_indexes = []
+        for index, fuel in enumerate(fuels):
+            fuel_key = (fuel["mileage"], fuel["fuel_type"], fuel["quantity"])
+            if fuel_key not in fuels_keys:
+                fuels_keys.add(fuel_key)
+                new_fuels_indexes.append(index)
+
+        if not new_fuels_indexes:
+            return created_fuel_ids
+
+        new_fuels = [fuels[index] for index in new_fuels_indexes]
+
+        location_ids = await self._allocate_ids(LocationModel, len(new_fuels))
+        fuel_ids = await self._allocate_ids(FuelModel, len(new_fuels))
+
+        location_rows = [
+            {
+                "id": location_id,
+                "description": fuel["location"].description,
+                "latitude": fuel["location"].latitude,
+                "longitude": fuel["location"].longitude,
+            }
+            for location_id, fuel in zip(location_ids, new_fuels)
+        ]
+        fuel_rows = [
+            {
+                "id": fuel_id,
+                "vehicle_id": vehicle_id,
+                "location_id": location_id,
+                "quantity": fuel["quantity"],
+                "price": fuel["price"],
+                "mileage": fuel["mileage"],
+                "fuel_type": fuel["fuel_type"],
+                "is_full": fuel["is_full"],
+                "created_at": fuel.get("created_at") or func.now(),
+            }
+            for fuel_id, location_id, fuel in zip(fuel_ids, location_ids, new_fuels)
+        ]
+
+        try:
+            await self._execute_insert(LocationModel, location_rows)
+            await self._execute_insert(FuelModel, fuel_rows)
+        except Exception as exception:
+            logger.error(exception)
+            raise EntityCreateError from exception
+
+        for index, fuel_id in zip(new_fuels_indexes, fuel_ids):
+            created_fuel_ids[index] = fuel_id
+
+        return created_fuel_ids
 
     async def get_fuels_by_vehicle_id(self, vehicle_id: int) -> List[Fuel]:
         query = select(FuelModel).where(
@@ -91,6 +152,21 @@ class FuelsRepository(BaseRepository):
 
         return [self._convert_fuel_model_to_fuel(fuel_in_db) for fuel_in_db in fuels_in_db]
 
+    async def stream_fuels_by_vehicle_id(self, vehicle_id: int, chunk_size: int = 500) -> AsyncIterator[Fuel]:
+        query = select(FuelModel).where(
+            FuelModel.vehicle_id == vehicle_id
+        ).order_by(
+            FuelModel.id
+        ).options(
+            joinedload(FuelModel.location)
+        ).execution_options(
+            yield_per=chunk_size
+        )
+        result = await self.session.stream(query)
+
+        async for fuel_in_db in result.scalars():
+            yield self._convert_fuel_model_to_fuel(fuel_in_db)
+
     async def get_fuel_by_id_and_vehicle_id(self, fuel_id: int, vehicle_id: int) -> Fuel:
         fuel_in_db = await self._get_fuel_model_by_id_and_vehicle_id(fuel_id, vehicle_id)
 
@@ -108,42 +184,92 @@ class FuelsRepository(BaseRepository):
             location: Optional[Location] = None,
             is_full: Optional[bool] = None,
     ) -> Fuel:
-        fuel_in_db = await self._get_fuel_model_by_id_and_vehicle_id(fuel_id, vehicle_id)
-        fuel_in_db.quantity = quantity or fuel_in_db.quantity
-        fuel_in_db.price = price or fuel_in_db.price
-        fuel_in_db.mileage = mileage or fuel_in_db.mileage
-        fuel_in_db.fuel_type = fuel_type or fuel_in_db.fuel_type
-        fuel_in_db.is_full = is_full or fuel_in_db.is_full
+        fuel_values = self._get_update_values(
+            quantity=quantity,
+            price=price,
+            mileage=mileage,
+            fuel_type=fuel_type,
+            is_full=is_full,
+        )
+        updated_fuel_rows = self._update_returning(
+            FuelModel,
+            and_(
+                FuelModel.id == fuel_id,
+                FuelModel.vehicle_id == vehicle_id
+            ),
+            fuel_values
+        )
+        updated_fuel = aliased(FuelModel, updated_fuel_rows)
+        query = select(updated_fuel)
 
         if location:
-            fuel_in_db.location.description = location.description or fuel_in_db.location.description
-            fuel_in_db.location.latitude = location.latitude or fuel_in_db.location.latitude
-            fuel_in_db.location.longitude = location.longitude or fuel_in_db.location.longitude
+            location_values = self._get_update_values(
+                description=location.description,
+                latitude=location.latitude,
+                longitude=location.longitude,
+            )
+            updated_location_rows = self._update_returning(
+                LocationModel,
+                LocationModel.id == updated_fuel_rows.c.location_id,
+                location_values
+            )
+            updated_location = aliased(LocationModel, updated_location_rows)
+            query = query.join(updated_location, updated_fuel.location).options(
+                contains_eager(updated_fuel.location.of_type(updated_location))
+            )
+        else:
+            query = query.options(
+                joinedload(updated_fuel.location)
+            )
 
         try:
-            await self.session.commit()
+            fuel_in_db = await self._execute_update(query)
         except Exception as exception:
             raise EntityUpdateError from exception
 
-        return await self.get_fuel_by_id_and_vehicle_id(fuel_id, vehicle_id)
+        if not fuel_in_db:
+            raise EntityDoesNotExists
 
-    async def delete_fuel_by_id_and_vehicle_id(self, fuel_id: int, vehicle_id: int) -> None:
-        fuel_in_db = await self._get_fuel_model_by_id_and_vehicle_id(fuel_id, vehicle_id)
+        return self._convert_fuel_model_to_fuel(fuel_in_db)
 
+    async def delete_fuel_by_id_and_vehicle_id(self, fuel_id: int, vehicle_id: int) -> None:
         try:
-            await self.session.delete(fuel_in_db)
-            await self.session.commit()
+            deleted_fuel_id = await self._execute_delete(
+                FuelModel,
+                and_(
+                    FuelModel.id == fuel_id,
+                    FuelModel.vehicle_id == vehicle_id
+                )
+            )
         except Exception as exception:
             raise EntityDeleteError from exception
 
-    async def _get_fuel_model_by_id_and_vehicle_id(self, fuel_id: int, vehicle_id: int) -> FuelModel:
-        query = select(FuelModel).where(
+        if deleted_fuel_id is None:
+            raise EntityDoesNotExists
+
+    async def _get_fuels_keys_by_vehicle_id(
+            self, vehicle_id: int, mileages: List[int]
+    ) -> Set[Tuple[int, FuelType, float]]:
+        query = select(FuelModel.mileage, FuelModel.fuel_type, FuelModel.quantity).where(
             and_(
-                FuelModel.id == fuel_id,
-                FuelModel.vehicle_id == vehicle_id
+                FuelModel.vehicle_id == vehicle_id,
+                FuelModel.mileage.in_(mileages)
+            )
+        )
+        result = await self.session.execute(query)
+
+        return {tuple(row) for row in result.all()}
+
+    async def _get_fuel_model_by_id_and_vehicle_id(self, fuel_id: int, vehicle_id: int) -> FuelModel:
+        query = lambda_stmt(
+            lambda: select(FuelModel).where(
+                and_(
+                    FuelModel.id == fuel_id,
+                    FuelModel.vehicle_id == vehicle_id
+                )
+            ).options(
+                joinedload(FuelModel.location)
             )
-        ).options(
-            selectinload(FuelModel.location)
         )
         result = await self.session.execute(query)
 
@@ -162,6 +288,7 @@ class FuelsRepository(BaseRepository):
             longitude=fuel_model.location.longitude
         )
         fuel = Fuel(
+            id=fuel_model.id,
             fuel_type=fuel_model.fuel_type,
             quantity=fuel_model.quantity,
             price=fuel_model.price,
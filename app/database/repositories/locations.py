@@ -34,11 +34,11 @@ class LocationsRepository(BaseRepository):
         self.session.add(new_location)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             raise EntityCreateError from exception
 
-        return await self.get_location_by_id(new_location.id)
+        return self._convert_location_model_to_location(new_location)
 
     async def get_location_by_id(self, location_id: int) -> Location:
         location_in_db = await self._get_location_model_by_id(location_id)
@@ -59,7 +59,7 @@ class LocationsRepository(BaseRepository):
         location_in_db.longitude = longitude or location_in_db.longitude
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             raise EntityUpdateError from exception
 
@@ -70,7 +70,7 @@ class LocationsRepository(BaseRepository):
 
         try:
             await self.session.delete(location)
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             raise EntityDeleteError from exception
 
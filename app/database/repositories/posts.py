@@ -12,10 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from sqlalchemy import select, and_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import select, and_, tuple_
+from sqlalchemy.orm import aliased, joinedload
 
 from app.database.errors import (
     EntityDoesNotExists,
@@ -31,9 +32,9 @@ from app.models.domain.user import User
 
 class PostsRepository(BaseRepository):
 
-    async def create_post_by_user_id(
+    async def create_post_by_user(
             self,
-            user_id: int,
+            user: User,
             *,
             title: str,
             body: str,
@@ -41,7 +42,7 @@ class PostsRepository(BaseRepository):
             thumbnail: Optional[str] = None,
     ) -> Post:
         new_post = PostModel()
-        new_post.author_id = user_id
+        new_post.author_id = user.id
         new_post.title = title
         new_post.description = description
         new_post.thumbnail = thumbnail
@@ -50,11 +51,11 @@ class PostsRepository(BaseRepository):
         self.session.add(new_post)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             raise EntityCreateError from exception
 
-        return await self.get_post_by_id(new_post.id)
+        return self._convert_post_model_to_post(new_post, author=user)
 
     async def get_post_by_id(self, post_id: int) -> Post:
         query = select(PostModel).where(
@@ -88,11 +89,20 @@ class PostsRepository(BaseRepository):
             self,
             limit: int = 20,
             offset: int = 0,
+            after: Optional[Tuple[datetime, int]] = None,
     ) -> List[Post]:
-        query = select(PostModel).limit(limit).offset(offset).options(
+        query = select(PostModel).order_by(
+            PostModel.created_at.desc(),
+            PostModel.id.desc(),
+        ).limit(limit).options(
             joinedload(PostModel.author)
         )
 
+        if after:
+            query = query.where(tuple_(PostModel.created_at, PostModel.id) < after)
+        else:
+            query = query.offset(offset)
+
         result = await self.session.execute(query)
         posts_in_db: List[PostModel] = result.scalars().all()
 
@@ -108,49 +118,57 @@ class PostsRepository(BaseRepository):
             thumbnail: Optional[str] = None,
             body: Optional[str] = None
     ) -> Post:
-        post_in_db = await self._get_post_model_by_id_and_user_id(post_id, user_id)
-        post_in_db.title = title or post_in_db.title
-        post_in_db.description = description or post_in_db.description
-        post_in_db.thumbnail = thumbnail or post_in_db.thumbnail
-        post_in_db.body = body or post_in_db.body
+        post_values = self._get_update_values(
+            title=title,
+            description=description,
+            thumbnail=thumbnail,
+            body=body,
+        )
+        updated_post_rows = self._update_returning(
+            PostModel,
+            and_(
+                PostModel.id == post_id,
+                PostModel.author_id == user_id,
+            ),
+            post_values
+        )
+        updated_post = aliased(PostModel, updated_post_rows)
+        query = select(updated_post).options(
+            joinedload(updated_post.author)
+        )
 
         try:
-            await self.session.commit()
+            post_in_db = await self._execute_update(query)
         except Exception as exception:
             raise EntityUpdateError from exception
 
-        return await self.get_post_by_id(post_in_db.id)
+        if not post_in_db:
+            raise EntityDoesNotExists
 
-    async def delete_post_by_id_and_user_id(self, post_id: int, user_id: int) -> None:
-        post_in_db = await self._get_post_model_by_id_and_user_id(post_id, user_id)
+        return self._convert_post_model_to_post(post_in_db)
 
+    async def delete_post_by_id_and_user_id(self, post_id: int, user_id: int) -> None:
         try:
-            await self.session.delete(post_in_db)
-            await self.session.commit()
+            deleted_post_id = await self._execute_delete(
+                PostModel,
+                and_(
+                    PostModel.id == post_id,
+                    PostModel.author_id == user_id,
+                )
+            )
         except Exception as exception:
             raise EntityDeleteError from exception
 
-    async def _get_post_model_by_id_and_user_id(self, post_id: int, user_id: int) -> PostModel:
-        query = select(PostModel).where(
-            and_(
-                PostModel.id == post_id,
-                PostModel.author_id == user_id,
-            )
-        ).options(
-            joinedload(PostModel.author)
-        )
-
-        result = await self.session.execute(query)
-
-        post_model_in_db: PostModel = result.scalars().first()
-        if not post_model_in_db:
+        if deleted_post_id is None:
             raise EntityDoesNotExists
 
-        return post_model_in_db
-
     @staticmethod
-    def _convert_post_model_to_post(post_model: PostModel) -> Post:
-        author: User = User(**post_model.author.__dict__)
+    def _convert_post_model_to_post(post_model: PostModel, author: Optional[User] = None) -> Post:
+        if author is None:
+            author = User(**post_model.author.__dict__)
+        else:
+            author = User(**author.dict())
+
         post: Post = Post(
             id=post_model.id,
             author=author,
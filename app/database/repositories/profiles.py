@@ -55,7 +55,7 @@ class ProfilesRepository(BaseRepository):
         self.session.add(new_profile)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             raise EntityCreateError from exception
 
@@ -78,8 +78,13 @@ class ProfilesRepository(BaseRepository):
 
         return Profile(**profile_in_db.__dict__)
 
-    async def get_profiles_with_filter(self, limit: int, offset: int) -> List[Profile]:
-        query = select(ProfileModel).limit(limit).offset(offset)
+    async def get_profiles_with_filter(self, limit: int, offset: int, after: Optional[int] = None) -> List[Profile]:
+        query = select(ProfileModel).order_by(ProfileModel.id).limit(limit)
+
+        if after:
+            query = query.where(ProfileModel.id > after)
+        else:
+            query = query.offset(offset)
         result = await self.session.execute(query)
 
         profiles_in_db = result.scalars().all()
@@ -108,7 +113,7 @@ class ProfilesRepository(BaseRepository):
         profile_in_db.image = image or profile_in_db.image
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             raise EntityUpdateError from exception
 
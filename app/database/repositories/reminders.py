@@ -19,8 +19,9 @@ from datetime import date
 from sqlalchemy import (
     select,
     and_,
+    lambda_stmt,
 )
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload, joinedload
 
 from app.database.errors import (
     EntityDoesNotExists,
@@ -46,21 +47,28 @@ class RemindersRepository(BaseRepository):
             next_mileage: int,
             next_date: date,
     ) -> Reminder:
-        new_reminder = ReminderModel()
-        new_reminder.vehicle_id = vehicle_id
-        new_reminder.service_type_id = service_type_id
-        new_reminder.next_mileage = next_mileage
-        new_reminder.next_date = next_date
-
-        self.session.add(new_reminder)
+        inserted_reminder_rows = self._insert_returning(
+            ReminderModel,
+            dict(
+                vehicle_id=vehicle_id,
+                service_type_id=service_type_id,
+                next_mileage=next_mileage,
+                next_date=next_date,
+            )
+        )
+        inserted_reminder = aliased(ReminderModel, inserted_reminder_rows)
+        # The service type comes back joined to the INSERT ... RETURNING, not from a separate lookup.
+        query = select(inserted_reminder).options(
+            joinedload(inserted_reminder.service_type)
+        )
 
         try:
-            await self.session.commit()
+            result = await self._execute_write(query)
         except Exception as exception:
             logger.error(exception)
             raise EntityCreateError from exception
 
-        return await self.get_reminder_by_id_and_vehicle_id(new_reminder.id, vehicle_id)
+        return self._convert_reminder_model_to_reminder(result.scalars().first())
 
     async def get_reminders_by_vehicle_id(self, vehicle_id: int) -> List[Reminder]:
         query = select(ReminderModel).where(
@@ -88,37 +96,61 @@ class RemindersRepository(BaseRepository):
             next_mileage: Optional[int] = None,
             next_date: Optional[date] = None,
     ) -> Reminder:
-        reminder_in_db = await self._get_reminder_model_by_id_and_vehicle_id(reminder_id, vehicle_id)
-        reminder_in_db.service_type_id = service_type_id or reminder_in_db.service_type_id
-        reminder_in_db.next_mileage = next_mileage or reminder_in_db.next_mileage
-        reminder_in_db.next_date = next_date or reminder_in_db.next_date
+        reminder_values = self._get_update_values(
+            service_type_id=service_type_id,
+            next_mileage=next_mileage,
+            next_date=next_date,
+        )
+        updated_reminder_rows = self._update_returning(
+            ReminderModel,
+            and_(
+                ReminderModel.id == reminder_id,
+                ReminderModel.vehicle_id == vehicle_id
+            ),
+            reminder_values
+        )
+        updated_reminder = aliased(ReminderModel, updated_reminder_rows)
+        query = select(updated_reminder).options(
+            joinedload(updated_reminder.service_type)
+        )
 
         try:
-            await self.session.commit()
+            reminder_in_db = await self._execute_update(query)
         except Exception as exception:
             logger.error(exception)
             raise EntityUpdateError from exception
 
-        return await self.get_reminder_by_id_and_vehicle_id(reminder_id, vehicle_id)
+        if not reminder_in_db:
+            raise EntityDoesNotExists
 
-    async def delete_reminder_by_id_and_vehicle_id(self, reminder_id: int, vehicle_id: int) -> None:
-        reminder_in_db = await self._get_reminder_model_by_id_and_vehicle_id(reminder_id, vehicle_id)
+        return self._convert_reminder_model_to_reminder(reminder_in_db)
 
+    async def delete_reminder_by_id_and_vehicle_id(self, reminder_id: int, vehicle_id: int) -> None:
         try:
-            await self.session.delete(reminder_in_db)
-            await self.session.commit()
+            deleted_reminder_id = await self._execute_delete(
+                ReminderModel,
+                and_(
+                    ReminderModel.id == reminder_id,
+                    ReminderModel.vehicle_id == vehicle_id
+                )
+            )
         except Exception as exception:
             logger.error(exception)
             raise EntityDeleteError from exception
 
+        if deleted_reminder_id is None:
+            raise EntityDoesNotExists
+
     async def _get_reminder_model_by_id_and_vehicle_id(self, reminder_id: int, vehicle_id: int) -> ReminderModel:
-        query = select(ReminderModel).where(
-            and_(
-                ReminderModel.id == reminder_id,
-                ReminderModel.vehicle_id == vehicle_id
+        query = lambda_stmt(
+            lambda: select(ReminderModel).where(
+                and_(
+                    ReminderModel.id == reminder_id,
+                    ReminderModel.vehicle_id == vehicle_id
+                )
+            ).options(
+                joinedload(ReminderModel.service_type)
             )
-        ).options(
-            selectinload(ReminderModel.service_type)
         )
         result = await self.session.execute(query)
 
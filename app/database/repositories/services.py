@@ -14,16 +14,24 @@
 
 from loguru import logger
 from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
     List,
     Optional,
+    Set,
+    Tuple,
 )
 from sqlalchemy import (
     select,
     and_,
+    func,
+    lambda_stmt,
 )
 from sqlalchemy.orm import (
-    selectinload,
+    aliased,
     joinedload,
+    contains_eager,
 )
 
 from app.database.errors import (
@@ -55,22 +63,90 @@ class ServicesRepository(BaseRepository):
         new_location.latitude = location.latitude
         new_location.longitude = location.longitude
 
-        new_service = ServiceModel()
-        new_service.vehicle_id = vehicle_id
-        new_service.service_type_id = service_type_id
-        new_service.mileage = mileage
-        new_service.price = price
-        new_service.location = new_location
+        self.session.add(new_location)
 
-        self.session.add(new_service)
+        try:
+            await self.session.flush()
+
+            inserted_service_rows = self._insert_returning(
+                ServiceModel,
+                dict(
+                    vehicle_id=vehicle_id,
+                    service_type_id=service_type_id,
+                    mileage=mileage,
+                    price=price,
+                    location_id=new_location.id,
+                )
+            )
+            inserted_service = aliased(ServiceModel, inserted_service_rows)
+            # The service type comes back joined to the INSERT ... RETURNING, not from a separate lookup.
+            query = select(inserted_service).options(
+                joinedload(inserted_service.service_type),
+                joinedload(inserted_service.location),
+            )
+            result = await self._execute_write(query)
+        except Exception as exception:
+            logger.error(exception)
+            raise EntityCreateError from exception
+
+        return self._convert_service_model_to_service(result.scalars().first())
+
+    async def create_services_by_vehicle_id(
+            self, vehicle_id: int, services: List[Dict[str, Any]]
+    ) -> List[Optional[int]]:
+        services_keys = await self._get_services_keys_by_vehicle_id(
+            vehicle_id, [service["mileage"] for service in services]
+        )
+
+        created_service_ids: List[Optional[int]] = [None] * len(services)
+        new_services_indexes = []
+        for index, service in enumerate(services):
+            service_key = (service["mileage"], service["service_type_id"])
+            if service_key not in services_keys:
+                services_keys.add(service_key)
+                new_services_indexes.append(index)
+
+        if not new_services_indexes:
+            return created_service_ids
+
+        new_services = [services[index] for index in new_services_indexes]
+
+        location_ids = await self._allocate_ids(LocationModel, len(new_services))
+        service_ids = await self._allocate_ids(ServiceModel, len(new_services))
+
+        location_rows = [
+            {
+                "id": location_id,
+                "description": service["location"].description,
+                "latitude": service["location"].latitude,
+                "longitude": service["location"].longitude,
+            }
+            for location_id, service in zip(location_ids, new_services)
+        ]
+        service_rows = [
+            {
+                "id": service_id,
+                "vehicle_id": vehicle_id,
+                "location_id": location_id,
+                "service_type_id": service["service_type_id"],
+                "mileage": service["mileage"],
+                "price": service["price"],
+                "created_at": service.get("created_at") or func.now(),
+            }
+            for service_id, location_id, service in zip(service_ids, location_ids, new_services)
+        ]
 
         try:
-            await self.session.commit()
+            await self._execute_insert(LocationModel, location_rows)
+            await self._execute_insert(ServiceModel, service_rows)
         except Exception as exception:
             logger.error(exception)
             raise EntityCreateError from exception
 
-        return await self.get_service_by_id_and_vehicle_id(new_service.id, vehicle_id)
+        for index, service_id in zip(new_services_indexes, service_ids):
+            created_service_ids[index] = service_id
+
+        return created_service_ids
 
     async def get_service_by_id_and_vehicle_id(self, service_id: int, vehicle_id: int) -> Service:
         service_in_db = await self._get_service_model_by_id_and_vehicle_id(service_id, vehicle_id)
@@ -88,52 +164,119 @@ class ServicesRepository(BaseRepository):
 
         return [self._convert_service_model_to_service(service_in_db) for service_in_db in services_in_db]
 
+    async def stream_services_by_vehicle_id(self, vehicle_id: int, chunk_size: int = 500) -> AsyncIterator[Service]:
+        query = select(ServiceModel).where(
+            ServiceModel.vehicle_id == vehicle_id
+        ).order_by(
+            ServiceModel.id
+        ).options(
+            joinedload(ServiceModel.service_type),
+            joinedload(ServiceModel.location),
+        ).execution_options(
+            yield_per=chunk_size
+        )
+        result = await self.session.stream(query)
+
+        async for service_in_db in result.scalars():
+            yield self._convert_service_model_to_service(service_in_db)
+
     async def update_service_by_id_and_vehicle_id(
             self,
             service_id: int,
             vehicle_id: int,
-            service_type: Optional[ServiceType] = None,
+            *,
+            service_type_id: Optional[int] = None,
             mileage: Optional[int] = None,
             price: Optional[float] = None,
             location: Optional[Location] = None,
     ) -> Service:
-        service_in_db = await self._get_service_model_by_id_and_vehicle_id(service_id, vehicle_id)
-        service_in_db.service_type = service_type or service_in_db.service_type
-        service_in_db.mileage = mileage or service_in_db.mileage
-        service_in_db.price = price or service_in_db.price
+        service_values = self._get_update_values(
+            service_type_id=service_type_id,
+            mileage=mileage,
+            price=price,
+        )
+        updated_service_rows = self._update_returning(
+            ServiceModel,
+            and_(
+                ServiceModel.id == service_id,
+                ServiceModel.vehicle_id == vehicle_id
+            ),
+            service_values
+        )
+        updated_service = aliased(ServiceModel, updated_service_rows)
+        query = select(updated_service).options(
+            joinedload(updated_service.service_type),
+        )
 
         if location:
-            service_in_db.location.description = location.description or service_in_db.location.description
-            service_in_db.location.latitude = location.latitude or service_in_db.location.latitude
-            service_in_db.location.longitude = location.longitude or service_in_db.location.longitude
+            location_values = self._get_update_values(
+                description=location.description,
+                latitude=location.latitude,
+                longitude=location.longitude,
+            )
+            updated_location_rows = self._update_returning(
+                LocationModel,
+                LocationModel.id == updated_service_rows.c.location_id,
+                location_values
+            )
+            updated_location = aliased(LocationModel, updated_location_rows)
+            query = query.join(updated_location, updated_service.location).options(
+                contains_eager(updated_service.location.of_type(updated_location))
+            )
+        else:
+            query = query.options(
+                joinedload(updated_service.location)
+            )
 
         try:
-            await self.session.commit()
+            service_in_db = await self._execute_update(query)
         except Exception as exception:
             logger.error(exception)
             raise EntityUpdateError from exception
 
-        return await self.get_service_by_id_and_vehicle_id(service_id, vehicle_id)
+        if not service_in_db:
+            raise EntityDoesNotExists
 
-    async def delete_service_by_id_and_vehicle_id(self, service_id: int, vehicle_id: int) -> None:
-        service_in_db = await self._get_service_model_by_id_and_vehicle_id(service_id, vehicle_id)
+        return self._convert_service_model_to_service(service_in_db)
 
+    async def delete_service_by_id_and_vehicle_id(self, service_id: int, vehicle_id: int) -> None:
         try:
-            await self.session.delete(service_in_db)
-            await self.session.commit()
+            deleted_service_id = await self._execute_delete(
+                ServiceModel,
+                and_(
+                    ServiceModel.id == service_id,
+                    ServiceModel.vehicle_id == vehicle_id
+                )
+            )
         except Exception as exception:
             logger.error(exception)
             raise EntityDeleteError from exception
 
-    async def _get_service_model_by_id_and_vehicle_id(self, service_id: int, vehicle_id: int) -> ServiceModel:
-        query = select(ServiceModel).where(
+        if deleted_service_id is None:
+            raise EntityDoesNotExists
+
+    async def _get_services_keys_by_vehicle_id(self, vehicle_id: int, mileages: List[int]) -> Set[Tuple[int, int]]:
+        query = select(ServiceModel.mileage, ServiceModel.service_type_id).where(
             and_(
-                ServiceModel.id == service_id,
-                ServiceModel.vehicle_id == vehicle_id
+                ServiceModel.vehicle_id == vehicle_id,
+                ServiceModel.mileage.in_(mileages)
+            )
+        )
+        result = await self.session.execute(query)
+
+        return {tuple(row) for row in result.all()}
+
+    async def _get_service_model_by_id_and_vehicle_id(self, service_id: int, vehicle_id: int) -> ServiceModel:
+        query = lambda_stmt(
+            lambda: select(ServiceModel).where(
+                and_(
+                    ServiceModel.id == service_id,
+                    ServiceModel.vehicle_id == vehicle_id
+                )
+            ).options(
+                joinedload(ServiceModel.location),
+                joinedload(ServiceModel.service_type),
             )
-        ).options(
-            selectinload(ServiceModel.location),
-            selectinload(ServiceModel.service_type),
         )
         result = await self.session.execute(query)
 
@@ -37,7 +37,7 @@ class ServicesTypesRepository(BaseRepository):
         self.session.add(new_service_type)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             logger.error(exception)
             raise EntityCreateError from exception
@@ -69,7 +69,7 @@ class ServicesTypesRepository(BaseRepository):
         service_type_in_db.description = description or service_type_in_db.description
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             logger.error(exception)
             raise EntityUpdateError from exception
@@ -81,7 +81,7 @@ class ServicesTypesRepository(BaseRepository):
 
         try:
             await self.session.delete(service_type_in_db)
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             logger.error(exception)
             raise EntityDeleteError from exception
@@ -0,0 +1,234 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, delete, func, select, update
+
+from app.database.errors import (
+    EntityCreateError,
+    EntityDeleteError,
+    EntityDoesNotExists,
+    EntityUpdateError,
+)
+from app.database.models import SmsOutboxModel
+from app.database.repositories.base import BaseRepository
+from app.models.domain.sms_outbox import SmsOutboxMessage, SmsOutboxState
+
+
+class SmsOutboxRepository(BaseRepository):
+
+    async def create_message(self, phone: str, message: str, request_id: Optional[str] = None) -> SmsOutboxMessage:
+        new_message = SmsOutboxModel()
+        new_message.phone = phone
+        new_message.message = message
+        new_message.request_id = request_id
+        new_message.state = SmsOutboxState.PENDING
+        new_message.attempts = 0
+
+        self.session.add(new_message)
+
+        try:
+            await self._commit()
+        except Exception as exception:
+            raise EntityCreateError from exception
+
+        return self._convert_message_model_to_message(new_message)
+
+    async def claim_due_messages(self, limit: int, lease: float) -> List[SmsOutboxMessage]:
+        # Claimed rows are pushed out by the lease, so a crashed sender only
+        # delays them and parallel senders skip rows locked by each other.
+        due_messages = select(
+            SmsOutboxModel.id
+        ).where(
+            and_(
+                SmsOutboxModel.state == SmsOutboxState.PENDING,
+                SmsOutboxModel.next_attempt_at <= func.now(),
+            )
+        ).order_by(
+            SmsOutboxModel.next_attempt_at
+        ).limit(
+            limit
+        ).with_for_update(
+            skip_locked=True
+        )
+
+        query = update(SmsOutboxModel).where(
+            SmsOutboxModel.id.in_(due_messages.scalar_subquery())
+        ).values(
+            attempts=SmsOutboxModel.attempts + 1,
+            next_attempt_at=func.now() + timedelta(seconds=lease),
+        ).returning(
+            *SmsOutboxModel.__table__.columns
+        )
+
+        try:
+            result = await self._execute_write(query)
+        except Exception as exception:
+            raise EntityUpdateError from exception
+
+        return [SmsOutboxMessage(**row) for row in result.mappings().all()]
+
+    async def get_message_by_request_id(self, request_id: str) -> SmsOutboxMessage:
+        query = select(
+            SmsOutboxModel
+        ).where(
+            SmsOutboxModel.request_id == request_id
+        )
+        result = await self.session.execute(query)
+
+        message = result.scalars().first()
+        if message is None:
+            raise EntityDoesNotExists
+
+        return self._convert_message_model_to_message(message)
+
+    async def get_messages_in_flight(self, window: float) -> List[SmsOutboxMessage]:
+        query = select(
+            SmsOutboxModel
+        ).where(
+            and_(
+                SmsOutboxModel.state == SmsOutboxState.SENT,
+                SmsOutboxModel.sent_at > func.now() - timedelta(seconds=window),
+            )
+        ).order_by(
+            SmsOutboxModel.sent_at
+        )
+        result = await self.session.execute(query)
+
+        return [self._convert_message_model_to_message(message) for message in result.scalars().all()]
+
+    async def expire_messages_in_flight(self, window: float) -> int:
+        query = update(SmsOutboxModel).where(
+            and_(
+                SmsOutboxModel.state == SmsOutboxState.SENT,
+                SmsOutboxModel.sent_at <= func.now() - timedelta(seconds=window),
+            )
+        ).values(
+            state=SmsOutboxState.EXPIRED
+        ).execution_options(
+            synchronize_session=False
+        )
+
+        try:
+            result = await self._execute_write(query)
+        except Exception as exception:
+            raise EntityUpdateError from exception
+
+        return result.rowcount
+
+    async def mark_message_as_sent(self, message_id: int, gateway: str) -> None:
+        await self._update_message(
+            message_id,
+            state=SmsOutboxState.SENT,
+            gateway=gateway,
+            sent_at=func.now(),
+            last_error=None,
+        )
+
+    async def mark_message_as_delivered(self, message_id: int) -> None:
+        await self._update_message(message_id, state=SmsOutboxState.DELIVERED)
+
+    async def mark_message_as_failed(self, message_id: int, error: str, retry_in: Optional[float] = None) -> None:
+        if retry_in is None:
+            await self._update_message(message_id, state=SmsOutboxState.FAILED, last_error=error)
+            return
+
+        await self._update_message(
+            message_id,
+            state=SmsOutboxState.PENDING,
+            last_error=error,
+            next_attempt_at=func.now() + timedelta(seconds=retry_in),
+        )
+
+    async def count_pending_messages(self) -> int:
+        query = select(
+            func.count(SmsOutboxModel.id)
+        ).where(
+            SmsOutboxModel.state == SmsOutboxState.PENDING
+        )
+        result = await self.session.execute(query)
+
+        return result.scalar_one()
+
+    async def count_messages_by_state(self) -> Dict[SmsOutboxState, int]:
+        query = select(
+            SmsOutboxModel.state,
+            func.count(SmsOutboxModel.id)
+        ).group_by(
+            SmsOutboxModel.state
+        )
+        result = await self.session.execute(query)
+
+        counts = {state: 0 for state in SmsOutboxState}
+        counts.update(dict(result.all()))
+
+        return counts
+
+    async def delete_finished_messages(self, retention: float, limit: int) -> int:
+        finished_messages = select(
+            SmsOutboxModel.id
+        ).where(
+            and_(
+                SmsOutboxModel.state.in_((
+                    SmsOutboxState.SENT,
+                    SmsOutboxState.DELIVERED,
+                    SmsOutboxState.FAILED,
+                    SmsOutboxState.EXPIRED,
+                )),
+                SmsOutboxModel.created_at <= func.now() - timedelta(seconds=retention),
+            )
+        ).limit(
+            limit
+        ).with_for_update(
+            skip_locked=True
+        )
+
+        query = delete(SmsOutboxModel).where(
+            SmsOutboxModel.id.in_(finished_messages.scalar_subquery())
+        ).execution_options(
+            synchronize_session=False
+        )
+
+        try:
+            result = await self._execute_write(query)
+        except Exception as exception:
+            raise EntityDeleteError from exception
+
+        return result.rowcount
+
+    async def _update_message(self, message_id: int, **values) -> None:  # type: ignore
+        query = update(SmsOutboxModel).where(SmsOutboxModel.id == message_id).values(**values)
+
+        try:
+            await self._execute_write(query)
+        except Exception as exception:
+            raise EntityUpdateError from exception
+
+    @staticmethod
+    def _convert_message_model_to_message(message_model: SmsOutboxModel) -> SmsOutboxMessage:
+        return SmsOutboxMessage(
+            id=message_model.id,
+            phone=message_model.phone,
+            message=message_model.message,
+            state=message_model.state,
+            attempts=message_model.attempts,
+            next_attempt_at=message_model.next_attempt_at,
+            last_error=message_model.last_error,
+            gateway=message_model.gateway,
+            sent_at=message_model.sent_at,
+            created_at=message_model.created_at,
+            updated_at=message_model.updated_at,
+        )
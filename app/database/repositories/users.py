@@ -15,12 +15,14 @@
 from typing import Optional
 from sqlalchemy import select
 
+from app.core.cache import get_users_cache
 from app.database.errors import (
     EntityDoesNotExists,
     EntityCreateError,
     EntityUpdateError,
 )
 from app.database.repositories.base import BaseRepository
+from app.database.unit_of_work import call_after_commit
 from app.models.domain.user import UserInDB
 from app.database.models import UserModel
 
@@ -34,7 +36,7 @@ class UsersRepository(BaseRepository):
             password: str,
     ) -> UserInDB:
         user: UserInDB = UserInDB(username=username, phone=phone)
-        user.change_password(password)
+        await user.change_password_async(password)
 
         new_user: UserModel = UserModel()
         new_user.username = user.username
@@ -45,11 +47,11 @@ class UsersRepository(BaseRepository):
         self.session.add(new_user)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             raise EntityCreateError from exception
 
-        return await self.get_user_by_id(new_user.id)
+        return self._convert_user_model_to_model(new_user)
 
     async def get_user_by_id(self, user_id: int) -> UserInDB:
         user_in_db: UserModel = await self._get_user_model_by_id(user_id)
@@ -103,16 +105,21 @@ class UsersRepository(BaseRepository):
 
         if password:
             user = UserInDB(**user_in_db.__dict__)
-            user.change_password(password)
+            await user.change_password_async(password)
 
             user_in_db.salt = user.salt
             user_in_db.password = user.password
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             raise EntityUpdateError from exception
 
+        # Inside a unit of work the row is only flushed here, so a concurrent request
+        # could cache the old row again before the real COMMIT.
+        get_users_cache().invalidate(user_id)
+        call_after_commit(self._session, lambda: get_users_cache().invalidate(user_id))
+
         return await self.get_user_by_id(user_id)
 
     async def _get_user_model_by_id(self, user_id: int) -> UserModel:
@@ -13,8 +13,9 @@
 #  limitations under the License.
 
 from typing import List, Optional
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, lambda_stmt
 from sqlalchemy.exc import PendingRollbackError
+from sqlalchemy.orm import aliased
 from loguru import logger
 
 from app.database.errors import (
@@ -59,12 +60,12 @@ class VehiclesRepository(BaseRepository):
         self.session.add(new_vehicle)
 
         try:
-            await self.session.commit()
+            await self._commit()
         except Exception as exception:
             logger.error(exception)
             raise EntityCreateError from exception
 
-        return await self.get_vehicle_by_id_and_user_id(new_vehicle.id, user_id)
+        return self._convert_vehicle_model_to_vehicle(new_vehicle)
 
     async def get_vehicle_by_vin(self, vin: str) -> Vehicle:
         query = select(VehicleModel).where(VehicleModel.vin == vin)
@@ -113,40 +114,61 @@ class VehiclesRepository(BaseRepository):
             vin: Optional[str] = None,
             registration_plate: Optional[str] = None,
     ) -> Vehicle:
-        vehicle_in_db = await self._get_vehicle_model_by_id_and_user_id(vehicle_id, user_id)
-        vehicle_in_db.brand = brand or vehicle_in_db.brand
-        vehicle_in_db.model = model or vehicle_in_db.model
-        vehicle_in_db.gen = gen or vehicle_in_db.gen
-        vehicle_in_db.year = year or vehicle_in_db.year
-        vehicle_in_db.color = color or vehicle_in_db.color
-        vehicle_in_db.mileage = mileage or vehicle_in_db.mileage
-        vehicle_in_db.vin = vin or vehicle_in_db.vin
-        vehicle_in_db.registration_plate = registration_plate or vehicle_in_db.registration_plate
-        vehicle_in_db.name = name or vehicle_in_db.name
+        vehicle_values = self._get_update_values(
+            brand=brand,
+            model=model,
+            gen=gen,
+            year=year,
+            color=color,
+            mileage=mileage,
+            vin=vin,
+            registration_plate=registration_plate,
+            name=name,
+        )
+        updated_vehicle_rows = self._update_returning(
+            VehicleModel,
+            and_(
+                VehicleModel.id == vehicle_id,
+                VehicleModel.owner_id == user_id,
+            ),
+            vehicle_values
+        )
+        query = select(aliased(VehicleModel, updated_vehicle_rows))
 
         try:
-            await self.session.commit()
+            vehicle_in_db = await self._execute_update(query)
         except Exception as exception:
             logger.error(exception)
             raise EntityUpdateError from exception
 
-        return await self.get_vehicle_by_id_and_user_id(vehicle_id, user_id)
+        if not vehicle_in_db:
+            raise EntityDoesNotExists
 
-    async def delete_vehicle_by_id_and_user_id(self, vehicle_id: int, user_id: int) -> None:
-        vehicle_in_db = await self._get_vehicle_model_by_id_and_user_id(vehicle_id, user_id)
+        return self._convert_vehicle_model_to_vehicle(vehicle_in_db)
 
+    async def delete_vehicle_by_id_and_user_id(self, vehicle_id: int, user_id: int) -> None:
         try:
-            await self.session.delete(vehicle_in_db)
-            await self.session.commit()
+            deleted_vehicle_id = await self._execute_delete(
+                VehicleModel,
+                and_(
+                    VehicleModel.id == vehicle_id,
+                    VehicleModel.owner_id == user_id,
+                )
+            )
         except Exception as exception:
             logger.error(exception)
             raise EntityDeleteError from exception
 
+        if deleted_vehicle_id is None:
+            raise EntityDoesNotExists
+
     async def _get_vehicle_model_by_id_and_user_id(self, vehicle_id: int, user_id: int) -> VehicleModel:
-        query = select(VehicleModel).where(
-            and_(
-                VehicleModel.id == vehicle_id,
-                VehicleModel.owner_id == user_id,
+        query = lambda_stmt(
+            lambda: select(VehicleModel).where(
+                and_(
+                    VehicleModel.id == vehicle_id,
+                    VehicleModel.owner_id == user_id,
+                )
             )
         )
 
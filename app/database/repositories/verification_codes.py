@@ -12,85 +12,190 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from datetime import timedelta
 from random import randrange
-from typing import List
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, update, delete, and_, or_, func, literal
+from sqlalchemy.sql import ClauseElement
 
 from app.database.errors import (
+    EntityAlreadyExists,
     EntityDoesNotExists,
     EntityDeleteError,
     EntityCreateError, EntityUpdateError,
 )
 from app.database.models import VerificationCodeModel
+from app.database.replicas import mark_session_has_writes
 from app.database.repositories.base import BaseRepository
 
 
 class VerificationRepository(BaseRepository):
 
-    async def create_verification_code_by_phone(self, phone: str) -> int:
-        new_verification_code = VerificationCodeModel()
-        new_verification_code.phone = phone
-        new_verification_code.verification_code = randrange(100000, 999999)
+    async def create_verification_code_by_phone(self, phone: str, code_ttl: float, max_codes: int) -> int:
+        # The lock is held until the transaction ends, so concurrent requests for one phone
+        # count each other's codes instead of all passing the limit at once.
+        lock = select(func.pg_advisory_xact_lock(func.hashtext(phone)))
+
+        unexpired_verification_codes = select(
+            func.count(VerificationCodeModel.id)
+        ).where(
+            _is_unexpired_verification_code(phone, code_ttl)
+        ).scalar_subquery()
+
+        new_verification_code = select(
+            literal(phone),
+            literal(randrange(100000, 999999)),
+        ).where(
+            unexpired_verification_codes < max_codes
+        )
+
+        query = insert(VerificationCodeModel).from_select(
+            ["phone", "verification_code"],
+            new_verification_code
+        ).returning(
+            VerificationCodeModel.verification_code
+        )
 
-        self.session.add(new_verification_code)
+        mark_session_has_writes(self._session)
 
         try:
-            await self.session.commit()
+            await self.session.execute(lock)
+            result = await self._execute_write(query)
         except Exception as exception:
             raise EntityCreateError from exception
 
-        return new_verification_code.verification_code
+        verification_code = result.scalar()
+        if verification_code is None:
+            raise EntityAlreadyExists
+
+        return verification_code
 
-    async def get_verification_code_by_phone_and_code(self, phone: str, verification_code: int) -> int:
+    async def register_failed_attempt_by_phone(self, phone: str, code_ttl: float, max_attempts: int) -> None:
+        query = update(VerificationCodeModel).where(
+            _is_active_verification_code(phone, code_ttl, max_attempts)
+        ).values(
+            failed_attempts=VerificationCodeModel.failed_attempts + 1
+        ).execution_options(
+            synchronize_session=False
+        )
+
+        try:
+            await self._execute_write(query)
+        except Exception as exception:
+            raise EntityUpdateError from exception
+
+    async def get_verification_code_by_phone_and_code(
+            self,
+            phone: str,
+            verification_code: int,
+            code_ttl: float,
+            max_attempts: int,
+    ) -> int:
         verification_code_in_db: VerificationCodeModel = await self._get_verification_code_by_phone_and_code(
-            phone, verification_code
+            phone, verification_code, code_ttl, max_attempts
         )
         if not verification_code_in_db:
             raise EntityDoesNotExists
 
         return verification_code_in_db.verification_code
 
-    async def mark_as_verified_by_phone_and_verification_code(self, phone: str, verification_code: int) -> None:
-        verification_code_in_db: VerificationCodeModel = await self._get_verification_code_by_phone_and_code(
-            phone, verification_code
+    async def mark_as_verified_by_phone_and_verification_code(
+            self,
+            phone: str,
+            verification_code: int,
+            code_ttl: float,
+            max_attempts: int,
+    ) -> None:
+        query = update(VerificationCodeModel).where(
+            and_(
+                _is_active_verification_code(phone, code_ttl, max_attempts),
+                VerificationCodeModel.verification_code == verification_code,
+            )
+        ).values(
+            is_verified=True
+        ).returning(
+            VerificationCodeModel.id
         )
-        verification_code_in_db.is_verified = True
 
         try:
-            await self.session.commit()
+            result = await self._execute_write(query)
         except Exception as exception:
             raise EntityUpdateError from exception
 
-    async def delete_verification_code_by_phone_and_code(self, phone: str, verification_code: int) -> None:
-        verification_code_in_db = await self._get_verification_code_by_phone_and_code(phone, verification_code)
+        if result.scalar() is None:
+            raise EntityDoesNotExists
 
+    async def delete_verification_code_by_phone_and_code(
+            self,
+            phone: str,
+            verification_code: int,
+            code_ttl: float,
+            max_attempts: int,
+    ) -> None:
         try:
-            await self.session.delete(verification_code_in_db)
-            await self.session.commit()
+            deleted_verification_code_id = await self._execute_delete(
+                VerificationCodeModel,
+                and_(
+                    _is_active_verification_code(phone, code_ttl, max_attempts),
+                    VerificationCodeModel.verification_code == verification_code,
+                )
+            )
         except Exception as exception:
             raise EntityDeleteError from exception
 
+        if deleted_verification_code_id is None:
+            raise EntityDoesNotExists
+
     async def delete_verification_codes_by_phone(self, phone: str) -> None:
-        verification_codes_in_db = await self._get_verification_codes_by_phone(phone)
+        query = delete(VerificationCodeModel).where(
+            and_(
+                VerificationCodeModel.phone == phone,
+                VerificationCodeModel.is_verified == False
+            )
+        )
 
-        for verification_code_in_db in verification_codes_in_db:
-            await self.session.delete(verification_code_in_db)
+        try:
+            await self._execute_write(query)
+        except Exception as exception:
+            raise EntityDeleteError from exception
+
+    async def delete_stale_verification_codes(self, code_ttl: float, limit: int) -> int:
+        expired_at = func.now() - timedelta(seconds=code_ttl)
+
+        stale_verification_codes = select(
+            VerificationCodeModel.id
+        ).where(
+            or_(
+                VerificationCodeModel.is_verified == True,
+                VerificationCodeModel.created_at <= expired_at,
+            )
+        ).limit(
+            limit
+        ).with_for_update(
+            skip_locked=True
+        )
+
+        query = delete(VerificationCodeModel).where(
+            VerificationCodeModel.id.in_(stale_verification_codes.scalar_subquery())
+        )
 
         try:
-            await self.session.commit()
+            result = await self._execute_write(query)
         except Exception as exception:
             raise EntityDeleteError from exception
 
+        return result.rowcount
+
     async def _get_verification_code_by_phone_and_code(
             self,
             phone: str,
-            verification_code: int
+            verification_code: int,
+            code_ttl: float,
+            max_attempts: int,
     ) -> VerificationCodeModel:
         query = select(VerificationCodeModel).where(
             and_(
-                VerificationCodeModel.phone == phone,
+                _is_active_verification_code(phone, code_ttl, max_attempts),
                 VerificationCodeModel.verification_code == verification_code,
-                VerificationCodeModel.is_verified == False
             )
         )
         result = await self.session.execute(query)
@@ -101,15 +206,20 @@ class VerificationRepository(BaseRepository):
 
         return verification_code_in_db
 
-    async def _get_verification_codes_by_phone(self, phone: str) -> List[VerificationCodeModel]:
-        query = select(VerificationCodeModel).where(
-            and_(
-                VerificationCodeModel.phone == phone,
-                VerificationCodeModel.is_verified == False
-            )
-        )
-        result = await self.session.execute(query)
 
-        verification_codes_in_db: VerificationCodeModel = result.scalars().all()
+def _is_unexpired_verification_code(phone: str, code_ttl: float) -> ClauseElement:
+    expired_at = func.now() - timedelta(seconds=code_ttl)
+
+    return and_(
+        VerificationCodeModel.phone == phone,
+        VerificationCodeModel.is_verified == False,
+        VerificationCodeModel.created_at > expired_at,
+    )
+
 
-        return verification_codes_in_db
+def _is_active_verification_code(phone: str, code_ttl: float, max_attempts: int) -> ClauseElement:
+    # Codes that ran out of attempts stay unexpired, so they still count against the per-phone limit.
+    return and_(
+        _is_unexpired_verification_code(phone, code_ttl),
+        VerificationCodeModel.failed_attempts < max_attempts,
+    )
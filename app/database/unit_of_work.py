@@ -0,0 +1,50 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+UNIT_OF_WORK = "unit_of_work"
+AFTER_COMMIT_CALLBACKS = "after_commit_callbacks"
+
+
+def begin_unit_of_work(session: AsyncSession) -> None:
+    session.info[UNIT_OF_WORK] = True
+
+
+def end_unit_of_work(session: AsyncSession) -> None:
+    session.info[UNIT_OF_WORK] = False
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    return session.info.get(UNIT_OF_WORK, False)
+
+
+def call_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    session.info.setdefault(AFTER_COMMIT_CALLBACKS, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop(AFTER_COMMIT_CALLBACKS, []):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(AFTER_COMMIT_CALLBACKS, None)
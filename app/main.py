@@ -15,6 +15,7 @@
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api.errors.http_error import http_error_handler
 from app.api.errors.validation_error import http422_error_handler
@@ -22,13 +23,16 @@ from app.api.routes.api import router as api_router
 from app.core.config import get_app_settings
 from app.core.events import create_start_app_handler, create_stop_app_handler
 from app.api.middlewares.api_key import ApiKeyMiddleware
+from app.api.middlewares.query_budget import QueryBudgetMiddleware
+from app.api.middlewares.request_context import RequestContextMiddleware
+from app.api.middlewares.unit_of_work import UnitOfWorkMiddleware
 
 
 def get_application() -> FastAPI:
     settings = get_app_settings()
     settings.configure_logging()
 
-    application = FastAPI(**settings.fastapi_kwargs)
+    application = FastAPI(default_response_class=ORJSONResponse, **settings.fastapi_kwargs)
 
     application.add_middleware(
         CORSMiddleware,
@@ -37,6 +41,9 @@ def get_application() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    application.add_middleware(QueryBudgetMiddleware, **settings.query_budget_kwargs)
+    application.add_middleware(UnitOfWorkMiddleware)
+    application.add_middleware(RequestContextMiddleware)
     # application.add_middleware(ApiKeyMiddleware)
 
     application.add_event_handler(
@@ -16,6 +16,7 @@ from enum import Enum
 from typing import Optional
 from pydantic import HttpUrl, EmailStr
 
+from app.models.common import IDModelMixin
 from app.models.domain.rwmodel import RWModel
 
 
@@ -25,7 +26,7 @@ class Gender(Enum):
     FEMALE = "female"
 
 
-class Profile(RWModel):
+class Profile(IDModelMixin, RWModel):
     email: Optional[EmailStr] = None
     first_name: Optional[str] = None
     second_name: Optional[str] = None
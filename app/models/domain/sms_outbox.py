@@ -0,0 +1,47 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from enum import Enum
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from app.models.common import IDModelMixin, DateTimeModelMixin
+
+
+class SmsOutboxState(Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    DELIVERED = "delivered"
+    FAILED = "failed"
+    EXPIRED = "expired"
+
+
+class SmsOutboxMessage(IDModelMixin, DateTimeModelMixin):
+    phone: str
+    message: str
+    state: SmsOutboxState
+    attempts: int
+    next_attempt_at: datetime
+    last_error: Optional[str]
+    gateway: Optional[str]
+    sent_at: Optional[datetime]
+    request_id: Optional[str]
+
+
+class SmsSendStatus(BaseModel):
+    in_progress: bool
+    succeeded_phones: List[str]
+    failed_phones: List[str]
@@ -33,3 +33,13 @@ class UserInDB(User):
     def change_password(self, password: str) -> None:
         self.salt = security.generate_salt()
         self.password = security.get_password_hash(self.salt + password)
+
+    def password_needs_update(self) -> bool:
+        return security.password_needs_update(self.password)
+
+    async def check_password_async(self, password: str) -> bool:
+        return await security.verify_password_async(self.salt + password, self.password)
+
+    async def change_password_async(self, password: str) -> None:
+        self.salt = security.generate_salt()
+        self.password = await security.get_password_hash_async(self.salt + password)
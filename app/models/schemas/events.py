@@ -61,6 +61,7 @@ class EventInUpdate(RWSchema):
 class ListOfEventsInResponse(RWSchema):
     events: List[Event]
     events_count: int
+    next_cursor: Optional[str] = None
 
 
 class EventID(RWSchema):
@@ -71,3 +72,4 @@ class EventsFilter(RWSchema):
     state: EventState = EventState.PLANNED
     limit: int = Field(DEFAULT_ARTICLES_LIMIT, ge=1)
     offset: int = Field(DEFAULT_ARTICLES_OFFSET, ge=0)
+    cursor: Optional[str] = None
@@ -24,6 +24,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from datetime import datetime
 from typing import List, Optional
 
 from app.models.domain.fuel import Fuel, FuelType
@@ -49,6 +50,10 @@ class FuelInCreate(RWSchema):
     location: Location
 
 
+class FuelInImport(FuelInCreate):
+    created_at: Optional[datetime] = None
+
+
 class FuelInUpdate(RWSchema):
     quantity: Optional[float] = None
     price: Optional[float] = None
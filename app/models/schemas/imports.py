@@ -0,0 +1,38 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from enum import Enum
+from typing import List, Optional
+
+from app.models.schemas.rwschema import RWSchema
+
+
+class ImportRowStatus(Enum):
+    IMPORTED = "imported"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+
+
+class ImportRowResult(RWSchema):
+    row: int
+    status: ImportRowStatus
+    id: Optional[int] = None
+    errors: List[str] = []
+
+
+class ImportReportInResponse(RWSchema):
+    rows: List[ImportRowResult]
+    imported: int
+    duplicates: int
+    invalid: int
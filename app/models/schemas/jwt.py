@@ -13,9 +13,15 @@
 #  limitations under the License.
 
 from datetime import datetime
+from enum import Enum
 from pydantic import BaseModel
 
 
+class AuthMode(Enum):
+    DATABASE = "database"
+    TOKEN = "token"
+
+
 class JWTMeta(BaseModel):
     exp: datetime
     sub: str
@@ -25,3 +31,5 @@ class JWTUser(BaseModel):
     user_id: int
     username: str
     phone: str
+    is_admin: bool = False
+    is_blocked: bool = False
@@ -44,8 +44,10 @@ class PostInUpdate(RWSchema):
 class ListOfPostsInResponse(RWSchema):
     posts: List[Post]
     count: int
+    next_cursor: Optional[str] = None
 
 
 class PostsFilter(BaseModel):
     limit: int = Field(DEFAULT_ARTICLES_LIMIT, ge=1)
     offset: int = Field(DEFAULT_ARTICLES_OFFSET, ge=0)
+    cursor: Optional[str] = None
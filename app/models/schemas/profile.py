@@ -61,8 +61,10 @@ class ProfileInResponse(RWSchema):
 class ListOfProfileInResponse(RWSchema):
     profiles: List[Profile]
     count: int
+    next_cursor: Optional[str] = None
 
 
 class ProfilesFilter(BaseModel):
     limit: int = Field(DEFAULT_PROFILES_LIMIT, ge=1)
     offset: int = Field(DEFAULT_PROFILES_OFFSET, ge=0)
+    cursor: Optional[str] = None
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from datetime import datetime
 from typing import List, Optional
 
 from app.models.domain.location import Location
@@ -35,6 +36,10 @@ class ServiceInCreate(RWSchema):
     price: float
 
 
+class ServiceInImport(ServiceInCreate):
+    created_at: Optional[datetime] = None
+
+
 class ServiceInUpdate(RWSchema):
     location: Optional[Location] = None
     service_type_id: Optional[int] = None
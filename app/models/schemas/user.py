@@ -12,9 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel
 
+from app.models.domain.sms_outbox import SmsOutboxState
 from app.models.domain.user import User
 from app.models.schemas.rwschema import RWSchema
 
@@ -23,6 +25,16 @@ class PhoneInVerification(RWSchema):
     phone: str
 
 
+class VerificationInResponse(RWSchema):
+    request_id: str
+
+
+class VerificationStatusInResponse(RWSchema):
+    phone: str
+    state: SmsOutboxState
+    sent_at: Optional[datetime]
+
+
 class UserInLogin(RWSchema):
     username: str
     password: str
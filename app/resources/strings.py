@@ -78,6 +78,7 @@ VERIFICATION_SERVICE_SEND_SMS_ERROR = "Error sending sms to phone"
 VERIFICATION_CODE_CREATE_ERROR = "Can't create new verification code to phone number"
 VERIFICATION_CODE_DOES_NOT_EXISTS = "Verification code doesn't exists"
 VERIFICATION_CODE_IS_WRONG = "Verification code is wrong"
+VERIFICATION_CODES_LIMIT_EXCEEDED = "Too many verification codes requested for this phone number"
 
 WRONG_TOKEN_PREFIX = "Unsupported authorization type"  # noqa: S105
 MALFORMED_PAYLOAD = "Could not validate credentials"
@@ -86,3 +87,12 @@ COMMENT_DOES_NOT_EXIST = "Comment does not exist"
 COMMENT_CREATE_ERROR = "Comment create error"
 
 AUTHENTICATION_REQUIRED = "Authentication required"
+
+PAGINATION_CURSOR_INVALID = "Invalid pagination cursor"
+
+IMPORT_CONTENT_TYPE_UNSUPPORTED = "Import supports only JSON arrays and CSV files"
+IMPORT_BODY_MALFORMED = "Import body is malformed"
+IMPORT_ROW_NOT_OBJECT = "row must be an object"
+
+TRANSACTION_COMMIT_ERROR = "Transaction commit error"
+QUERY_BUDGET_EXCEEDED = "Request exceeded its database query budget"
@@ -21,8 +21,9 @@ from phonenumbers import (
 )
 from pydantic import EmailStr
 
-from app.database.errors import EntityDoesNotExists
+from app.database.errors import EntityDoesNotExists, EntityUpdateError
 from app.database.repositories.users import UsersRepository
+from app.database.repositories.verification_codes import VerificationRepository
 
 
 def check_phone_is_valid(phone_number: str) -> bool:
@@ -68,3 +69,25 @@ async def check_email_is_taken(repo: UsersRepository, email: EmailStr) -> bool:
         return False
 
     return True
+
+
+async def check_verification_code_is_valid(
+        repo: VerificationRepository,
+        attempts_repo: VerificationRepository,
+        phone: str,
+        verification_code: int,
+        code_ttl: float,
+        max_attempts: int,
+) -> bool:
+    try:
+        await repo.get_verification_code_by_phone_and_code(phone, verification_code, code_ttl, max_attempts)
+    except EntityDoesNotExists:
+        # The request is rolled back on a wrong code, so the attempt is counted outside its unit of work.
+        try:
+            await attempts_repo.register_failed_attempt_by_phone(phone, code_ttl, max_attempts)
+        except EntityUpdateError as exception:
+            logger.error("Unable to count failed verification attempt for phone {}: {}", phone, exception)
+
+        return False
+
+    return True
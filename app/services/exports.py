@@ -0,0 +1,123 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import csv
+from datetime import datetime
+from enum import Enum
+from io import StringIO
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Sequence
+
+from pydantic import BaseModel
+
+from app.models.schemas.exports import ExportFormat
+
+EXPORT_CHUNK_SIZE = 500
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+FUEL_EXPORT_FIELDS = (
+    "id",
+    "quantity",
+    "price",
+    "mileage",
+    "fuel_type",
+    "is_full",
+    "location_description",
+    "location_latitude",
+    "location_longitude",
+    "created_at",
+)
+SERVICE_EXPORT_FIELDS = (
+    "id",
+    "service_type_id",
+    "service_type_name",
+    "mileage",
+    "price",
+    "location_description",
+    "location_latitude",
+    "location_longitude",
+    "created_at",
+)
+
+
+def export_rows(
+        items: AsyncIterable[BaseModel],
+        export_format: ExportFormat,
+        fields: Sequence[str],
+) -> AsyncIterator[str]:
+    if export_format == ExportFormat.CSV:
+        return _export_csv_rows(items, fields)
+
+    return _export_ndjson_rows(items)
+
+
+async def _export_ndjson_rows(items: AsyncIterable[BaseModel]) -> AsyncIterator[str]:
+    chunk = []
+    chunk_size = 1
+
+    async for item in items:
+        chunk.append(item.json())
+
+        if len(chunk) >= chunk_size:
+            yield "\n".join(chunk) + "\n"
+            chunk.clear()
+            chunk_size = EXPORT_CHUNK_SIZE
+
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+
+async def _export_csv_rows(items: AsyncIterable[BaseModel], fields: Sequence[str]) -> AsyncIterator[str]:
+    buffer = StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+
+    writer.writeheader()
+    yield _pop_buffer(buffer)
+
+    rows = 0
+    async for item in items:
+        writer.writerow(_flatten_row(item.dict()))
+        rows += 1
+
+        if rows % EXPORT_CHUNK_SIZE == 0:
+            yield _pop_buffer(buffer)
+
+    if buffer.tell():
+        yield _pop_buffer(buffer)
+
+
+def _flatten_row(row: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    flat_row: Dict[str, Any] = {}
+
+    for name, value in row.items():
+        if isinstance(value, dict):
+            flat_row.update(_flatten_row(value, f"{prefix}{name}_"))
+        elif isinstance(value, Enum):
+            flat_row[f"{prefix}{name}"] = value.value
+        elif isinstance(value, datetime):
+            flat_row[f"{prefix}{name}"] = value.isoformat()
+        else:
+            flat_row[f"{prefix}{name}"] = value
+
+    return flat_row
+
+
+def _pop_buffer(buffer: StringIO) -> str:
+    value = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+
+    return value
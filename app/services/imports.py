@@ -0,0 +1,250 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import csv
+from codecs import getincrementaldecoder
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+import orjson
+from pydantic import BaseModel, ValidationError
+
+from app.database.repositories.fuels import FuelsRepository
+from app.database.repositories.services import ServicesRepository
+from app.database.repositories.vehicles import VehiclesRepository
+from app.models.domain.vehicle import Vehicle
+from app.models.schemas.fuel import FuelInImport
+from app.models.schemas.imports import (
+    ImportReportInResponse,
+    ImportRowResult,
+    ImportRowStatus,
+)
+from app.models.schemas.service import ServiceInImport
+from app.resources import strings
+from app.services.vehicles import update_vehicle_mileage
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_JSON_MAX_BODY_SIZE = 10 * 1024 * 1024
+IMPORT_CSV_CONTENT_TYPE = "text/csv"
+IMPORT_JSON_CONTENT_TYPE = "application/json"
+IMPORT_CSV_NESTED_FIELDS = ("location",)
+
+
+def read_import_rows(content_type: str, body: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    content_type = content_type.split(";")[0].strip().lower()
+
+    if content_type == IMPORT_CSV_CONTENT_TYPE:
+        return _read_csv_rows(body)
+    if content_type == IMPORT_JSON_CONTENT_TYPE:
+        return _read_json_rows(body)
+
+    raise ValueError("unsupported import content type")
+
+
+async def import_fuels(
+        fuels_repo: FuelsRepository,
+        vehicles_repo: VehiclesRepository,
+        vehicle: Vehicle,
+        user_id: int,
+        rows: AsyncIterable[Any],
+) -> ImportReportInResponse:
+    async def create_fuels(fuels: List[Dict[str, Any]]) -> List[Optional[int]]:
+        return await fuels_repo.create_fuels_by_vehicle_id(vehicle.id, fuels)
+
+    return await _import_rows(rows, FuelInImport, create_fuels, vehicles_repo, vehicle, user_id)
+
+
+async def import_services(
+        services_repo: ServicesRepository,
+        vehicles_repo: VehiclesRepository,
+        vehicle: Vehicle,
+        user_id: int,
+        service_type_ids: Set[int],
+        rows: AsyncIterable[Any],
+) -> ImportReportInResponse:
+    async def create_services(services: List[Dict[str, Any]]) -> List[Optional[int]]:
+        return await services_repo.create_services_by_vehicle_id(vehicle.id, services)
+
+    def check_service_type(service: ServiceInImport) -> List[str]:
+        if service.service_type_id not in service_type_ids:
+            return [strings.SERVICE_TYPE_DOES_NOT_EXIST_ERROR]
+
+        return []
+
+    return await _import_rows(
+        rows, ServiceInImport, create_services, vehicles_repo, vehicle, user_id, check_service_type
+    )
+
+
+async def _import_rows(
+        rows: AsyncIterable[Any],
+        schema: Type[BaseModel],
+        create_batch: Callable[[List[Dict[str, Any]]], Awaitable[List[Optional[int]]]],
+        vehicles_repo: VehiclesRepository,
+        vehicle: Vehicle,
+        user_id: int,
+        check_row: Optional[Callable[[Any], List[str]]] = None,
+) -> ImportReportInResponse:
+    results: List[ImportRowResult] = []
+    batch: List[Tuple[int, BaseModel]] = []
+    mileage = vehicle.mileage
+
+    async def flush() -> None:
+        nonlocal mileage
+
+        created_ids = await create_batch([row.__dict__ for _, row in batch])
+        for (row_number, row), created_id in zip(batch, created_ids):
+            if created_id is None:
+                results.append(ImportRowResult(row=row_number, status=ImportRowStatus.DUPLICATE))
+                continue
+
+            mileage = max(mileage, row.mileage)
+            results.append(ImportRowResult(row=row_number, status=ImportRowStatus.IMPORTED, id=created_id))
+
+        batch.clear()
+
+    row_number = 0
+    async for raw_row in rows:
+        row_number += 1
+
+        if not isinstance(raw_row, dict):
+            results.append(ImportRowResult(
+                row=row_number,
+                status=ImportRowStatus.INVALID,
+                errors=[strings.IMPORT_ROW_NOT_OBJECT],
+            ))
+            continue
+
+        try:
+            row = schema.parse_obj(raw_row)
+        except ValidationError as validation_error:
+            results.append(ImportRowResult(
+                row=row_number,
+                status=ImportRowStatus.INVALID,
+                errors=[_format_validation_error(error) for error in validation_error.errors()],
+            ))
+            continue
+
+        errors = check_row(row) if check_row else []
+        if errors:
+            results.append(ImportRowResult(row=row_number, status=ImportRowStatus.INVALID, errors=errors))
+            continue
+
+        batch.append((row_number, row))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await flush()
+
+    if batch:
+        await flush()
+
+    if mileage > vehicle.mileage:
+        await update_vehicle_mileage(vehicles_repo, vehicle.id, user_id, mileage)
+
+    results.sort(key=lambda result: result.row)
+
+    return ImportReportInResponse(
+        rows=results,
+        imported=sum(result.status == ImportRowStatus.IMPORTED for result in results),
+        duplicates=sum(result.status == ImportRowStatus.DUPLICATE for result in results),
+        invalid=sum(result.status == ImportRowStatus.INVALID for result in results),
+    )
+
+
+async def _read_json_rows(body: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    # A JSON array can only be decoded as a whole, so the body is buffered
+    # up to IMPORT_JSON_MAX_BODY_SIZE; larger imports should be sent as CSV.
+    chunks: List[bytes] = []
+    size = 0
+
+    async for chunk in body:
+        size += len(chunk)
+        if size > IMPORT_JSON_MAX_BODY_SIZE:
+            raise ValueError("import body is too large")
+        chunks.append(chunk)
+
+    try:
+        rows = orjson.loads(b"".join(chunks))
+    except ValueError as decode_error:
+        raise ValueError("unable to decode import body") from decode_error
+
+    if not isinstance(rows, list):
+        raise ValueError("import body must be a list of rows")
+
+    for row in rows:
+        yield row
+
+
+async def _read_csv_rows(body: AsyncIterable[bytes]) -> AsyncIterator[Dict[str, Any]]:
+    decoder = getincrementaldecoder("utf-8-sig")()
+    header: Optional[List[str]] = None
+    buffer = ""
+    record = ""
+
+    async for chunk in body:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+
+        for line in lines:
+            record += line + "\n"
+            if record.count('"') % 2:
+                continue
+
+            values, record = _parse_csv_record(record), ""
+            if header is None:
+                header = [name.strip() for name in values]
+            elif any(values):
+                yield _nest_csv_row(dict(zip(header, values)))
+
+    buffer += decoder.decode(b"", final=True)
+    record += buffer
+    if header is not None and record.strip():
+        yield _nest_csv_row(dict(zip(header, _parse_csv_record(record))))
+
+
+def _parse_csv_record(record: str) -> List[str]:
+    try:
+        return next(csv.reader([record]))
+    except csv.Error as decode_error:
+        raise ValueError("unable to decode import body") from decode_error
+
+
+def _nest_csv_row(row: Dict[str, str]) -> Dict[str, Any]:
+    nested_row: Dict[str, Any] = {}
+
+    for name, value in row.items():
+        if value == "":
+            continue
+
+        prefix, _, field = name.partition("_")
+        if prefix in IMPORT_CSV_NESTED_FIELDS and field:
+            nested_row.setdefault(prefix, {})[field] = value
+        else:
+            nested_row[name] = value
+
+    return nested_row
+
+
+def _format_validation_error(error: Dict[str, Any]) -> str:
+    return "{0}: {1}".format(".".join(str(location) for location in error["loc"]), error["msg"])
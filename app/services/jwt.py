@@ -13,11 +13,14 @@
 #  limitations under the License.
 
 from datetime import datetime, timedelta
-from typing import Dict
+from hashlib import sha256
+from time import time
+from typing import Dict, Optional, Tuple
 
 import jwt
 from pydantic import ValidationError, EmailStr
 
+from app.core.cache import TTLCache
 from app.models.schemas.jwt import JWTMeta, JWTUser
 
 JWT_SUBJECT = "access"
@@ -32,8 +35,21 @@ def create_jwt_token(jwt_content: Dict[str, str], secret_key: str, expires_delta
     return jwt.encode(to_encode, secret_key, algorithm=ALGORITHM)
 
 
-def create_access_token_for_user(user_id: int, username: str, phone: str, secret_key: str) -> str:
-    jwt_user = JWTUser(user_id=user_id, username=username, phone=phone)
+def create_access_token_for_user(
+        user_id: int,
+        username: str,
+        phone: str,
+        secret_key: str,
+        is_admin: bool = False,
+        is_blocked: bool = False,
+) -> str:
+    jwt_user = JWTUser(
+        user_id=user_id,
+        username=username,
+        phone=phone,
+        is_admin=is_admin,
+        is_blocked=is_blocked,
+    )
     return create_jwt_token(
         jwt_content=jwt_user.__dict__,
         secret_key=secret_key,
@@ -41,27 +57,42 @@ def create_access_token_for_user(user_id: int, username: str, phone: str, secret
     )
 
 
+def get_jwt_user_from_token(
+        token: str,
+        secret_key: str,
+        cache: Optional[TTLCache[str, JWTUser]] = None,
+) -> JWTUser:
+    if cache is None:
+        return _decode_jwt_user(token, secret_key)[0]
+
+    token_digest = sha256(token.encode()).hexdigest()
+
+    jwt_user = cache.get(token_digest)
+    if jwt_user is not None:
+        return jwt_user
+
+    jwt_user, expire = _decode_jwt_user(token, secret_key)
+    cache.set(token_digest, jwt_user, ttl=expire.timestamp() - time())
+
+    return jwt_user
+
+
 def get_user_id_from_token(token: str, secret_key: str) -> int:
-    try:
-        return JWTUser(**jwt.decode(token, secret_key, algorithms=[ALGORITHM])).user_id
-    except jwt.PyJWTError as decode_error:
-        raise ValueError("unable to decode JWT token") from decode_error
-    except ValidationError as validation_error:
-        raise ValueError("malformed payload in token") from validation_error
+    return get_jwt_user_from_token(token, secret_key).user_id
 
 
 def get_username_from_token(token: str, secret_key: str) -> str:
-    try:
-        return JWTUser(**jwt.decode(token, secret_key, algorithms=[ALGORITHM])).username
-    except jwt.PyJWTError as decode_error:
-        raise ValueError("unable to decode JWT token") from decode_error
-    except ValidationError as validation_error:
-        raise ValueError("malformed payload in token") from validation_error
+    return get_jwt_user_from_token(token, secret_key).username
 
 
 def get_phone_from_token(token: str, secret_key: str) -> str:
+    return get_jwt_user_from_token(token, secret_key).phone
+
+
+def _decode_jwt_user(token: str, secret_key: str) -> Tuple[JWTUser, datetime]:
     try:
-        return JWTUser(**jwt.decode(token, secret_key, algorithms=[ALGORITHM])).phone
+        payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
+        return JWTUser(**payload), JWTMeta(**payload).exp
     except jwt.PyJWTError as decode_error:
         raise ValueError("unable to decode JWT token") from decode_error
     except ValidationError as validation_error:
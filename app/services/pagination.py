@@ -0,0 +1,48 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple, Type
+
+
+def encode_cursor(*values: Any) -> str:
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str, *types: Type) -> Tuple[Any, ...]:
+    try:
+        payload = json.loads(urlsafe_b64decode(cursor.encode()))
+    except ValueError as decode_error:
+        raise ValueError("unable to decode cursor") from decode_error
+
+    if not isinstance(payload, list) or len(payload) != len(types):
+        raise ValueError("malformed payload in cursor")
+
+    try:
+        return tuple(
+            datetime.fromisoformat(value) if value_type is datetime else value_type(value)
+            for value, value_type in zip(payload, types)
+        )
+    except (TypeError, ValueError) as validation_error:
+        raise ValueError("malformed payload in cursor") from validation_error
+
+
+def get_next_cursor(items: Sequence[Any], limit: int, *fields: str) -> Optional[str]:
+    if not items or len(items) < limit:
+        return None
+
+    return encode_cursor(*(getattr(items[-1], field) for field in fields))
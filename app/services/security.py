@@ -12,12 +12,83 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
 import bcrypt
 from passlib.context import CryptContext
 
+from app.core.metrics import metrics
+
+PASSWORD_HASHING_METRIC = "security.password_hashing"
+
+ResultType = TypeVar("ResultType")
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+class PasswordHashingPool:
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queue_depth = 0
+        self._in_progress = 0
+
+        metrics.register_gauge(f"{PASSWORD_HASHING_METRIC}.queue_depth", lambda: self._queue_depth)
+        metrics.register_gauge(f"{PASSWORD_HASHING_METRIC}.in_progress", lambda: self._in_progress)
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def start(self, max_workers: int) -> None:
+        if self.is_running:
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hashing")
+        self._semaphore = asyncio.Semaphore(max_workers)
+
+    def stop(self) -> None:
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        self._semaphore = None
+
+    async def run(self, func: Callable[..., ResultType], *args: str) -> ResultType:
+        # Without a started pool (scripts, tests) hashing runs inline.
+        if self._executor is None or self._semaphore is None:
+            return func(*args)
+
+        self._queue_depth += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queue_depth -= 1
+
+        self._in_progress += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_progress -= 1
+            self._semaphore.release()
+
+
+password_hashing_pool = PasswordHashingPool()
+
+
+def configure_password_hashing(rounds: int) -> None:
+    # Equal min and max rounds make needs_update flag both weaker and
+    # stronger hashes, so logins move every hash to the configured cost.
+    pwd_context.update(
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
 def generate_salt() -> str:
     return bcrypt.gensalt().decode()
 
@@ -28,3 +99,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+def password_needs_update(hashed_password: str) -> bool:
+    return pwd_context.needs_update(hashed_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hashing_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hashing_pool.run(get_password_hash, password)
@@ -12,18 +12,28 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 import contextlib
-from typing import List
-
-import xmltodict as xmltodict
-from httpx import AsyncClient
 from datetime import datetime
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
 
+import xmltodict as xmltodict
 from fastapi import status
+from httpx import AsyncBaseTransport, AsyncClient, HTTPError, Limits, Response
+from loguru import logger
 from pydantic import HttpUrl
 
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.core.metrics import metrics
+from app.models.domain.sms_outbox import SmsSendStatus
+
 MAX_CHARS_IN_MESSAGE = 160
 
+SMS_MODEM_METRIC = "sms.modems"
+VERIFICATION_TOKEN_HEADER = "__RequestVerificationToken"
+SESSION_ERROR_CODES = ("125001", "125002", "125003")
+
 SMS_LIST_TEMPLATE = """<request>
     <PageIndex>1</PageIndex>
     <ReadCount>20</ReadCount>
@@ -48,130 +58,336 @@ SMS_SEND_TEMPLATE = """<request>
     </request>"""
 
 
-async def is_hilink(device_host: HttpUrl) -> bool:
-    async with AsyncClient(base_url=device_host) as client:
-        response = await client.get("/api/device/information", timeout=2.0)
+class HiLinkClient:
+
+    def __init__(
+            self,
+            device_host: HttpUrl,
+            name: str = SMS_MODEM_METRIC,
+            timeout: float = 5.0,
+            session_ttl: float = 300.0,
+            max_connections: int = 4,
+            failure_threshold: int = 3,
+            reset_timeout: float = 30.0,
+            transport: Optional[AsyncBaseTransport] = None,
+    ) -> None:
+        self.device_host = device_host
+        self.name = name
+        self.session_ttl = session_ttl
+        self.circuit_breaker = CircuitBreaker(f"{name}.circuit_breaker", failure_threshold, reset_timeout)
+
+        self._client = AsyncClient(
+            base_url=device_host,
+            timeout=timeout,
+            limits=Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport,
+        )
+        self._session: Optional[Dict[str, str]] = None
+        self._session_expires_at = 0.0
+        self._session_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def is_available(self) -> bool:
+        return not self.circuit_breaker.is_open
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def check_health(self) -> None:
+        if not self.circuit_breaker.allow_request():
+            return
+
+        if await self.is_hilink():
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure()
+
+    async def is_hilink(self) -> bool:
+        try:
+            response = await self._client.get("/api/device/information", timeout=2.0)
+        except HTTPError as exception:
+            logger.error(exception)
+            return False
 
-    if response.status_code != status.HTTP_200_OK:
-        return False
+        return response.status_code == status.HTTP_200_OK
 
-    return True
+    async def get_headers(self, refresh: bool = False) -> Dict[str, str]:
+        async with self._session_lock:
+            if refresh or self._session is None or self._session_expires_at <= monotonic():
+                self._session = await self._fetch_session()
+                self._session_expires_at = monotonic() + self.session_ttl
 
+            return dict(self._session)
 
-async def get_headers(device_host: HttpUrl) -> dict:
-    token = None
-    session_id = None
+    async def get_sms(self) -> Tuple[List[str], List[Dict[str, Any]]]:
+        _, data = await self._request("POST", "/api/sms/sms-list", content=SMS_LIST_TEMPLATE)
 
-    async with AsyncClient(base_url=device_host) as client:
-        response = await client.get("/api/webserver/SesTokInfo")
+        num_messages = int(data["response"]["Count"])
+        if not num_messages:
+            return [], []
 
-    if response.status_code != status.HTTP_200_OK:
-        return {'__RequestVerificationToken': token, 'Cookie': session_id}
+        messages_r = data["response"]["Messages"]["Message"]
+        if num_messages == 1:
+            messages_r = [messages_r]
 
-    with contextlib.suppress(Exception):
-        d = xmltodict.parse(response.text, xml_attribs=True)
-        if 'response' in d and 'TokInfo' in d["response"]:
-            token = d['response']['TokInfo']
+        return get_content(messages_r, num_messages), messages_r
 
-        if 'response' in d and 'SesInfo' in d['response']:
-            session_id = d['response']['SesInfo']
+    async def del_message(self, index: int) -> bool:
+        _, data = await self._request("POST", "/api/sms/delete-sms", content=SMS_DEL_TEMPLATE.format(index=index))
 
-        headers = {'__RequestVerificationToken': token, 'Cookie': session_id}
+        return data.get("response") == "OK"
 
-    return headers
+    async def get_unread(self) -> int:
+        _, data = await self._request("GET", "/api/monitoring/check-notifications")
 
+        return int(data["response"]["UnreadMessage"])
 
-async def get_sms(device_host: HttpUrl, headers: dict):
-    payload = SMS_LIST_TEMPLATE
+    async def get_send_status(self) -> SmsSendStatus:
+        _, data = await self._request("GET", "/api/sms/send-status")
 
-    async with AsyncClient(base_url=device_host) as client:
-        response = await client.post("/api/sms/sms-list", data=payload, headers=headers)
+        return _parse_send_status(data)
 
-    d = xmltodict.parse(response.text, xml_attribs=True)
-    num_messages = int(d['response']['Count'])
-    messages_r = d['response']['Messages']['Message']
+    async def wait_send_sms_to_phone(self, phone_number: str) -> bool:
+        status = await self.get_send_status()
 
-    if num_messages == 1:
-        temp = messages_r
-        messages_r = [temp]
+        return not status.in_progress and phone_number in status.succeeded_phones
 
-    messages = get_content(messages_r, num_messages)
-    return messages, messages_r
+    async def send_sms_to_phone(self, phone: str, message: str) -> bool:
+        payload = SMS_SEND_TEMPLATE.format(
+            phone=phone,
+            content=message,
+            length=len(message),
+            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
 
+        try:
+            response, data = await self._request("POST", "/api/sms/send-sms", content=payload)
+        except (HTTPError, ValueError, CircuitOpenError) as exception:
+            logger.error(exception)
+            return False
 
-def get_content(data, num_messages) -> List[str]:
-    messages = []
-    for i in range(num_messages):
-        message = data[i]
-        number = message['Phone']
-        content = message['Content']
-        date = message['Date']
-        messages.append('Message from ' + number + ' recieved ' + date + ' : ' + str(content))
+        return response.status_code == status.HTTP_200_OK and data.get("response") == "OK"
+
+    async def send_verify_code_to_phone(self, phone: str, verify_code: int) -> bool:
+        return await self.send_sms_to_phone(phone, get_verification_message(verify_code))
+
+    async def _fetch_session(self) -> Dict[str, str]:
+        response = await self._call("GET", "/api/webserver/SesTokInfo")
+        if response.status_code != status.HTTP_200_OK:
+            raise ValueError("unable to get HiLink session: HTTP {0}".format(response.status_code))
+
+        data = _parse_response(response)
+        try:
+            return {
+                VERIFICATION_TOKEN_HEADER: data["response"]["TokInfo"],
+                "Cookie": data["response"]["SesInfo"],
+            }
+        except (KeyError, TypeError) as exception:
+            raise ValueError("malformed HiLink session info") from exception
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> Tuple[Response, Dict[str, Any]]:
+        if method == "GET":
+            return await self._request_with_session(method, url, **kwargs)
+
+        # Every write consumes the one-time verification token, so writes go out one at a time
+        # from reading the token until the rotated one is stored.
+        async with self._write_lock:
+            return await self._request_with_session(method, url, **kwargs)
+
+    async def _request_with_session(self, method: str, url: str, **kwargs: Any) -> Tuple[Response, Dict[str, Any]]:
+        response, data = await self._send(method, url, await self.get_headers(), **kwargs)
+
+        if _get_error_code(data) in SESSION_ERROR_CODES:
+            response, data = await self._send(method, url, await self.get_headers(refresh=True), **kwargs)
+
+        return response, data
+
+    async def _send(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str],
+            **kwargs: Any,
+    ) -> Tuple[Response, Dict[str, Any]]:
+        response = await self._call(method, url, headers=headers, **kwargs)
+
+        # Modems hand out a fresh one-time verification token with every write.
+        next_token = response.headers.get(VERIFICATION_TOKEN_HEADER)
+        if next_token:
+            async with self._session_lock:
+                if self._session is not None:
+                    self._session[VERIFICATION_TOKEN_HEADER] = next_token.split("#")[0]
+
+        return response, _parse_response(response)
+
+    async def _call(self, method: str, url: str, **kwargs: Any) -> Response:
+        self.circuit_breaker.check()
+
+        try:
+            response = await self._client.request(method, url, **kwargs)
+        except HTTPError:
+            self.circuit_breaker.record_failure()
+            raise
+
+        if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+        return response
 
-    return messages
 
+class HiLinkPool:
 
-async def del_message(device_host: HttpUrl, headers: dict, index: int) -> None:
-    payload = SMS_DEL_TEMPLATE.format(index=index)
+    def __init__(self, clients: List[HiLinkClient], send_interval: float) -> None:
+        self.clients = clients
+        self.send_interval = send_interval
 
-    async with AsyncClient(base_url=device_host) as client:
-        response = await client.post("/api/sms/delete-sms", data=payload, headers=headers)
+        # Every modem keeps a virtual clock of the next moment it may send,
+        # so reserving a slot never has to wait on another coroutine.
+        self._next_send_at = [0.0] * len(clients)
+        self._queue_depth = [0] * len(clients)
+        self._unread = [0] * len(clients)
 
-    d = xmltodict.parse(response.text, xml_attribs=True)
-    print(d['response'])
+        for index, client in enumerate(clients):
+            metrics.register_gauge(f"{client.name}.queue_depth", lambda index=index: self._queue_depth[index])
+            metrics.register_gauge(f"{client.name}.unread", lambda index=index: self._unread[index])
 
+    @classmethod
+    def from_hosts(cls, device_hosts: List[HttpUrl], send_interval: float, **kwargs: Any) -> "HiLinkPool":
+        clients = [
+            HiLinkClient(device_host, name=f"{SMS_MODEM_METRIC}.{index}", **kwargs)
+            for index, device_host in enumerate(device_hosts)
+        ]
 
-async def get_unread(device_host: HttpUrl, headers: dict) -> int:
-    async with AsyncClient(base_url=device_host) as client:
-        response = await client.get("/api/monitoring/check-notifications", headers=headers)
+        return cls(clients, send_interval)
 
-    d = xmltodict.parse(response.text, xml_attribs=True)
-    unread = int(d['response']['UnreadMessage'])
+    @property
+    def size(self) -> int:
+        return len(self.clients)
 
-    return unread
+    @property
+    def is_available(self) -> bool:
+        return any(client.is_available for client in self.clients)
 
+    async def close(self) -> None:
+        await asyncio.gather(*(client.close() for client in self.clients))
 
-async def wait_send_sms_to_phone(device_host: HttpUrl, phone_number: str) -> bool:
-    async with AsyncClient(base_url=device_host) as client:
-        response = await client.get("/api/sms/send-status")
+    async def check_health(self) -> None:
+        await asyncio.gather(*(self._check_modem_health(index) for index in range(self.size)))
 
-    d = xmltodict.parse(response.text, xml_attribs=True)
-    phone = d["response"]["Phone"]
-    phone_success = d["response"]["SucPhone"]
-    phone_fail = d["response"]["FailPhone"]
-    total_count = d["response"]["TotalCount"]
-    current_index = d["response"]["CurIndex"]
+    async def send_sms_to_phone(self, phone: str, message: str) -> bool:
+        return await self.send_message(phone, message) is not None
 
-    if phone and phone != phone_number:
-        return False
-    if phone_success and phone_success != phone_number:
-        return False
-    if phone_fail and phone_fail == phone_number:
-        return False
+    async def send_message(self, phone: str, message: str) -> Optional[str]:
+        index, delay = self._reserve_modem()
+        client = self.clients[index]
 
-    if current_index < total_count:
-        return False
+        self._queue_depth[index] += 1
+        try:
+            await asyncio.sleep(delay)
+            if not client.is_available:
+                raise CircuitOpenError(f"{client.name} went down before its turn")
 
-    return True
+            if not await client.send_sms_to_phone(phone, message):
+                return None
+        finally:
+            self._queue_depth[index] -= 1
 
+        metrics.increment(f"{client.name}.sent")
 
-async def send_sms_to_phone(device_host: HttpUrl, phone: str, message: str) -> bool:
-    payload = SMS_SEND_TEMPLATE.format(
-        phone=phone,
-        content=message,
-        length=len(message),
-        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        return client.device_host
+
+    async def get_send_status(self, gateway: str) -> SmsSendStatus:
+        index = self._get_modem_index(gateway)
+        status = await self.clients[index].get_send_status()
+        if status.in_progress:
+            # The modem is still draining its own queue, give it one more slot.
+            self._next_send_at[index] = max(self._next_send_at[index], monotonic()) + self.send_interval
+
+        return status
+
+    async def send_verify_code_to_phone(self, phone: str, verify_code: int) -> bool:
+        return await self.send_sms_to_phone(phone, get_verification_message(verify_code))
+
+    def _reserve_modem(self) -> Tuple[int, float]:
+        now = monotonic()
+        available = [index for index, client in enumerate(self.clients) if client.is_available]
+        if not available:
+            raise CircuitOpenError("no SMS gateway is available")
+
+        index = min(available, key=lambda i: (max(self._next_send_at[i], now), self._queue_depth[i]))
+        send_at = max(self._next_send_at[index], now)
+        self._next_send_at[index] = send_at + self.send_interval
+
+        return index, send_at - now
+
+    async def _check_modem_health(self, index: int) -> None:
+        client = self.clients[index]
+        await client.check_health()
+        if not client.is_available:
+            return
+
+        with contextlib.suppress(HTTPError, ValueError, KeyError, TypeError, CircuitOpenError):
+            self._unread[index] = await client.get_unread()
+
+    def has_gateway(self, gateway: Optional[str]) -> bool:
+        return any(client.device_host == gateway for client in self.clients)
+
+    def _get_modem_index(self, gateway: str) -> int:
+        for index, client in enumerate(self.clients):
+            if client.device_host == gateway:
+                return index
+
+        raise KeyError(gateway)
+
+
+def get_verification_message(verify_code: int) -> str:
+    return "{code} is your verification code.".format(code=verify_code)
+
+
+def get_content(data, num_messages) -> List[str]:
+    messages = []
+    for i in range(num_messages):
+        message = data[i]
+        number = message['Phone']
+        content = message['Content']
+        date = message['Date']
+        messages.append('Message from ' + number + ' recieved ' + date + ' : ' + str(content))
+
+    return messages
+
+
+def _parse_response(response: Response) -> Dict[str, Any]:
+    try:
+        return xmltodict.parse(response.text, xml_attribs=True) or {}
+    except Exception as exception:
+        raise ValueError("malformed HiLink response") from exception
+
+
+def _parse_send_status(data: Dict[str, Any]) -> SmsSendStatus:
+    try:
+        response = data["response"]
+        total_count = int(response["TotalCount"] or 0)
+        current_index = int(response["CurIndex"] or 0)
+    except (KeyError, TypeError, ValueError) as exception:
+        raise ValueError("malformed HiLink send status") from exception
+
+    return SmsSendStatus(
+        in_progress=current_index < total_count,
+        succeeded_phones=_split_phones(response.get("SucPhone")),
+        failed_phones=_split_phones(response.get("FailPhone")),
     )
 
-    async with AsyncClient(base_url=device_host) as client:
-        response_send = await client.post("/api/sms/send-sms", data=payload)
-        if response_send.status_code != status.HTTP_200_OK:
-            return False
 
-    return True
+def _split_phones(phones: Optional[str]) -> List[str]:
+    return [phone for phone in (phones or "").split(";") if phone]
 
 
-async def send_verify_code_to_phone(device_host: HttpUrl, phone: str, verify_code: int) -> bool:
-    verification_message = "{code} is your verification code.".format(code=verify_code)
+def _get_error_code(data: Dict[str, Any]) -> Optional[str]:
+    error = data.get("error")
+    if not isinstance(error, dict):
+        return None
 
-    return await send_sms_to_phone(device_host, phone, verification_message)
+    return error.get("code")
@@ -0,0 +1,149 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+from collections import defaultdict
+from time import monotonic
+from datetime import datetime
+from typing import Dict, List, Set, Union
+
+from loguru import logger
+
+from app.core.metrics import metrics
+from app.database.repositories.sms_outbox import SmsOutboxRepository
+from app.models.domain.sms_outbox import SmsOutboxMessage, SmsSendStatus
+from app.services.sms_outbox import SmsOutboxSender
+
+SMS_DELIVERY_METRIC = "sms_delivery"
+SMS_DELIVERY_ERROR = "modem failed to deliver the message"
+
+
+class SmsDeliveryTracker:
+
+    def __init__(
+            self,
+            sms_outbox_sender: SmsOutboxSender,
+            poll_interval: float,
+            max_poll_interval: float,
+            window: float,
+    ) -> None:
+        self.sms_outbox_sender = sms_outbox_sender
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.window = window
+
+        self._poll_delays: Dict[str, float] = {}
+        self._next_poll_at: Dict[str, float] = {}
+        self._tracked_messages: Dict[str, Set[int]] = {}
+        self._resolved_up_to: Dict[str, datetime] = {}
+        self._messages_in_flight = 0
+
+        metrics.register_gauge(f"{SMS_DELIVERY_METRIC}.in_flight", lambda: self._messages_in_flight)
+
+    async def track_deliveries(self) -> None:
+        async with self.sms_outbox_sender.session_maker() as session:
+            sms_outbox_repo = SmsOutboxRepository(session)
+
+            # Messages nobody confirmed within the window are given up on, so they stop being scanned.
+            expired = await sms_outbox_repo.expire_messages_in_flight(self.window)
+            if expired:
+                metrics.increment(f"{SMS_DELIVERY_METRIC}.expired", expired)
+
+            messages = await sms_outbox_repo.get_messages_in_flight(self.window)
+            self._messages_in_flight = len(messages)
+
+            messages_by_gateway = self._get_due_gateways(messages)
+            statuses = await asyncio.gather(
+                *(self.sms_outbox_sender.sms_client.get_send_status(gateway) for gateway in messages_by_gateway),
+                return_exceptions=True,
+            )
+
+            for (gateway, gateway_messages), status in zip(messages_by_gateway.items(), statuses):
+                resolved = await self._resolve_messages(sms_outbox_repo, gateway_messages, status)
+                self._schedule_next_poll(gateway, resolved)
+
+    def _get_due_gateways(self, messages: List[SmsOutboxMessage]) -> Dict[str, List[SmsOutboxMessage]]:
+        messages_by_gateway: Dict[str, List[SmsOutboxMessage]] = defaultdict(list)
+        for message in messages:
+            # Rows without a gateway or sent through a modem that has since been removed have
+            # nobody to ask, so they stay "sent" until they expire.
+            if not self.sms_outbox_sender.sms_client.has_gateway(message.gateway):
+                continue
+            messages_by_gateway[message.gateway].append(message)
+
+        now = monotonic()
+        due_gateways = {}
+        for gateway, gateway_messages in messages_by_gateway.items():
+            # Send status only describes the modem's latest job, so messages sent
+            # before the last resolved one stay "sent" until they expire.
+            resolved_up_to = self._resolved_up_to.get(gateway)
+            if resolved_up_to is not None:
+                gateway_messages = [message for message in gateway_messages if message.sent_at > resolved_up_to]
+            if not gateway_messages:
+                continue
+
+            message_ids = {message.id for message in gateway_messages}
+            # A freshly sent message cuts the backoff short for its gateway.
+            has_new_messages = not message_ids <= self._tracked_messages.get(gateway, set())
+            self._tracked_messages[gateway] = message_ids
+
+            if has_new_messages or self._next_poll_at.get(gateway, 0.0) <= now:
+                due_gateways[gateway] = gateway_messages
+
+        for gateway in (set(self._tracked_messages) | set(self._resolved_up_to)) - set(messages_by_gateway):
+            self._forget_gateway(gateway)
+
+        return due_gateways
+
+    async def _resolve_messages(
+            self,
+            sms_outbox_repo: SmsOutboxRepository,
+            messages: List[SmsOutboxMessage],
+            status: Union[SmsSendStatus, BaseException],
+    ) -> bool:
+        if isinstance(status, BaseException):
+            logger.error(status)
+            return False
+
+        if status.in_progress:
+            return False
+
+        message = messages[-1]
+        if message.phone in status.succeeded_phones:
+            metrics.increment(f"{SMS_DELIVERY_METRIC}.delivered")
+            await sms_outbox_repo.mark_message_as_delivered(message.id)
+        elif message.phone in status.failed_phones:
+            metrics.increment(f"{SMS_DELIVERY_METRIC}.failed")
+            await self.sms_outbox_sender.reschedule_message(sms_outbox_repo, message, SMS_DELIVERY_ERROR)
+        else:
+            return False
+
+        self._resolved_up_to[message.gateway] = message.sent_at
+
+        return True
+
+    def _schedule_next_poll(self, gateway: str, resolved: bool) -> None:
+        if resolved:
+            delay = self.poll_interval
+        else:
+            delay = min(self._poll_delays.get(gateway, self.poll_interval / 2) * 2, self.max_poll_interval)
+
+        self._poll_delays[gateway] = delay
+        self._next_poll_at[gateway] = monotonic() + delay
+
+    def _forget_gateway(self, gateway: str) -> None:
+        self._tracked_messages.pop(gateway, None)
+        self._poll_delays.pop(gateway, None)
+        self._next_poll_at.pop(gateway, None)
+        self._resolved_up_to.pop(gateway, None)
@@ -0,0 +1,171 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+from typing import Dict, Optional, Union
+
+from loguru import logger
+from sqlalchemy.orm import sessionmaker
+
+from app.core.metrics import metrics
+from app.database.repositories.sms_outbox import SmsOutboxRepository
+from app.models.domain.sms_outbox import SmsOutboxMessage, SmsOutboxState
+from app.core.circuit_breaker import CircuitOpenError
+from app.services.sms import HiLinkPool
+
+SMS_OUTBOX_METRIC = "sms_outbox"
+SMS_SEND_ERROR = "modem rejected the message"
+
+
+class SmsOutboxSender:
+
+    def __init__(
+            self,
+            session_maker: sessionmaker,
+            sms_client: HiLinkPool,
+            batch_size: int,
+            max_attempts: int,
+            backoff: float,
+            max_backoff: float,
+            lease: float,
+    ) -> None:
+        self.session_maker = session_maker
+        self.sms_client = sms_client
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.lease = lease
+
+        self._pending_messages = 0
+        self._messages_by_state: Dict[SmsOutboxState, int] = {state: 0 for state in SmsOutboxState}
+
+        metrics.register_gauge(f"{SMS_OUTBOX_METRIC}.queue_length", lambda: self._pending_messages)
+        for state in SmsOutboxState:
+            metrics.register_gauge(
+                f"{SMS_OUTBOX_METRIC}.{state.value}",
+                lambda state=state: self._messages_by_state[state],
+            )
+
+    async def send_due_messages(self) -> None:
+        async with self.session_maker() as session:
+            sms_outbox_repo = SmsOutboxRepository(session)
+
+            if self.sms_client.is_available:
+                # The batch size is per modem, so every gateway gets its share of one claim.
+                messages = await sms_outbox_repo.claim_due_messages(
+                    self._get_claim_batch_size() * self.sms_client.size,
+                    self.lease,
+                )
+                record_lock = asyncio.Lock()
+                await asyncio.gather(
+                    *(self._send_message(sms_outbox_repo, record_lock, message) for message in messages)
+                )
+
+            self._pending_messages = await sms_outbox_repo.count_pending_messages()
+
+    async def refresh_state_counts(self) -> None:
+        # Counting every state reads the whole outbox, so it runs on its own slower schedule.
+        async with self.session_maker() as session:
+            self._messages_by_state = await SmsOutboxRepository(session).count_messages_by_state()
+
+    def get_retry_delay(self, attempts: int) -> float:
+        return min(self.backoff * 2 ** (attempts - 1), self.max_backoff)
+
+    async def reschedule_message(
+            self,
+            sms_outbox_repo: SmsOutboxRepository,
+            message: SmsOutboxMessage,
+            error: str,
+    ) -> None:
+        metrics.increment(f"{SMS_OUTBOX_METRIC}.attempts.failed")
+
+        if message.attempts >= self.max_attempts:
+            logger.error("SMS {} to {} failed after {} attempts", message.id, message.phone, message.attempts)
+            await sms_outbox_repo.mark_message_as_failed(message.id, error)
+            return
+
+        await sms_outbox_repo.mark_message_as_failed(
+            message.id,
+            error,
+            retry_in=self.get_retry_delay(message.attempts),
+        )
+
+    def _get_claim_batch_size(self) -> int:
+        # Each modem sends one message per interval, so the last one of a claim goes out
+        # batch_size * send_interval after the claim; keep that well inside the lease.
+        if self.sms_client.send_interval <= 0:
+            return self.batch_size
+
+        return min(self.batch_size, max(1, int(self.lease / (2 * self.sms_client.send_interval))))
+
+    async def _send_message(
+            self,
+            sms_outbox_repo: SmsOutboxRepository,
+            record_lock: asyncio.Lock,
+            message: SmsOutboxMessage,
+    ) -> None:
+        result: Union[Optional[str], BaseException]
+        try:
+            result = await self.sms_client.send_message(message.phone, message.message)
+        except Exception as exception:
+            result = exception
+
+        # Record every outcome as soon as it is known, so a shutdown or an expired lease
+        # never sends an already delivered message again. The session takes one write at a time.
+        async with record_lock:
+            await self._record_attempt(sms_outbox_repo, message, result)
+
+    async def _record_attempt(
+            self,
+            sms_outbox_repo: SmsOutboxRepository,
+            message: SmsOutboxMessage,
+            result: Union[Optional[str], BaseException],
+    ) -> None:
+        # Messages that never reached a modem are picked up again once their lease expires.
+        if isinstance(result, CircuitOpenError):
+            return
+
+        if isinstance(result, BaseException):
+            logger.error(result)
+        elif result is not None:
+            metrics.increment(f"{SMS_OUTBOX_METRIC}.attempts.succeeded")
+            await sms_outbox_repo.mark_message_as_sent(message.id, result)
+            return
+
+        await self.reschedule_message(sms_outbox_repo, message, SMS_SEND_ERROR)
+
+
+class SmsOutboxCleaner:
+
+    def __init__(self, session_maker: sessionmaker, retention: float, batch_size: int) -> None:
+        self.session_maker = session_maker
+        self.retention = retention
+        self.batch_size = batch_size
+
+    async def delete_finished_messages(self) -> None:
+        deleted = 0
+
+        async with self.session_maker() as session:
+            sms_outbox_repo = SmsOutboxRepository(session)
+
+            while True:
+                batch_deleted = await sms_outbox_repo.delete_finished_messages(self.retention, self.batch_size)
+                deleted += batch_deleted
+
+                if batch_deleted < self.batch_size:
+                    break
+
+        if deleted:
+            logger.info("Deleted {} finished outbox messages", deleted)
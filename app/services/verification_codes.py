@@ -0,0 +1,44 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from loguru import logger
+from sqlalchemy.orm import sessionmaker
+
+from app.database.repositories.verification_codes import VerificationRepository
+
+
+class VerificationCodesCleaner:
+
+    def __init__(self, session_maker: sessionmaker, code_ttl: float, batch_size: int) -> None:
+        self.session_maker = session_maker
+        self.code_ttl = code_ttl
+        self.batch_size = batch_size
+
+    async def delete_stale_verification_codes(self) -> None:
+        deleted = 0
+
+        async with self.session_maker() as session:
+            verification_repo = VerificationRepository(session)
+
+            while True:
+                batch_deleted = await verification_repo.delete_stale_verification_codes(
+                    self.code_ttl, self.batch_size
+                )
+                deleted += batch_deleted
+
+                if batch_deleted < self.batch_size:
+                    break
+
+        if deleted:
+            logger.info("Deleted {} expired or verified verification codes", deleted)
@@ -0,0 +1,190 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""In-process emulator of a Huawei HiLink USB modem.
+
+It speaks the subset of the HiLink XML API used by app.services.sms. Hand
+it to a client through ``httpx.ASGITransport(app=emulator.app)``, or serve
+it on localhost with ``uvicorn benchmarks.hilink_emulator:app``.
+"""
+
+import asyncio
+import random
+from datetime import datetime
+from secrets import token_hex
+from time import monotonic
+from typing import Any, Dict, List, Optional
+
+import xmltodict
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+VERIFICATION_TOKEN_HEADER = "__RequestVerificationToken"
+SESSION_ERROR_CODE = "125002"
+
+
+class HiLinkEmulator:
+
+    def __init__(
+            self,
+            latency: float = 0.0,
+            failure_rate: float = 0.0,
+            send_duration: float = 0.0,
+            delivery_failure_rate: float = 0.0,
+            seed: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.send_duration = send_duration
+        self.delivery_failure_rate = delivery_failure_rate
+
+        self.sent_messages: List[Dict[str, str]] = []
+        self.inbox: List[Dict[str, Any]] = []
+        self.requests = 0
+        self.sessions_issued = 0
+
+        self._random = random.Random(seed)
+        self._session = token_hex(16)
+        self._token = token_hex(16)
+        self._send_job: Optional[Dict[str, Any]] = None
+
+        self.app = Starlette(
+            routes=[
+                Route("/api/device/information", self.device_information),
+                Route("/api/webserver/SesTokInfo", self.session_token_info),
+                Route("/api/sms/send-sms", self.send_sms, methods=["POST"]),
+                Route("/api/sms/send-status", self.send_status),
+                Route("/api/sms/sms-list", self.sms_list, methods=["POST"]),
+                Route("/api/sms/delete-sms", self.delete_sms, methods=["POST"]),
+                Route("/api/monitoring/check-notifications", self.check_notifications),
+            ],
+            middleware=[Middleware(BaseHTTPMiddleware, dispatch=self._emulate_link)],
+        )
+
+    def receive_sms(self, phone: str, content: str) -> None:
+        self.inbox.append({
+            "Index": str(40000 + len(self.inbox)),
+            "Phone": phone,
+            "Content": content,
+            "Date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "Smstat": "0",
+        })
+
+    def expire_session(self) -> None:
+        self._session = token_hex(16)
+        self._token = token_hex(16)
+
+    async def device_information(self, request: Request) -> Response:
+        return _xml({"DeviceName": "E3372", "SerialNumber": "EMULATOR", "Imei": "000000000000000"})
+
+    async def session_token_info(self, request: Request) -> Response:
+        self.sessions_issued += 1
+
+        return _xml({"SesInfo": "SessionID={0}".format(self._session), "TokInfo": self._token})
+
+    async def send_sms(self, request: Request) -> Response:
+        # Read the body first so checking and rotating the token happen without a yield in between.
+        body = await request.body()
+        if not self._is_authorized(request):
+            return _error(SESSION_ERROR_CODE)
+
+        payload = xmltodict.parse(body)["request"]
+        phone = payload["Phones"]["Phone"]
+        self.sent_messages.append({"phone": phone, "content": payload["Content"]})
+
+        self._send_job = {
+            "phone": phone,
+            "finishes_at": monotonic() + self.send_duration,
+            "failed": self._random.random() < self.delivery_failure_rate,
+        }
+
+        # Real modems rotate the one-time token on every write.
+        self._token = token_hex(16)
+        response = _xml("OK")
+        response.headers[VERIFICATION_TOKEN_HEADER] = "{0}#{1}".format(self._token, token_hex(16))
+
+        return response
+
+    async def send_status(self, request: Request) -> Response:
+        job = self._send_job
+        if job is None:
+            return _xml({"Phone": None, "SucPhone": None, "FailPhone": None, "TotalCount": "0", "CurIndex": "0"})
+
+        if monotonic() < job["finishes_at"]:
+            return _xml({"Phone": job["phone"], "SucPhone": None, "FailPhone": None, "TotalCount": "1", "CurIndex": "0"})
+
+        return _xml({
+            "Phone": None,
+            "SucPhone": None if job["failed"] else job["phone"],
+            "FailPhone": job["phone"] if job["failed"] else None,
+            "TotalCount": "1",
+            "CurIndex": "1",
+        })
+
+    async def sms_list(self, request: Request) -> Response:
+        if not self._is_authorized(request):
+            return _error(SESSION_ERROR_CODE)
+
+        if not self.inbox:
+            return _xml({"Count": "0", "Messages": None})
+
+        messages = self.inbox[0] if len(self.inbox) == 1 else list(self.inbox)
+
+        return _xml({"Count": str(len(self.inbox)), "Messages": {"Message": messages}})
+
+    async def delete_sms(self, request: Request) -> Response:
+        if not self._is_authorized(request):
+            return _error(SESSION_ERROR_CODE)
+
+        index = xmltodict.parse(await request.body())["request"]["Index"]
+        self.inbox = [message for message in self.inbox if message["Index"] != index]
+
+        return _xml("OK")
+
+    async def check_notifications(self, request: Request) -> Response:
+        unread = sum(1 for message in self.inbox if message["Smstat"] == "0")
+
+        return _xml({"UnreadMessage": str(unread), "SmsStorageFull": "0", "OnlineUpdateStatus": "10"})
+
+    async def _emulate_link(self, request: Request, call_next: Any) -> Response:
+        self.requests += 1
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if self._random.random() < self.failure_rate:
+            return Response(status_code=500)
+
+        return await call_next(request)
+
+    def _is_authorized(self, request: Request) -> bool:
+        return (
+            request.headers.get(VERIFICATION_TOKEN_HEADER) == self._token
+            and self._session in request.headers.get("Cookie", "")
+        )
+
+
+def _xml(response: Any) -> Response:
+    return Response(xmltodict.unparse({"response": response}), media_type="text/xml")
+
+
+def _error(code: str) -> Response:
+    return Response(xmltodict.unparse({"error": {"code": code, "message": ""}}), media_type="text/xml")
+
+
+app = HiLinkEmulator().app
@@ -0,0 +1,127 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Serialization cost of list responses and import bodies, json vs orjson.
+
+List responses are timed end to end, from the response model to the rendered
+body: jsonable_encoder with JSONResponse (before), jsonable_encoder with
+ORJSONResponse (the default response class) and model.dict() with
+ORJSONResponse (render_response_model, used by the fuel and event lists).
+
+    python -m benchmarks.json_serialization --items 100 1000 --repeat 20
+"""
+
+import argparse
+import json
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.api.responses import render_response_model
+from app.models.domain.event import EventState
+from app.models.domain.fuel import FuelType
+from app.models.schemas.events import ListOfEventsInResponse
+from app.models.schemas.fuel import ListOfFuelsInResponse
+
+STARTED_AT = datetime(2022, 6, 1, 12, 0)
+
+
+def make_location(index: int) -> Dict[str, Any]:
+    return {"id": index, "description": "Gas station #{0}".format(index), "latitude": 55.75, "longitude": 37.61}
+
+
+def make_fuels(items: int) -> ListOfFuelsInResponse:
+    fuels = [
+        {
+            "id": index,
+            "fuel_type": FuelType.PETROL_95,
+            "quantity": 42.5,
+            "price": 2380.0,
+            "mileage": 100000 + index * 450,
+            "is_full": bool(index % 2),
+            "location": make_location(index),
+            "created_at": STARTED_AT + timedelta(days=index),
+            "updated_at": STARTED_AT + timedelta(days=index),
+        }
+        for index in range(items)
+    ]
+
+    return ListOfFuelsInResponse(fuels=fuels, count=items)
+
+
+def make_events(items: int) -> ListOfEventsInResponse:
+    events = [
+        {
+            "id": index,
+            "author": {"id": index, "username": "driver{0}".format(index), "phone": "+7999{0:07d}".format(index)},
+            "title": "Meetup #{0}".format(index),
+            "description": "Weekend drive",
+            "thumbnail": "https://example.com/{0}.png".format(index),
+            "body": "Route, stops and a coffee break. " * 10,
+            "started_at": STARTED_AT + timedelta(days=index),
+            "location": make_location(index),
+            "event_state": EventState.PLANNED,
+            "created_at": STARTED_AT,
+            "updated_at": STARTED_AT,
+        }
+        for index in range(items)
+    ]
+
+    return ListOfEventsInResponse(events=events, events_count=items)
+
+
+def measure(repeat: int, callback: Callable[[], Any]) -> float:
+    started_at = perf_counter()
+    for _ in range(repeat):
+        callback()
+
+    return (perf_counter() - started_at) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print("{0:>8} {1:>6} {2:>9} {3:>11} {4:>11} {5:>8}".format(
+        "payload", "items", "json, ms", "orjson, ms", "direct, ms", "speedup",
+    ))
+
+    for items in args.items:
+        for name, response in (("fuels", make_fuels(items)), ("events", make_events(items))):
+            before = measure(args.repeat, lambda: JSONResponse(jsonable_encoder(response)))
+            encoded = measure(args.repeat, lambda: ORJSONResponse(jsonable_encoder(response)))
+            after = measure(args.repeat, lambda: render_response_model(response))
+
+            print("{0:>8} {1:>6} {2:>9.2f} {3:>11.2f} {4:>11.2f} {5:>7.1f}x".format(
+                name, items, before, encoded, after, before / after,
+            ))
+
+        rows: List[Dict[str, Any]] = jsonable_encoder(make_fuels(items).fuels)
+        body = json.dumps(rows).encode()
+        before = measure(args.repeat, lambda: json.loads(body))
+        after = measure(args.repeat, lambda: orjson.loads(body))
+
+        print("{0:>8} {1:>6} {2:>9.2f} {3:>11.2f} {4:>11} {5:>7.1f}x".format(
+            "import", items, before, after, "-", before / after,
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Login throughput per core at each bcrypt cost.
+
+    python -m benchmarks.password_hashing --rounds 10 11 12 13 --duration 5
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+from time import perf_counter
+
+from app.services import security
+
+PASSWORD = "benchmark-password"
+
+
+def verify_for(duration: float, hashed_password: str) -> int:
+    logins = 0
+    finish_at = perf_counter() + duration
+
+    while perf_counter() < finish_at:
+        security.verify_password(PASSWORD, hashed_password)
+        logins += 1
+
+    return logins
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per cost level")
+    parser.add_argument("--workers", type=int, default=cpu_count() or 1)
+    args = parser.parse_args()
+
+    print("{0:>6} {1:>12} {2:>14} {3:>16}".format("rounds", "latency, ms", "logins/s/core", "logins/s total"))
+
+    for rounds in args.rounds:
+        security.configure_password_hashing(rounds)
+        hashed_password = security.get_password_hash(PASSWORD)
+
+        started_at = perf_counter()
+        logins_per_core = verify_for(args.duration, hashed_password) / (perf_counter() - started_at)
+
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            started_at = perf_counter()
+            logins = sum(executor.map(verify_for, [args.duration] * args.workers, [hashed_password] * args.workers))
+            logins_total = logins / (perf_counter() - started_at)
+
+        print("{0:>6} {1:>12.1f} {2:>14.1f} {3:>16.1f}".format(
+            rounds,
+            1000 / logins_per_core,
+            logins_per_core,
+            logins_total,
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Verification SMS throughput against emulated HiLink modems.
+
+Verification codes are offered to the modem pool at a fixed rate and every
+modem is an in-process emulator, so no USB modem is needed:
+
+    python -m benchmarks.sms_throughput --modems 1 2 4 --rate 1 2 5 --duration 10
+"""
+
+import argparse
+import asyncio
+import random
+from statistics import quantiles
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from httpx import ASGITransport
+
+from app.core.circuit_breaker import CircuitOpenError
+from app.services.sms import HiLinkClient, HiLinkPool
+from benchmarks.hilink_emulator import HiLinkEmulator
+
+
+def make_pool(args: argparse.Namespace, modems: int) -> HiLinkPool:
+    clients = []
+    for index in range(modems):
+        emulator = HiLinkEmulator(
+            latency=args.latency,
+            failure_rate=args.failure_rate,
+            send_duration=args.send_duration,
+        )
+        clients.append(HiLinkClient(
+            "http://modem{0}.local".format(index),
+            name="benchmark.modems.{0}".format(index),
+            transport=ASGITransport(app=emulator.app),
+        ))
+
+    return HiLinkPool(clients, args.send_interval)
+
+
+async def send_code(pool: HiLinkPool) -> Tuple[Optional[bool], float]:
+    started_at = perf_counter()
+    try:
+        sent = await pool.send_verify_code_to_phone("+7999{0:07d}".format(random.randrange(10 ** 7)), 1234)
+    except CircuitOpenError:
+        sent = None
+
+    return sent, perf_counter() - started_at
+
+
+async def run(args: argparse.Namespace, modems: int, rate: float) -> None:
+    pool = make_pool(args, modems)
+    tasks: List["asyncio.Task[Tuple[Optional[bool], float]]"] = []
+
+    started_at = perf_counter()
+    for index in range(int(rate * args.duration)):
+        await asyncio.sleep(max(started_at + index / rate - perf_counter(), 0))
+        tasks.append(asyncio.create_task(send_code(pool)))
+
+    results = await asyncio.gather(*tasks)
+    elapsed = perf_counter() - started_at
+    await pool.close()
+
+    latencies = sorted(latency for sent, latency in results if sent)
+    sent = len(latencies)
+    failed = sum(1 for result, _ in results if result is False)
+    rejected = sum(1 for result, _ in results if result is None)
+    p50, p95 = quantiles(latencies, n=20)[9::8] if len(latencies) > 1 else (0.0, 0.0)
+
+    print("{0:>6} {1:>8.1f} {2:>10.2f} {3:>6} {4:>6} {5:>8} {6:>9.0f} {7:>9.0f}".format(
+        modems,
+        rate,
+        sent / elapsed,
+        sent,
+        failed,
+        rejected,
+        p50 * 1000,
+        p95 * 1000,
+    ))
+
+
+async def main(args: argparse.Namespace) -> None:
+    print("{0:>6} {1:>8} {2:>10} {3:>6} {4:>6} {5:>8} {6:>9} {7:>9}".format(
+        "modems", "target/s", "achieved/s", "sent", "failed", "rejected", "p50, ms", "p95, ms",
+    ))
+
+    for modems in args.modems:
+        for rate in args.rate:
+            await run(args, modems, rate)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modems", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--rate", type=float, nargs="+", default=[1.0, 2.0, 5.0], help="codes offered per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of traffic per run")
+    parser.add_argument("--send-interval", type=float, default=1.0, help="seconds between sends on one modem")
+    parser.add_argument("--send-duration", type=float, default=0.5, help="seconds a modem spends on one SMS")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every modem request")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of modem requests that fail")
+
+    asyncio.run(main(parser.parse_args()))
@@ -24,7 +24,10 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import sessionmaker
 
+from app.api.dependencies.database import _get_db_session, _get_db_replica_session
 from app.core.settings.app import AppSettings
+from app.database.instrumentation import instrument_engine
+from app.database.query_counter import count_queries
 from app.database.repositories import UsersRepository
 from app.database.repositories.events import EventsRepository
 from app.database.repositories.locations import LocationsRepository
@@ -40,6 +43,13 @@ from app.models.domain.vehicle import Vehicle
 from app.services import jwt
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "query_budget(count): fail if any single request to the app runs more than count SQL statements",
+    )
+
+
 @pytest.fixture
 def settings() -> AppSettings:
     from app.core.config import get_app_settings
@@ -57,6 +67,7 @@ def app() -> FastAPI:
 @pytest.fixture
 async def engine(settings: AppSettings) -> AsyncEngine:
     engine = create_async_engine(settings.get_database_url)
+    instrument_engine(engine)
 
     return engine
 
@@ -80,21 +91,43 @@ async def session(engine: AsyncEngine) -> AsyncSession:
 
 @pytest.fixture
 async def initialized_app(app: FastAPI, session: AsyncSession) -> FastAPI:
-    app.state.session = session
+    app.dependency_overrides[_get_db_session] = lambda: session
+    app.dependency_overrides[_get_db_replica_session] = lambda: None
 
     return app
 
 
 @pytest.fixture
-async def client(app: FastAPI) -> AsyncClient:
+async def client(app: FastAPI, request: pytest.FixtureRequest) -> AsyncClient:
     async with AsyncClient(
             app=app,
             base_url="http://localhost:10000",
             headers={"Content-Type": "application/json"},
     ) as client:
+        query_budget = request.node.get_closest_marker("query_budget")
+        if query_budget is not None:
+            client.send = _limit_queries(client.send, *query_budget.args)
+
         yield client
 
 
+def _limit_queries(send, max_queries: int):  # type: ignore
+    async def send_with_query_budget(*args, **kwargs):  # type: ignore
+        with count_queries() as stats:
+            response = await send(*args, **kwargs)
+
+        assert stats.count <= max_queries, "{0} {1} ran {2} queries, budget is {3}".format(
+            response.request.method,
+            response.request.url.path,
+            stats.count,
+            max_queries,
+        )
+
+        return response
+
+    return send_with_query_budget
+
+
 @pytest.fixture
 async def test_user(session: AsyncSession) -> User:
     users_repo = UsersRepository(session)
@@ -158,8 +191,8 @@ async def test_location(session: AsyncSession) -> Location:
 async def test_post(test_user: User, session: AsyncSession) -> Post:
     posts_repo = PostsRepository(session)
 
-    return await posts_repo.create_post_by_user_id(
-        test_user.id,
+    return await posts_repo.create_post_by_user(
+        test_user,
         title="Test post",
         description="Slug for tests",
         thumbnail="",
@@ -171,8 +204,8 @@ async def test_post(test_user: User, session: AsyncSession) -> Post:
 async def test_event(session: AsyncSession, test_user: User, test_location: Location) -> Event:
     events_repo = EventsRepository(session)
 
-    return await events_repo.create_event_by_user_id(
-        test_user.id,
+    return await events_repo.create_event_by_user(
+        test_user,
         title="Test event",
         description="Test event",
         thumbnail="",
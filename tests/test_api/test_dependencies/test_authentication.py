@@ -0,0 +1,44 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from app.api.dependencies.authentication import get_current_user_authorizer
+from app.core.cache import TTLCache
+from app.models.domain.user import UserInDB
+
+
+class FakeUsersRepository:
+
+    def __init__(self, user: UserInDB) -> None:
+        self.user = user
+        self.reads = 0
+
+    async def get_user_by_id(self, user_id: int) -> UserInDB:
+        self.reads += 1
+        return self.user
+
+
+@pytest.mark.asyncio
+async def test_database_verified_user_skips_users_cache() -> None:
+    users_cache: TTLCache[int, UserInDB] = TTLCache("test.users_cache_verified", max_size=10, ttl=60)
+    users_cache.set(1, UserInDB(id=1, username="stale", phone="+375257654321"))
+    users_repo = FakeUsersRepository(UserInDB(id=1, username="blocked", phone="+375257654321", is_blocked=True))
+
+    get_current_user = get_current_user_authorizer(verify_in_database=True)
+    user = await get_current_user(1, users_repo)
+
+    assert user.is_blocked
+    assert users_repo.reads == 1
+    assert users_cache.get(1).username == "stale"
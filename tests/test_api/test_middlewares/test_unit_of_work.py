@@ -0,0 +1,101 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi.responses import JSONResponse
+from httpx import AsyncClient
+
+from app.api.dependencies.database import _get_db_session, without_unit_of_work
+from app.database.repositories.base import BaseRepository
+
+
+class FakeSession:
+
+    def __init__(self) -> None:
+        self.info: Dict[str, Any] = {}
+        self.calls: List[str] = []
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.calls.append("close")
+
+    async def flush(self) -> None:
+        self.calls.append("flush")
+
+    async def commit(self) -> None:
+        self.calls.append("commit")
+
+    async def rollback(self) -> None:
+        self.calls.append("rollback")
+
+
+@pytest.fixture
+def sessions(app: FastAPI) -> List[FakeSession]:
+    sessions: List[FakeSession] = []
+
+    def session_maker() -> FakeSession:
+        session = FakeSession()
+        sessions.append(session)
+        return session
+
+    app.state.session_maker = session_maker
+
+    @app.post("/unit_of_work/{status_code}")
+    async def write(status_code: int, session: FakeSession = Depends(_get_db_session)) -> JSONResponse:
+        await BaseRepository(session)._commit()  # type: ignore
+        if status_code == status.HTTP_400_BAD_REQUEST:
+            raise HTTPException(status_code=status_code, detail="rejected")
+
+        return JSONResponse({}, status_code=status_code)
+
+    @app.post("/without_unit_of_work", dependencies=[Depends(without_unit_of_work)])
+    async def write_without_unit_of_work(session: FakeSession = Depends(_get_db_session)) -> None:
+        await BaseRepository(session)._commit()  # type: ignore
+
+    return sessions
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_once_on_success(app: FastAPI, sessions: List[FakeSession]) -> None:
+    async with AsyncClient(base_url="http://localhost:10000", app=app) as client:
+        response = await client.post("/unit_of_work/200")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert sessions[0].calls == ["flush", "commit", "close"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [status.HTTP_400_BAD_REQUEST, status.HTTP_503_SERVICE_UNAVAILABLE])
+async def test_unit_of_work_rolls_back_on_error(app: FastAPI, sessions: List[FakeSession], status_code: int) -> None:
+    async with AsyncClient(base_url="http://localhost:10000", app=app) as client:
+        response = await client.post(f"/unit_of_work/{status_code}")
+
+    # Closing a session also rolls back whatever it has flushed.
+    assert response.status_code == status_code
+    assert "commit" not in sessions[0].calls
+    assert {"rollback", "close"} <= set(sessions[0].calls)
+
+
+@pytest.mark.asyncio
+async def test_without_unit_of_work_commits_every_write(app: FastAPI, sessions: List[FakeSession]) -> None:
+    async with AsyncClient(base_url="http://localhost:10000", app=app) as client:
+        response = await client.post("/without_unit_of_work")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert sessions[0].calls == ["commit", "close"]
@@ -17,6 +17,7 @@ import pytest
 from fastapi import FastAPI, status
 from httpx import AsyncClient
 
+from app.core.settings.app import AppSettings
 from app.services.jwt import create_access_token_for_user
 
 
@@ -46,3 +47,48 @@ async def test_unable_to_login_when_user_does_not_exist_any_more(
         headers={"Authorization": f"{authorization_prefix} {token}"},
     )
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_verification_status_is_looked_up_by_request_id(
+        initialized_app: FastAPI, client: AsyncClient
+) -> None:
+    response = await client.post(
+        initialized_app.url_path_for("auth:verification"),
+        json={"verification": {"phone": "+375257654321"}},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    request_id = response.json()["request_id"]
+
+    response = await client.get(
+        initialized_app.url_path_for("auth:verification-status"),
+        params={"request_id": request_id},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["phone"] == "+375257654321"
+    assert response.json()["state"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_verification_status_is_not_found_for_unknown_request_id(
+        initialized_app: FastAPI, client: AsyncClient
+) -> None:
+    response = await client.get(
+        initialized_app.url_path_for("auth:verification-status"),
+        params={"request_id": "unknown"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_verification_codes_are_limited_per_phone(
+        initialized_app: FastAPI, client: AsyncClient, settings: AppSettings
+) -> None:
+    verification_json = {"verification": {"phone": "+375257654321"}}
+
+    for _ in range(settings.verification_codes_per_phone):
+        response = await client.post(initialized_app.url_path_for("auth:verification"), json=verification_json)
+        assert response.status_code == status.HTTP_200_OK
+
+    response = await client.post(initialized_app.url_path_for("auth:verification"), json=verification_json)
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
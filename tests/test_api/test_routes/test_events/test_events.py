@@ -163,8 +163,8 @@ async def test_user_can_not_modify_event_that_is_not_authored_by_him(
     )
 
     events_repo = EventsRepository(session)
-    event = await events_repo.create_event_by_user_id(
-        user.id,
+    event = await events_repo.create_event_by_user(
+        user,
         title="Test Slug",
         description="Slug for tests",
         thumbnail="",
@@ -220,8 +220,8 @@ async def test_user_receiving_feed_with_limit_and_offset(
         )
 
         for j in range(5):
-            await events_repo.create_event_by_user_id(
-                user.id,
+            await events_repo.create_event_by_user(
+                user,
                 title=f"Post {i}{j}",
                 description="tmp",
                 thumbnail="",
@@ -255,8 +255,8 @@ async def test_filtering_with_limit_and_offset(
     events_repo = EventsRepository(session)
 
     for i in range(5, 10):
-        await events_repo.create_event_by_user_id(
-            test_user.id,
+        await events_repo.create_event_by_user(
+            test_user,
             title=f"Event {i}",
             description="tmp",
             thumbnail="",
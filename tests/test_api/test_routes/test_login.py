@@ -16,8 +16,12 @@ import pytest
 
 from fastapi import FastAPI, status
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.settings.app import AppSettings
+from app.database.repositories import UsersRepository
 from app.models.domain.user import User
+from app.services.security import configure_password_hashing
 
 
 @pytest.mark.asyncio
@@ -49,3 +53,29 @@ async def test_user_login_when_credential_part_does_not_match(
     response = await client.post(initialized_app.url_path_for("auth:login"), json=login_json)
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_password_with_configured_cost(
+        initialized_app: FastAPI,
+        client: AsyncClient,
+        session: AsyncSession,
+        settings: AppSettings,
+) -> None:
+    users_repo = UsersRepository(session)
+
+    configure_password_hashing(4)
+    try:
+        user = await users_repo.create_user(username="rehashed", phone="+375257654322", password="password")
+        assert user.password.startswith("$2b$04$")
+
+        configure_password_hashing(5)
+        login_json = {"user": {"username": "rehashed", "password": "password"}}
+        response = await client.post(initialized_app.url_path_for("auth:login"), json=login_json)
+    finally:
+        configure_password_hashing(settings.password_hash_rounds)
+
+    assert response.status_code == status.HTTP_200_OK
+
+    user = await users_repo.get_user_by_username("rehashed")
+    assert user.password.startswith("$2b$05$")
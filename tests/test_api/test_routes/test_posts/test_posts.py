@@ -144,8 +144,8 @@ async def test_user_can_not_modify_post_that_is_not_authored_by_him(
     )
 
     posts_repo = PostsRepository(session)
-    post = await posts_repo.create_post_by_user_id(
-        user.id,
+    post = await posts_repo.create_post_by_user(
+        user,
         title="Test Slug",
         description="Slug for tests",
         thumbnail="",
@@ -195,8 +195,8 @@ async def test_user_receiving_feed_with_limit_and_offset(
         )
 
         for j in range(5):
-            await posts_repo.create_post_by_user_id(
-                user.id,
+            await posts_repo.create_post_by_user(
+                user,
                 title=f"Post {i}{j}",
                 description="tmp",
                 thumbnail="",
@@ -224,8 +224,8 @@ async def test_filtering_with_limit_and_offset(
     posts_repo = PostsRepository(session)
 
     for i in range(5, 10):
-        await posts_repo.create_post_by_user_id(
-            test_user.id,
+        await posts_repo.create_post_by_user(
+            test_user,
             title=f"Post {i}",
             description="tmp",
             thumbnail="",
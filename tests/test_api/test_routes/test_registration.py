@@ -18,6 +18,7 @@ from fastapi import FastAPI, status
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.settings.app import AppSettings
 from app.database.repositories.users import UsersRepository
 from app.database.repositories.verification_codes import VerificationRepository
 from app.models.domain.user import User
@@ -25,14 +26,16 @@ from app.models.domain.user import User
 
 @pytest.mark.asyncio
 async def test_user_success_registration(
-        initialized_app: FastAPI, client: AsyncClient, session: AsyncSession
+        initialized_app: FastAPI, client: AsyncClient, session: AsyncSession, settings: AppSettings
 ) -> None:
     phone = "+375257654321"
     username = "username"
     password = "password"
 
     verification_repo = VerificationRepository(session)
-    verification_code = await verification_repo.create_verification_code_by_phone(phone)
+    verification_code = await verification_repo.create_verification_code_by_phone(
+        phone, settings.verification_code_ttl, settings.verification_codes_per_phone
+    )
 
     registration_json = {
         "phone": phone,
@@ -66,13 +69,16 @@ async def test_failed_user_registration_when_some_credentials_are_taken(
         client: AsyncClient,
         test_user: User,
         session: AsyncSession,
+        settings: AppSettings,
         credentials_part: str,
         credentials_value: str,
 ) -> None:
     phone = "+375257654321"
 
     verification_repo = VerificationRepository(session)
-    verification_code = await verification_repo.create_verification_code_by_phone(phone)
+    verification_code = await verification_repo.create_verification_code_by_phone(
+        phone, settings.verification_code_ttl, settings.verification_codes_per_phone
+    )
 
     registration_json = {
         "user": {
@@ -89,3 +95,34 @@ async def test_failed_user_registration_when_some_credentials_are_taken(
     )
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_verification_code_stops_working_after_too_many_wrong_attempts(
+        initialized_app: FastAPI, client: AsyncClient, session: AsyncSession, settings: AppSettings
+) -> None:
+    phone = "+375257654321"
+
+    verification_repo = VerificationRepository(session)
+    verification_code = await verification_repo.create_verification_code_by_phone(
+        phone, settings.verification_code_ttl, settings.verification_codes_per_phone
+    )
+
+    registration_json = {
+        "phone": phone,
+        "username": "username",
+        "password": "password",
+        "verification_code": 100000 if verification_code != 100000 else 100001
+    }
+    for _ in range(settings.verification_code_max_attempts):
+        response = await client.post(
+            initialized_app.url_path_for("auth:register"), json={"user": registration_json}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    registration_json["verification_code"] = verification_code
+    response = await client.post(
+        initialized_app.url_path_for("auth:register"), json={"user": registration_json}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -19,12 +19,16 @@ from fastapi import (
     status,
 )
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.repositories.fuels import FuelsRepository
+from app.models.domain.fuel import FuelType
 from app.models.domain.location import Location
 from app.models.domain.vehicle import Vehicle
 
 
 @pytest.mark.asyncio
+@pytest.mark.query_budget(6)
 async def test_user_can_create_fuel_for_own_vehicle(
         initialized_app: FastAPI,
         authorized_client: AsyncClient,
@@ -51,3 +55,138 @@ async def test_user_can_create_fuel_for_own_vehicle(
     )
 
     assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_user_can_import_fuels_from_json(
+        initialized_app: FastAPI,
+        authorized_client: AsyncClient,
+        test_vehicle: Vehicle,
+) -> None:
+    fuel_data = {
+        "location": {"description": "Gas station", "latitude": 55.75, "longitude": 37.61},
+        "quantity": 25,
+        "price": 1.23,
+        "mileage": test_vehicle.mileage + 500,
+        "fuel_type": "petrol_95",
+        "is_full": True,
+        "created_at": "2022-06-01T12:00:00+00:00",
+    }
+
+    response = await authorized_client.post(
+        initialized_app.url_path_for("fuels:import-fuels", vehicle_id=str(test_vehicle.id)),
+        json=[fuel_data, {**fuel_data, "quantity": "a lot"}],
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["imported"] == 1
+    assert response.json()["invalid"] == 1
+
+
+@pytest.mark.asyncio
+async def test_user_can_import_fuels_from_csv(
+        initialized_app: FastAPI,
+        authorized_client: AsyncClient,
+        test_vehicle: Vehicle,
+) -> None:
+    body = (
+        "quantity,price,mileage,fuel_type,is_full,location_description,location_latitude,location_longitude\n"
+        "25,1.23,{0},petrol_95,true,\"Gas station, exit 4\",55.75,37.61\n"
+    ).format(test_vehicle.mileage + 500)
+
+    response = await authorized_client.post(
+        initialized_app.url_path_for("fuels:import-fuels", vehicle_id=str(test_vehicle.id)),
+        content=body,
+        headers={"Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["imported"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content_type, body, status_code",
+    [
+        ("text/csv", "quantity\n" + "1" * 200000 + "\n", status.HTTP_400_BAD_REQUEST),
+        ("application/json", "[{", status.HTTP_400_BAD_REQUEST),
+        ("application/xml", "<fuels/>", status.HTTP_415_UNSUPPORTED_MEDIA_TYPE),
+    ],
+)
+async def test_malformed_fuel_imports_are_rejected(
+        initialized_app: FastAPI,
+        authorized_client: AsyncClient,
+        test_vehicle: Vehicle,
+        content_type: str,
+        body: str,
+        status_code: int,
+) -> None:
+    response = await authorized_client.post(
+        initialized_app.url_path_for("fuels:import-fuels", vehicle_id=str(test_vehicle.id)),
+        content=body,
+        headers={"Content-Type": content_type},
+    )
+
+    assert response.status_code == status_code
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "export_format, media_type",
+    [("ndjson", "application/x-ndjson"), ("csv", "text/csv")],
+)
+async def test_user_can_export_fuels(
+        initialized_app: FastAPI,
+        authorized_client: AsyncClient,
+        session: AsyncSession,
+        test_vehicle: Vehicle,
+        test_location: Location,
+        export_format: str,
+        media_type: str,
+) -> None:
+    fuel = await FuelsRepository(session).create_fuel_by_vehicle_id(
+        test_vehicle.id,
+        quantity=25,
+        price=1.23,
+        mileage=test_vehicle.mileage + 500,
+        fuel_type=FuelType.PETROL_95,
+        location=test_location,
+        is_full=True,
+    )
+
+    response = await authorized_client.get(
+        initialized_app.url_path_for("fuels:export-fuels", vehicle_id=str(test_vehicle.id)),
+        params={"format": export_format},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith(media_type)
+
+    lines = response.text.splitlines()
+    if export_format == "csv":
+        assert lines[0].startswith("id,quantity,price,mileage,fuel_type")
+        assert lines[1].startswith("{0},25.0,1.23,{1},petrol_95,True".format(fuel.id, fuel.mileage))
+    else:
+        assert len(lines) == 1
+        assert response.json()["id"] == fuel.id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("api_method, route_name", (
+        ("PUT", "fuels:update-fuel"),
+        ("DELETE", "fuels:delete-fuel"),
+))
+async def test_missing_fuel_changes_return_not_found(
+        initialized_app: FastAPI,
+        authorized_client: AsyncClient,
+        test_vehicle: Vehicle,
+        api_method: str,
+        route_name: str,
+) -> None:
+    response = await authorized_client.request(
+        api_method,
+        initialized_app.url_path_for(route_name, vehicle_id=str(test_vehicle.id), fuel_id="100500"),
+        json={"fuel": {"price": 1.5}},
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
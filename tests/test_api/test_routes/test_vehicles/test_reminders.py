@@ -26,6 +26,7 @@ from app.models.domain.vehicle import Vehicle
 
 
 @pytest.mark.asyncio
+@pytest.mark.query_budget(4)
 async def test_user_can_create_reminder_for_own_vehicle(
         initialized_app: FastAPI,
         authorized_client: AsyncClient,
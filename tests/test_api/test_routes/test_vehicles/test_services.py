@@ -26,6 +26,7 @@ from app.models.domain.vehicle import Vehicle
 
 
 @pytest.mark.asyncio
+@pytest.mark.query_budget(6)
 async def test_user_can_create_service_for_own_vehicle(
         initialized_app: FastAPI,
         authorized_client: AsyncClient,
@@ -51,3 +52,28 @@ async def test_user_can_create_service_for_own_vehicle(
     )
 
     assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_service_import_reports_unknown_service_types(
+        initialized_app: FastAPI,
+        authorized_client: AsyncClient,
+        test_vehicle: Vehicle,
+        test_service_type: ServiceType,
+) -> None:
+    service_data = {
+        "location": {"description": "Garage", "latitude": 55.75, "longitude": 37.61},
+        "service_type_id": test_service_type.id,
+        "mileage": test_vehicle.mileage + 500,
+        "price": 1.23,
+        "created_at": "2022-06-01T12:00:00+00:00",
+    }
+
+    response = await authorized_client.post(
+        initialized_app.url_path_for("services:import-services", vehicle_id=str(test_vehicle.id)),
+        json=[service_data, {**service_data, "service_type_id": test_service_type.id + 1000}],
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["imported"] == 1
+    assert response.json()["invalid"] == 1
@@ -22,6 +22,7 @@ from app.models.schemas.vehicle import VehicleInResponse
 
 
 @pytest.mark.asyncio
+@pytest.mark.query_budget(4)
 async def test_user_can_add_vehicle(
         initialized_app: FastAPI, authorized_client: AsyncClient
 ) -> None:
@@ -106,6 +107,7 @@ async def test_user_can_not_add_vehicle_with_duplicated_params(
 
 
 @pytest.mark.asyncio
+@pytest.mark.query_budget(4)
 @pytest.mark.parametrize(
     "update_field, update_value",
     (
@@ -0,0 +1,47 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from app.core.cache import TTLCache
+from app.core.metrics import metrics
+
+
+def test_cache_returns_stored_value() -> None:
+    cache = TTLCache("cache.test_hit", max_size=2, ttl=60)
+    cache.set(1, "first")
+
+    assert cache.get(1) == "first"
+    assert cache.get(2) is None
+    assert metrics.get_hit_rate("cache.test_hit") == 0.5
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache("cache.test_lru", max_size=2, ttl=60)
+    cache.set(1, "first")
+    cache.set(2, "second")
+    cache.get(1)
+    cache.set(3, "third")
+
+    assert cache.get(2) is None
+    assert cache.get(1) == "first"
+    assert cache.get(3) == "third"
+
+
+def test_cache_expires_and_invalidates_values() -> None:
+    cache = TTLCache("cache.test_ttl", max_size=2, ttl=60)
+    cache.set(1, "expired", ttl=0)
+    cache.set(2, "invalidated")
+    cache.invalidate(2)
+
+    assert cache.get(1) is None
+    assert cache.get(2) is None
@@ -0,0 +1,57 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from app.core.metrics import metrics
+
+
+def test_circuit_opens_after_failure_threshold() -> None:
+    circuit_breaker = CircuitBreaker("test.circuit_threshold", failure_threshold=2, reset_timeout=60)
+
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+    circuit_breaker.record_failure()
+    assert circuit_breaker.is_open
+
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.check()
+    assert metrics.get("test.circuit_threshold.rejected") == 1
+
+
+def test_half_open_circuit_lets_one_trial_through() -> None:
+    circuit_breaker = CircuitBreaker("test.circuit_half_open", failure_threshold=1, reset_timeout=0)
+    circuit_breaker.record_failure()
+
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+    assert circuit_breaker.allow_request()
+
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+def test_failed_trial_opens_circuit_again() -> None:
+    circuit_breaker = CircuitBreaker("test.circuit_trial", failure_threshold=5, reset_timeout=60)
+    for _ in range(5):
+        circuit_breaker.record_failure()
+
+    circuit_breaker.reset_timeout = 0
+    assert circuit_breaker.allow_request()
+
+    circuit_breaker.reset_timeout = 60
+    circuit_breaker.record_failure()
+    assert circuit_breaker.is_open
+    assert metrics.get("test.circuit_trial.opened") == 2
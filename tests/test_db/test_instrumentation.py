@@ -0,0 +1,37 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import metrics
+from app.database.instrumentation import PREPARED_STATEMENT_CACHE_METRIC
+
+
+@pytest.mark.asyncio
+async def test_repeated_parameterized_query_hits_prepared_statement_cache(engine: AsyncEngine) -> None:
+    query = text("SELECT CAST(:value AS INTEGER)")
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+        hits = metrics.get(f"{PREPARED_STATEMENT_CACHE_METRIC}.hits")
+        misses = metrics.get(f"{PREPARED_STATEMENT_CACHE_METRIC}.misses")
+
+        await connection.execute(query, {"value": 1})
+        await connection.execute(query, {"value": 2})
+
+    assert metrics.get(f"{PREPARED_STATEMENT_CACHE_METRIC}.hits") - hits == 1
+    assert metrics.get(f"{PREPARED_STATEMENT_CACHE_METRIC}.misses") - misses == 1
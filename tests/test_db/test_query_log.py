@@ -0,0 +1,133 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from greenlet import greenlet
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.logging import QueryLogMode, is_query_log
+from app.database import query_log
+from app.database.query_log import QUERY_STARTED_AT, QueryLogger
+
+REPOSITORY_SOURCE = '''
+class FakeRepository:
+
+    def get_something(self, callback):
+        return self._get_rows(callback)
+
+    def _get_rows(self, callback):
+        return callback()
+'''
+
+
+@pytest.fixture
+def query_logs() -> Iterator[List[Dict[str, Any]]]:
+    records: List[Dict[str, Any]] = []
+    handler_id = logger.add(lambda message: records.append(message.record), filter=is_query_log)
+
+    yield records
+
+    logger.remove(handler_id)
+
+
+@pytest.fixture
+def repository_module() -> Dict[str, Any]:
+    namespace: Dict[str, Any] = {"__name__": "app.database.repositories.fake"}
+    exec(compile(REPOSITORY_SOURCE, "fake_repository.py", "exec"), namespace)  # noqa: S102
+
+    return namespace
+
+
+def log_query(query_logger: QueryLogger, duration: float, rowcount: int = 1) -> None:
+    context = SimpleNamespace(**{QUERY_STARTED_AT: perf_counter() - duration})
+    cursor = SimpleNamespace(rowcount=rowcount)
+
+    query_logger._log_query(None, cursor, "SELECT  1\n  FROM users", None, context, False)  # type: ignore
+
+
+def test_off_mode_does_not_attach_to_engine() -> None:
+    engine = create_async_engine("postgresql+asyncpg://postgres@localhost/postgres")
+    off_logger = QueryLogger(QueryLogMode.OFF, 1.0, 0.0)
+    slow_logger = QueryLogger(QueryLogMode.SLOW, 1.0, 0.0)
+
+    off_logger.attach(engine)
+    slow_logger.attach(engine)
+
+    assert not event.contains(engine.sync_engine, "after_cursor_execute", off_logger._log_query)
+    assert event.contains(engine.sync_engine, "after_cursor_execute", slow_logger._log_query)
+    assert event.contains(engine.sync_engine, "before_cursor_execute", slow_logger._start_timer)
+
+
+def test_slow_mode_logs_only_queries_over_threshold(query_logs: List[Dict[str, Any]]) -> None:
+    query_logger = QueryLogger(QueryLogMode.SLOW, 1.0, 0.5)
+
+    log_query(query_logger, 0.1)
+    log_query(query_logger, 0.6, rowcount=3)
+
+    assert len(query_logs) == 1
+    assert query_logs[0]["extra"]["rows"] == 3
+    assert query_logs[0]["extra"]["duration_ms"] >= 600
+    assert query_logs[0]["message"].endswith(": SELECT 1 FROM users")
+
+
+@pytest.mark.parametrize("sample, logged", [(0.2, True), (0.3, False)])
+def test_sampled_mode_logs_queries_below_sample_rate(
+        monkeypatch: pytest.MonkeyPatch,
+        query_logs: List[Dict[str, Any]],
+        sample: float,
+        logged: bool,
+) -> None:
+    monkeypatch.setattr(query_log, "random", lambda: sample)
+
+    log_query(QueryLogger(QueryLogMode.SAMPLED, 0.3, 10.0), 0.0)
+
+    assert bool(query_logs) is logged
+
+
+def test_unknown_row_count_is_logged_as_none(query_logs: List[Dict[str, Any]]) -> None:
+    log_query(QueryLogger(QueryLogMode.SLOW, 1.0, 0.0), 0.0, rowcount=-1)
+
+    assert query_logs[0]["extra"]["rows"] is None
+
+
+def test_query_outside_repository_has_no_repository_method(query_logs: List[Dict[str, Any]]) -> None:
+    log_query(QueryLogger(QueryLogMode.SLOW, 1.0, 0.0), 0.0)
+
+    assert query_logs[0]["extra"]["repository"] is None
+
+
+def test_repository_method_is_the_outermost_public_method(
+        repository_module: Dict[str, Any],
+        query_logs: List[Dict[str, Any]],
+) -> None:
+    repository = repository_module["FakeRepository"]()
+    query_logger = QueryLogger(QueryLogMode.SLOW, 1.0, 0.0)
+
+    repository.get_something(lambda: log_query(query_logger, 0.0))
+
+    assert query_logs[0]["extra"]["repository"] == "FakeRepository.get_something"
+
+
+def test_repository_method_is_found_across_greenlets(repository_module: Dict[str, Any]) -> None:
+    repository = repository_module["FakeRepository"]()
+
+    repository_method = repository.get_something(lambda: greenlet(query_log._find_repository_method).switch())
+
+    assert repository_method == "FakeRepository.get_something"
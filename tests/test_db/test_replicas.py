@@ -0,0 +1,103 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import AsyncIterator, Dict, Optional
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.database.replicas import ReplicaPool
+from app.database.repositories.base import BaseRepository
+from app.database.unit_of_work import begin_unit_of_work
+
+REPLICA_URL = "postgresql+asyncpg://user:pass@{0}/db"
+
+
+@pytest.fixture
+def replication_lag(monkeypatch: pytest.MonkeyPatch) -> Dict[str, Optional[float]]:
+    lags: Dict[str, Optional[float]] = {}
+
+    @asynccontextmanager
+    async def connect(engine: AsyncEngine) -> AsyncIterator[SimpleNamespace]:
+        lag = lags[engine.url.host]
+        if lag is None:
+            raise ConnectionRefusedError(engine.url.host)
+
+        async def execute(query: object) -> SimpleNamespace:
+            return SimpleNamespace(scalar=lambda: lag)
+
+        yield SimpleNamespace(execute=execute)
+
+    monkeypatch.setattr(AsyncEngine, "connect", connect)
+
+    return lags
+
+
+def make_pool(*hosts: str) -> ReplicaPool:
+    return ReplicaPool([REPLICA_URL.format(host) for host in hosts], max_lag=5.0)
+
+
+def get_session_host(pool: ReplicaPool) -> Optional[str]:
+    session = pool.create_session()
+
+    return None if session is None else session.bind.url.host
+
+
+@pytest.mark.asyncio
+async def test_lagging_and_unavailable_replicas_are_skipped(replication_lag: Dict[str, Optional[float]]) -> None:
+    replication_lag.update({"first": 0.0, "lagging": 30.0, "down": None, "second": 5.0})
+    pool = make_pool("first", "lagging", "down", "second")
+
+    await pool.check_lag()
+
+    assert [get_session_host(pool) for _ in range(4)] == ["first", "second", "first", "second"]
+    await pool.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_primary_when_every_replica_lags(
+        replication_lag: Dict[str, Optional[float]],
+) -> None:
+    replication_lag.update({"first": 30.0, "second": None})
+    pool = make_pool("first", "second")
+
+    await pool.check_lag()
+    assert get_session_host(pool) is None
+
+    replication_lag["first"] = 0.0
+    await pool.check_lag()
+    assert get_session_host(pool) == "first"
+    await pool.dispose()
+
+
+@pytest.mark.asyncio
+async def test_repository_reads_from_primary_after_a_write() -> None:
+    session = AsyncSession()
+    replica_session = AsyncSession()
+    begin_unit_of_work(session)
+    repo = BaseRepository(session, replica_session)
+
+    assert repo.session is replica_session
+
+    await repo._commit()
+
+    assert repo.session is session
+
+
+def test_repository_reads_from_primary_without_replica() -> None:
+    session = AsyncSession()
+
+    assert BaseRepository(session).session is session
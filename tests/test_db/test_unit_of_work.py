@@ -0,0 +1,46 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import List
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.unit_of_work import call_after_commit
+
+
+@pytest.mark.asyncio
+async def test_after_commit_callbacks_run_only_once_committed() -> None:
+    calls: List[str] = []
+    session = AsyncSession()
+
+    call_after_commit(session, lambda: calls.append("invalidate"))
+    assert calls == []
+
+    await session.commit()
+    await session.commit()
+    assert calls == ["invalidate"]
+
+
+@pytest.mark.asyncio
+async def test_after_commit_callbacks_are_dropped_on_rollback() -> None:
+    calls: List[str] = []
+    session = AsyncSession()
+    await session.begin()
+
+    call_after_commit(session, lambda: calls.append("invalidate"))
+    await session.rollback()
+    await session.commit()
+
+    assert calls == []
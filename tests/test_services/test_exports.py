@@ -0,0 +1,69 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+from datetime import datetime, timezone
+from typing import AsyncIterator, List
+
+import pytest
+
+from app.models.domain.fuel import Fuel, FuelType
+from app.models.domain.location import Location
+from app.models.schemas.exports import ExportFormat
+from app.services.exports import FUEL_EXPORT_FIELDS, export_rows
+
+
+async def stream_fuels(count: int) -> AsyncIterator[Fuel]:
+    for index in range(1, count + 1):
+        yield Fuel(
+            id=index,
+            fuel_type=FuelType.PETROL_95,
+            quantity=25.0,
+            price=1.23,
+            mileage=65500 + index,
+            is_full=True,
+            location=Location(id=index, description="Gas station, exit 4", latitude=55.75, longitude=37.61),
+            created_at=datetime(2022, 6, 1, 12, 0, tzinfo=timezone.utc),
+        )
+
+
+async def collect(export_format: ExportFormat, count: int) -> List[str]:
+    return [chunk async for chunk in export_rows(stream_fuels(count), export_format, FUEL_EXPORT_FIELDS)]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_writes_one_object_per_line() -> None:
+    chunks = await collect(ExportFormat.NDJSON, 3)
+    rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+
+    # The first row goes out alone so clients see data straight away.
+    assert chunks[0].count("\n") == 1
+    assert [row["id"] for row in rows] == [1, 2, 3]
+    assert rows[0]["fuel_type"] == "petrol_95"
+    assert rows[0]["location"]["description"] == "Gas station, exit 4"
+
+
+@pytest.mark.asyncio
+async def test_csv_export_flattens_nested_fields() -> None:
+    chunks = await collect(ExportFormat.CSV, 2)
+    lines = "".join(chunks).splitlines()
+
+    assert chunks[0] == ",".join(FUEL_EXPORT_FIELDS) + "\r\n"
+    assert lines[1] == '1,25.0,1.23,65501,petrol_95,True,"Gas station, exit 4",55.75,37.61,2022-06-01T12:00:00+00:00'
+    assert len(lines) == 3
+
+
+@pytest.mark.asyncio
+async def test_empty_csv_export_still_has_a_header() -> None:
+    assert await collect(ExportFormat.CSV, 0) == [",".join(FUEL_EXPORT_FIELDS) + "\r\n"]
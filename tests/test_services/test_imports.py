@@ -0,0 +1,135 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+
+from app.models.domain.vehicle import Vehicle
+from app.models.schemas.imports import ImportRowStatus
+from app.resources import strings
+from app.services.imports import (
+    IMPORT_JSON_MAX_BODY_SIZE,
+    import_fuels,
+    read_import_rows,
+)
+
+
+async def chunked(body: bytes, size: int = 7) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+async def collect(content_type: str, body: bytes) -> List[Dict[str, Any]]:
+    return [row async for row in read_import_rows(content_type, chunked(body))]
+
+
+class FakeFuelsRepository:
+
+    def __init__(self) -> None:
+        self.fuels: List[Dict[str, Any]] = []
+
+    async def create_fuels_by_vehicle_id(self, vehicle_id: int, fuels: List[Dict[str, Any]]) -> List[Optional[int]]:
+        created_ids: List[Optional[int]] = []
+        for fuel in fuels:
+            duplicate = any(fuel["created_at"] == stored["created_at"] for stored in self.fuels)
+            if not duplicate:
+                self.fuels.append(fuel)
+            created_ids.append(None if duplicate else len(self.fuels))
+
+        return created_ids
+
+
+@pytest.mark.asyncio
+async def test_csv_rows_are_nested_and_may_span_chunks() -> None:
+    body = (
+        "\ufeffquantity,price,location_description,location_latitude\n"
+        "25,1.23,\"Gas station,\nexit 4\",55.75\n"
+        "\n"
+        "30,1.5,Depot,55.8"
+    ).encode()
+
+    assert await collect("text/csv; charset=utf-8", body) == [
+        {"quantity": "25", "price": "1.23", "location": {"description": "Gas station,\nexit 4", "latitude": "55.75"}},
+        {"quantity": "30", "price": "1.5", "location": {"description": "Depot", "latitude": "55.8"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_json_rows_are_yielded_as_decoded() -> None:
+    assert await collect("application/json", b'[{"quantity": 25}, 42]') == [{"quantity": 25}, 42]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content_type, body",
+    [
+        ("application/json", b'[{"quantity": 25}'),
+        ("application/json", b'{"quantity": 25}'),
+        ("application/json", b"[" + b" " * IMPORT_JSON_MAX_BODY_SIZE + b"]"),
+        ("text/csv", b"quantity\n" + b"1" * 200000 + b"\n"),
+        ("text/csv", b"quantity\n\xff\n"),
+    ],
+)
+async def test_malformed_bodies_raise_value_error(content_type: str, body: bytes) -> None:
+    with pytest.raises(ValueError):
+        await collect(content_type, body)
+
+
+def test_unsupported_content_type_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        read_import_rows("application/xml", chunked(b""))
+
+
+@pytest.mark.asyncio
+async def test_import_reports_every_row() -> None:
+    vehicle = Vehicle(
+        id=1,
+        brand="honda",
+        model="xl1000v",
+        gen=3,
+        year=2008,
+        color="Silver",
+        mileage=65500,
+        vin="JVM01234567891011",
+        registration_plate="9112AB2",
+        name="Bullfinch",
+    )
+    fuel = {
+        "quantity": 25,
+        "price": 1.23,
+        "mileage": 65000,
+        "fuel_type": "petrol_95",
+        "is_full": True,
+        "location": {"description": "Gas station", "latitude": 55.75, "longitude": 37.61},
+        "created_at": "2022-06-01T12:00:00",
+    }
+
+    async def rows() -> AsyncIterator[Dict[str, Any]]:
+        yield fuel
+        yield {**fuel, "quantity": "a lot"}
+        yield fuel
+        yield 42
+
+    report = await import_fuels(FakeFuelsRepository(), None, vehicle, 1, rows())  # type: ignore
+
+    assert [row.status for row in report.rows] == [
+        ImportRowStatus.IMPORTED,
+        ImportRowStatus.INVALID,
+        ImportRowStatus.DUPLICATE,
+        ImportRowStatus.INVALID,
+    ]
+    assert report.rows[1].errors == ["quantity: value is not a valid float"]
+    assert report.rows[3].errors == [strings.IMPORT_ROW_NOT_OBJECT]
+    assert (report.imported, report.duplicates, report.invalid) == (1, 1, 2)
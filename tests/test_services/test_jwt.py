@@ -17,11 +17,14 @@ from datetime import timedelta
 import jwt
 import pytest
 
+from app.core.cache import TTLCache
+from app.core.metrics import metrics
 from app.models.domain.user import UserInDB
 from app.services.jwt import (
     ALGORITHM,
     create_access_token_for_user,
     create_jwt_token,
+    get_jwt_user_from_token,
     get_user_id_from_token,
     get_username_from_token,
     get_phone_from_token,
@@ -69,6 +72,40 @@ def test_retrieving_token_from_user(test_user: UserInDB) -> None:
     assert phone == test_user.phone
 
 
+def test_retrieving_flags_from_token() -> None:
+    token = create_access_token_for_user(
+        user_id=1,
+        username="username",
+        phone="+375257654321",
+        secret_key="secret",
+        is_admin=True,
+    )
+
+    jwt_user = get_jwt_user_from_token(token, "secret")
+    assert jwt_user.is_admin
+    assert not jwt_user.is_blocked
+
+
+def test_decoded_token_is_cached_until_expiration() -> None:
+    cache = TTLCache("cache.test_tokens", max_size=10, ttl=0)
+    token = create_jwt_token(
+        jwt_content={"user_id": 1, "username": "username", "phone": "+375257654321"},
+        secret_key="secret",
+        expires_delta=timedelta(minutes=1),
+    )
+
+    assert get_jwt_user_from_token(token, "secret", cache) == get_jwt_user_from_token(token, "secret", cache)
+    assert metrics.get("cache.test_tokens.hits") == 1
+
+    expired_token = create_jwt_token(
+        jwt_content={"user_id": 1, "username": "username", "phone": "+375257654321"},
+        secret_key="secret",
+        expires_delta=timedelta(minutes=-1),
+    )
+    with pytest.raises(ValueError):
+        get_jwt_user_from_token(expired_token, "secret", cache)
+
+
 def test_error_when_wrong_token() -> None:
     with pytest.raises(ValueError):
         get_username_from_token("asdf", "asdf")
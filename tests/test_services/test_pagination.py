@@ -0,0 +1,40 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.pagination import decode_cursor, encode_cursor, get_next_cursor
+
+
+def test_cursor_roundtrip() -> None:
+    created_at = datetime(2022, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    cursor = encode_cursor(created_at, 42)
+
+    assert decode_cursor(cursor, datetime, int) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(1), encode_cursor("yesterday", 1)])
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, datetime, int)
+
+
+def test_next_cursor_only_for_full_page() -> None:
+    items = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+
+    assert get_next_cursor(items, 3, "id") is None
+    assert decode_cursor(get_next_cursor(items, 2, "id"), int) == (2,)
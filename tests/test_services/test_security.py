@@ -0,0 +1,51 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from app.services.security import (
+    PasswordHashingPool,
+    configure_password_hashing,
+    get_password_hash,
+    password_needs_update,
+    verify_password,
+)
+
+
+@pytest.mark.asyncio
+async def test_password_hashing_pool_runs_hashing_in_threads() -> None:
+    pool = PasswordHashingPool()
+    pool.start(max_workers=2)
+
+    try:
+        hashed_password = await pool.run(get_password_hash, "password")
+
+        assert await pool.run(verify_password, "password", hashed_password)
+        assert not await pool.run(verify_password, "wrong password", hashed_password)
+    finally:
+        pool.stop()
+
+    assert not pool.is_running
+
+
+def test_hash_with_other_cost_needs_update() -> None:
+    configure_password_hashing(5)
+    try:
+        cheap_password = get_password_hash("password")
+        configure_password_hashing(6)
+
+        assert password_needs_update(cheap_password)
+        assert not password_needs_update(get_password_hash("password"))
+    finally:
+        configure_password_hashing(12)
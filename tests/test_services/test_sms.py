@@ -0,0 +1,142 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+from typing import List
+
+import pytest
+from httpx import ASGITransport
+
+from app.services.sms import HiLinkClient, HiLinkPool
+from benchmarks.hilink_emulator import HiLinkEmulator
+
+PHONE = "+79990001122"
+
+
+def make_client(emulator: HiLinkEmulator, name: str, **kwargs) -> HiLinkClient:  # type: ignore
+    return HiLinkClient(
+        "http://modem.local",
+        name=name,
+        transport=ASGITransport(app=emulator.app),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_client_sends_sms_through_modem_session() -> None:
+    emulator = HiLinkEmulator()
+    client = make_client(emulator, "test.sms_send")
+
+    assert await client.is_hilink()
+    assert await client.send_verify_code_to_phone(PHONE, 1234)
+    assert await client.send_sms_to_phone(PHONE, "second message")
+
+    assert emulator.sent_messages == [
+        {"phone": PHONE, "content": "1234 is your verification code."},
+        {"phone": PHONE, "content": "second message"},
+    ]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_refreshes_expired_session() -> None:
+    emulator = HiLinkEmulator()
+    client = make_client(emulator, "test.sms_session")
+
+    assert await client.send_sms_to_phone(PHONE, "before")
+    emulator.expire_session()
+
+    assert await client.send_sms_to_phone(PHONE, "after")
+    assert [message["content"] for message in emulator.sent_messages] == ["before", "after"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_one_session() -> None:
+    emulator = HiLinkEmulator(latency=0.01)
+    client = make_client(emulator, "test.sms_concurrent", max_connections=4)
+
+    results = await asyncio.gather(*(client.send_sms_to_phone(PHONE, str(index)) for index in range(4)))
+
+    assert all(results)
+    assert emulator.sessions_issued == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_reports_send_status() -> None:
+    emulator = HiLinkEmulator(send_duration=60)
+    client = make_client(emulator, "test.sms_status")
+
+    await client.send_sms_to_phone(PHONE, "message")
+    assert (await client.get_send_status()).in_progress
+
+    emulator.send_duration = 0
+    emulator.delivery_failure_rate = 1.0
+    await client.send_sms_to_phone(PHONE, "message")
+    status = await client.get_send_status()
+
+    assert not status.in_progress
+    assert status.failed_phones == [PHONE]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_reads_and_deletes_inbox() -> None:
+    emulator = HiLinkEmulator()
+    emulator.receive_sms(PHONE, "first")
+    emulator.receive_sms(PHONE, "second")
+    client = make_client(emulator, "test.sms_inbox")
+
+    assert await client.get_unread() == 2
+
+    contents, messages = await client.get_sms()
+    assert len(contents) == 2
+    assert await client.del_message(int(messages[0]["Index"]))
+
+    _, messages = await client.get_sms()
+    assert [message["Content"] for message in messages] == ["second"]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_modem_failures_open_circuit() -> None:
+    emulator = HiLinkEmulator(failure_rate=1.0)
+    client = make_client(emulator, "test.sms_circuit", failure_threshold=2)
+
+    assert not await client.send_sms_to_phone(PHONE, "message")
+    assert client.is_available
+
+    assert not await client.send_sms_to_phone(PHONE, "message")
+    assert not client.is_available
+
+    requests = emulator.requests
+    assert not await client.send_sms_to_phone(PHONE, "message")
+    assert emulator.requests == requests
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_spreads_messages_across_modems() -> None:
+    emulators: List[HiLinkEmulator] = [HiLinkEmulator() for _ in range(3)]
+    pool = HiLinkPool(
+        [make_client(emulator, f"test.sms_pool.{index}") for index, emulator in enumerate(emulators)],
+        send_interval=0.01,
+    )
+
+    for _ in range(6):
+        assert await pool.send_sms_to_phone(PHONE, "message")
+
+    assert [len(emulator.sent_messages) for emulator in emulators] == [2, 2, 2]
+    await pool.close()
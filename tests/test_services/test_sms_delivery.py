@@ -0,0 +1,58 @@
+#  Copyright 2022 Pavel Suprunov
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Optional
+
+from app.models.domain.sms_outbox import SmsOutboxMessage, SmsOutboxState
+from app.services.sms import HiLinkClient, HiLinkPool
+from app.services.sms_delivery import SmsDeliveryTracker
+
+GATEWAY = "http://modem.local"
+
+
+def make_message(message_id: int, gateway: Optional[str]) -> SmsOutboxMessage:
+    now = datetime.now(timezone.utc)
+
+    return SmsOutboxMessage(
+        id=message_id,
+        phone="+79990001122",
+        message="message",
+        state=SmsOutboxState.SENT,
+        attempts=1,
+        next_attempt_at=now,
+        last_error=None,
+        gateway=gateway,
+        sent_at=now,
+    )
+
+
+def test_tracker_skips_messages_without_known_gateway() -> None:
+    pool = HiLinkPool([HiLinkClient(GATEWAY, name="test.sms_delivery")], send_interval=0.0)
+    tracker = SmsDeliveryTracker(
+        SimpleNamespace(sms_client=pool),
+        poll_interval=1.0,
+        max_poll_interval=8.0,
+        window=60.0,
+    )
+
+    due_gateways = tracker._get_due_gateways([
+        make_message(1, None),
+        make_message(2, "http://removed.local"),
+        make_message(3, GATEWAY),
+    ])
+
+    assert list(due_gateways) == [GATEWAY]
+    assert [message.id for message in due_gateways[GATEWAY]] == [3]